@@ -36,7 +36,7 @@ class AgentCoordinator:
 
         Args:
             event_bus: Event bus for agent communication
-            vector_db: Vector database client
+            vector_db: AsyncVectorDatabase client
             llm_client: LLM client for text generation
         """
         self.event_bus = event_bus
@@ -29,7 +29,7 @@ class ResearchAgent(BaseAgent):
 
         Args:
             event_bus: Event bus for publishing updates
-            vector_db: Vector database client for semantic search
+            vector_db: AsyncVectorDatabase client for semantic search
             llm_client: LLM client for query understanding and explanations
         """
         super().__init__("research", event_bus)
@@ -140,14 +140,23 @@ class ResearchAgent(BaseAgent):
         Returns:
             List of matching documents with scores
         """
-        # TODO: Implement vector DB search
-        # - Convert query to embedding
-        # - Query vector DB with similarity search
-        # - Apply filters (date, source, etc.)
-        # - Return top K results with scores
+        if not self.vector_db:
+            return []
+
+        # Only pass filters the vector DB understands
+        db_filters = {
+            key: filters[key]
+            for key in ("year_min", "year_max", "source")
+            if key in filters
+        }
 
-        # Placeholder
-        return []
+        # Runs on the vector DB executor, not the event loop
+        return await self.vector_db.search(
+            query=" ".join(parsed_query["keywords"]),
+            n_results=filters.get("max_results", 10),
+            filters=db_filters or None,
+            search_type=search_type,
+        )
 
     async def _rank_and_explain(
         self,
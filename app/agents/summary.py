@@ -29,7 +29,7 @@ class SummaryAgent(BaseAgent):
         Args:
             event_bus: Event bus for publishing updates
             llm_client: LLM client for text generation
-            vector_db: Vector database for retrieving document content
+            vector_db: AsyncVectorDatabase for retrieving document content
         """
         super().__init__("summary", event_bus)
         self.llm_client = llm_client
@@ -122,8 +122,8 @@ class SummaryAgent(BaseAgent):
             }
         
         try:
-            # Get document metadata and content (synchronous call)
-            document = self.vector_db.get_paper(document_id)
+            # Get document metadata and content (runs off the event loop)
+            document = await self.vector_db.get_paper(document_id)
             
             if not document:
                 return {
@@ -292,8 +292,8 @@ class SummaryAgent(BaseAgent):
                 search_terms = self._extract_search_terms(query)
                 if search_terms:
                     self.logger.info("searching_for_documents", query=search_terms)
-                    # Use the vector DB search method (synchronous)
-                    search_results = self.vector_db.search(
+                    # Use the async vector DB search method
+                    search_results = await self.vector_db.search(
                         query=search_terms,
                         n_results=3
                     )
@@ -12,7 +12,7 @@ import structlog
 import uuid
 
 from app.agents.coordinator import AgentCoordinator
-from app.services.vector_db import VectorDatabase, get_vector_db
+from app.services.async_vector_db import AsyncVectorDatabase, get_async_vector_db
 from app.services.llm_client import LLMClient, get_llm_client
 
 logger = structlog.get_logger(__name__)
@@ -48,7 +48,7 @@ class ChatResponse(BaseModel):
 @router.post("/chat", response_model=ChatResponse)
 async def chat_with_agent(
     request: ChatRequest,
-    vector_db: VectorDatabase = Depends(get_vector_db),
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db),
     llm_client: LLMClient = Depends(get_llm_client)
 ):
     """
@@ -9,20 +9,32 @@ from fastapi import APIRouter, HTTPException, UploadFile, File, Query, Backgroun
 from pydantic import BaseModel, Field
 from datetime import datetime
 from pathlib import Path
+import asyncio
 import structlog
+import tarfile
 import uuid
-import shutil
+import zipfile
 
-from app.services.vector_db import VectorDatabase, get_vector_db
+from app.services.async_vector_db import AsyncVectorDatabase, get_async_vector_db
+from app.services.blob_store import BlobStore, get_blob_store
+from app.services.vector_db import COLLAPSE_OVERFETCH
+from app.services.catalog import decode_cursor, encode_cursor
+from app.services.extraction_pool import ExtractionError, ExtractionPool, get_extraction_pool
 from app.services.llm_client import LLMClient, get_llm_client
+from app.services.storage_ledger import StorageLedger, get_storage_ledger
+from app.services.task_registry import TaskRegistry, get_task_registry
 from app.config import settings
-from app.utils.pdf_processing import extract_text_from_pdf, extract_pdf_metadata, parse_research_paper_metadata
+from app.utils.pdf_processing import parse_research_paper_metadata
 from app.utils.event_bus import get_event_bus, EventType
+from app.utils.upload_writer import UploadRejected, check_upload_size, write_upload
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1/documents", tags=["documents"])
 
+# Archive types accepted by the bulk upload endpoint besides .zip
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
 
 # Pydantic Models
 class DocumentMetadata(BaseModel):
@@ -49,13 +61,19 @@ class DocumentList(BaseModel):
     limit: int
     offset: int
     has_next: bool
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
 
 
 class DocumentContent(BaseModel):
     """Full document content"""
     metadata: DocumentMetadata
     content: str
-    sections: Optional[List[dict]] = Field(None, description="Parsed sections if available")
+    sections: Optional[List[dict]] = Field(
+        None, description="Sections parsed at ingest: name, start/end (characters) and byte_start/byte_end"
+    )
+    total_bytes: Optional[int] = Field(None, description="Size of the full text in UTF-8 bytes")
+    page_count: Optional[int] = Field(None, description="Pages in the full text")
+    byte_range: Optional[List[int]] = Field(None, description="First and last byte of the full text returned (null if it is empty)")
 
 
 class DocumentUploadResponse(BaseModel):
@@ -64,14 +82,38 @@ class DocumentUploadResponse(BaseModel):
     status: str
     message: str
     processing_task_id: Optional[str] = None
+    size: Optional[int] = Field(None, description="Stored file size in bytes")
+    sha256: Optional[str] = Field(None, description="SHA-256 of the stored file")
+
+
+class BulkUploadFile(BaseModel):
+    """Outcome for one file of a bulk upload"""
+    filename: str
+    document_id: Optional[str] = None
+    status: str = Field(..., description="'queued', 'duplicate' or 'skipped'; the task reports 'indexed', 'near_duplicate' or 'failed'")
+    error: Optional[str] = None
+    sha256: Optional[str] = None
+
+
+class BulkUploadResponse(BaseModel):
+    """Response after a bulk upload"""
+    status: str
+    message: str
+    processing_task_id: Optional[str] = None
+    queued: int
+    skipped: int
+    files: List[BulkUploadFile]
 
 
 class SearchQuery(BaseModel):
     """Search query parameters"""
     query: str
     limit: int = Field(10, ge=1, le=100)
-    search_type: str = Field("semantic", description="'semantic' or 'keyword'")
+    search_type: str = Field("semantic", description="'semantic', 'keyword' or 'hybrid'")
     filters: Optional[dict] = Field(None, description="Metadata filters (year, author, etc.)")
+    fusion: Optional[str] = Field(None, description="Hybrid only: 'rrf' or 'weighted' (default from config)")
+    depth: Optional[int] = Field(None, ge=1, le=20, description="Hybrid only: per-retriever over-fetch factor")
+    collapse_duplicates: bool = Field(False, description="Return one result per near-duplicate cluster")
 
 
 class SearchResult(BaseModel):
@@ -79,6 +121,7 @@ class SearchResult(BaseModel):
     document: DocumentMetadata
     score: float
     highlights: Optional[List[str]] = None
+    duplicates: Optional[List[str]] = Field(None, description="Near-duplicates collapsed into this result")
 
 
 class SearchResults(BaseModel):
@@ -88,6 +131,24 @@ class SearchResults(BaseModel):
     search_type: str
     total: int
     execution_time_ms: float
+    timings: Optional[dict] = Field(None, description="Per-stage timings in milliseconds")
+
+
+class BatchSearchQuery(BaseModel):
+    """Several search queries sharing filters"""
+    queries: List[str] = Field(..., min_length=1, max_length=100)
+    limit: int = Field(10, ge=1, le=100, description="Results per query")
+    search_type: str = Field("semantic", description="'semantic', 'keyword' or 'hybrid'")
+    filters: Optional[dict] = Field(None, description="Metadata filters applied to every query")
+    dedup: bool = Field(False, description="Return each document only for the query it matches best")
+
+
+class BatchSearchResults(BaseModel):
+    """Per-query results for a batch search"""
+    results: List[SearchResults]
+    search_type: str
+    total: int
+    execution_time_ms: float
 
 
 class DocumentSummary(BaseModel):
@@ -104,19 +165,30 @@ class DocumentSummary(BaseModel):
 async def list_documents(
     limit: int = Query(20, ge=1, le=100, description="Number of documents per page"),
     offset: int = Query(0, ge=0, description="Number of documents to skip"),
+    cursor: Optional[str] = Query(None, description="Resume after this cursor (from next_cursor); overrides offset"),
     source: Optional[str] = Query(None, description="Filter by source"),
     year: Optional[int] = Query(None, description="Filter by year"),
     indexed_only: bool = Query(False, description="Only show indexed documents"),
-    vector_db: VectorDatabase = Depends(get_vector_db)
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db)
 ):
     """
     List all documents with pagination and filtering.
     
     Returns metadata for documents in the system with optional filters.
+    Documents are ordered by creation time. Prefer cursor paging
+    (pass next_cursor back as cursor) for deep pages or full walks: each
+    page is an index range scan and is stable while documents are added.
     """
-    logger.info("list_documents", limit=limit, offset=offset, source=source, year=year)
+    logger.info("list_documents", limit=limit, offset=offset, cursor=cursor, source=source, year=year)
     
     try:
+        after = None
+        if cursor:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        
         # Build filters
         filters = {}
         if source:
@@ -124,11 +196,12 @@ async def list_documents(
         if year:
             filters["year"] = year
         
-        # Get papers from vector DB
-        papers, total = vector_db.get_all_papers(
+        # Page through the metadata catalog (no embeddings or text loaded)
+        papers, total = await vector_db.list_papers(
             limit=limit,
             offset=offset,
-            filters=filters if filters else None
+            filters=filters if filters else None,
+            after=after
         )
         
         # Convert to API response format
@@ -167,13 +240,26 @@ async def list_documents(
             )
             documents.append(doc)
         
+        if after is not None:
+            has_next = len(papers) == limit
+        else:
+            has_next = (offset + limit) < total
+        
+        next_cursor = None
+        if has_next and papers:
+            last = papers[-1]
+            next_cursor = encode_cursor(str(last["metadata"].get("created_at", "")), last["id"])
+        
         return DocumentList(
             documents=documents,
             total=total,
             limit=limit,
             offset=offset,
-            has_next=(offset + limit) < total
+            has_next=has_next,
+            next_cursor=next_cursor
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("list_documents_error", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to list documents: {str(e)}")
@@ -182,7 +268,7 @@ async def list_documents(
 @router.get("/{document_id}", response_model=DocumentMetadata)
 async def get_document(
     document_id: str,
-    vector_db: VectorDatabase = Depends(get_vector_db)
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db)
 ):
     """
     Get document metadata by ID.
@@ -192,7 +278,7 @@ async def get_document(
     logger.info("get_document", document_id=document_id)
     
     try:
-        paper = vector_db.get_paper(document_id)
+        paper = await vector_db.get_paper(document_id, fields=["metadata"])
         
         if not paper:
             raise HTTPException(status_code=404, detail=f"Document {document_id} not found")
@@ -238,22 +324,65 @@ async def get_document(
 @router.get("/{document_id}/content", response_model=DocumentContent)
 async def get_document_content(
     document_id: str,
-    vector_db: VectorDatabase = Depends(get_vector_db),
+    pages: Optional[str] = Query(None, description="Page or page range, e.g. '3' or '2-5'"),
+    byte_range: Optional[str] = Query(
+        None, alias="bytes", description="Byte range of the UTF-8 text, e.g. '0-4095' or '4096-'"
+    ),
+    section: Optional[str] = Query(None, description="Section name, e.g. 'abstract' or 'methods'"),
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db),
     llm_client: LLMClient = Depends(get_llm_client)
 ):
     """
     Get full document content including text.
     
-    Returns complete document with metadata and full text content.
+    Returns complete document with metadata, full text content and the
+    section outline parsed at ingest, read from the compressed text store.
+    One of a section, a page range or a byte range may be requested to
+    return only that slice; byte ranges that split a multi-byte character
+    drop the partial character. Documents indexed before the text store
+    existed fall back to the indexed text and do not support slices.
     """
-    logger.info("get_document_content", document_id=document_id)
+    logger.info(
+        "get_document_content",
+        document_id=document_id,
+        section=section,
+        pages=pages,
+        bytes=byte_range,
+    )
     
     try:
-        paper = vector_db.get_paper(document_id)
+        if len([value for value in (section, pages, byte_range) if value]) > 1:
+            raise HTTPException(
+                status_code=400, detail="Request only one of section, pages or bytes"
+            )
+        page_span = _parse_range(pages, "page") if pages else None
+        byte_span = _parse_range(byte_range, "byte") if byte_range else None
+        
+        paper = await vector_db.get_paper(document_id, fields=["metadata"])
         
         if not paper:
             raise HTTPException(status_code=404, detail=f"Document {document_id} not found")
         
+        try:
+            stored = await vector_db.get_text(
+                document_id, pages=page_span, byte_range=byte_span, section=section or None
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=416, detail=str(e))
+        except KeyError:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Section {section!r} not found in document {document_id}",
+            )
+        
+        if stored is None:
+            if section or page_span or byte_span:
+                raise HTTPException(
+                    status_code=416,
+                    detail=f"Full text of document {document_id} is not stored; sections and ranges are unavailable",
+                )
+            paper = await vector_db.get_paper(document_id) or paper
+        
         metadata = paper.get("metadata", {})
         
         # Parse timestamps
@@ -286,10 +415,19 @@ async def get_document_content(
             indexed=True
         )
         
+        if stored is None:
+            return DocumentContent(
+                metadata=doc_metadata,
+                content=paper.get("document", ""),
+                sections=None
+            )
         return DocumentContent(
             metadata=doc_metadata,
-            content=paper.get("document", ""),
-            sections=None  # TODO: Parse document structure
+            content=stored.text,
+            sections=stored.sections,
+            total_bytes=stored.total_bytes,
+            page_count=stored.page_count,
+            byte_range=[stored.start, stored.end - 1] if stored.end > stored.start else None,
         )
     except HTTPException:
         raise
@@ -306,13 +444,23 @@ async def upload_document(
     authors: Optional[str] = None,
     year: Optional[int] = None,
     source: str = "upload",
-    vector_db: VectorDatabase = Depends(get_vector_db)
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db),
+    storage_ledger: StorageLedger = Depends(get_storage_ledger),
+    blob_store: BlobStore = Depends(get_blob_store),
+    extraction_pool: ExtractionPool = Depends(get_extraction_pool),
+    task_registry: TaskRegistry = Depends(get_task_registry)
 ):
     """
     Upload a new document to the system.
     
-    Accepts PDF files and schedules background processing for text extraction
-    and embedding generation.
+    Accepts PDF files up to UPLOAD_MAX_BYTES. The file is checked for a PDF
+    header and streamed to disk (hashed on the way) off the event loop, and
+    the endpoint returns immediately with a processing_task_id. Files are
+    stored by content hash: uploading bytes that are already stored returns
+    the existing document with status 'duplicate' and no processing task,
+    and takes a reference on it that a later delete releases. Text extraction (in a sandboxed worker process),
+    embedding and indexing run in the background; poll
+    /api/v1/stats/processing/{task_id} or follow the event bus for progress.
     """
     logger.info("upload_document", filename=file.filename, content_type=file.content_type)
     
@@ -324,83 +472,62 @@ async def upload_document(
         # Generate unique document ID
         document_id = str(uuid.uuid4())
         
-        # Create storage directory
-        storage_path = Path(settings.document_storage_path)
-        storage_path.mkdir(parents=True, exist_ok=True)
-        
-        # Save file to disk
-        file_path = storage_path / f"{document_id}.pdf"
-        with open(file_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
-        
-        logger.info("pdf_saved", document_id=document_id, path=str(file_path))
+        # Validate and stream file to disk, then move it into the blob store
+        check_upload_size(file.size, settings.upload_max_bytes)
+        stored = await asyncio.to_thread(
+            write_upload, file.file, _incoming_path(document_id), settings.upload_max_bytes
+        )
+        blob = await asyncio.to_thread(blob_store.add, stored.path, stored.sha256, document_id)
         
-        # Extract text and metadata from PDF
-        try:
-            pdf_text = extract_text_from_pdf(file_path)
-            pdf_metadata = extract_pdf_metadata(file_path)
-            parsed_metadata = parse_research_paper_metadata(pdf_text, pdf_metadata)
-            
-            # Use provided metadata or fall back to extracted
-            final_title = title or parsed_metadata.get("title") or file.filename
-            final_authors = authors.split(",") if authors else parsed_metadata.get("authors", [])
-            final_year = year or parsed_metadata.get("year")
-            
-            # Prepare paper data for vector DB
-            now = datetime.now().isoformat()
-            paper_data = {
-                "id": document_id,
-                "title": final_title,
-                "abstract": parsed_metadata.get("abstract", ""),
-                "full_text": pdf_text,
-                "authors": final_authors,
-                "year": final_year,
-                "source": source,
-                "file_path": str(file_path),
-                "created_at": now,
-                "updated_at": now,
-            }
-            
-            # Add to vector database
-            vector_db.add_papers([paper_data])
-            
-            logger.info("document_indexed", document_id=document_id, title=final_title)
-            
-            # Publish event
-            try:
-                event_bus = get_event_bus()
-                if event_bus.is_connected():
-                    await event_bus.publish(
-                        event_type=EventType.DOCUMENT_INDEXED,
-                        task_id=document_id,
-                        data={
-                            "document_id": document_id,
-                            "title": final_title,
-                            "authors": final_authors,
-                            "year": final_year,
-                            "source": source,
-                        }
-                    )
-            except Exception as e:
-                logger.warning("event_publish_failed", error=str(e))
-            
+        if not blob.created:
+            logger.info("upload_duplicate", document_id=blob.document_id, sha256=stored.sha256)
             return DocumentUploadResponse(
-                id=document_id,
-                status="completed",
-                message="Document uploaded and indexed successfully",
-                processing_task_id=None
-            )
-            
-        except Exception as e:
-            logger.error("pdf_processing_error", document_id=document_id, error=str(e))
-            # Clean up file if processing failed
-            if file_path.exists():
-                file_path.unlink()
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to process PDF: {str(e)}"
+                id=blob.document_id,
+                status="duplicate",
+                message="Identical document already uploaded",
+                size=stored.size,
+                sha256=stored.sha256
             )
+        
+        file_path = blob.path
+        storage_ledger.record(document_id, file_path)
+        
+        logger.info("pdf_saved", document_id=document_id, path=str(file_path), sha256=stored.sha256)
+        
+        task_id = task_registry.create(
+            "upload",
+            {"document_id": document_id, "filename": file.filename, "sha256": stored.sha256},
+        )
+        background_tasks.add_task(
+            _process_upload,
+            task_id=task_id,
+            document_id=document_id,
+            file_path=file_path,
+            sha256=stored.sha256,
+            filename=file.filename,
+            title=title,
+            authors=authors,
+            year=year,
+            source=source,
+            vector_db=vector_db,
+            storage_ledger=storage_ledger,
+            blob_store=blob_store,
+            extraction_pool=extraction_pool,
+            task_registry=task_registry,
+        )
+        
+        return DocumentUploadResponse(
+            id=document_id,
+            status="processing",
+            message="Document uploaded; processing in background",
+            processing_task_id=task_id,
+            size=stored.size,
+            sha256=stored.sha256
+        )
             
+    except UploadRejected as e:
+        logger.warning("upload_rejected", filename=file.filename, code=e.code, error=e.message)
+        raise HTTPException(status_code=e.status_code, detail=e.to_dict())
     except HTTPException:
         raise
     except Exception as e:
@@ -408,36 +535,137 @@ async def upload_document(
         raise HTTPException(status_code=500, detail=f"Failed to upload document: {str(e)}")
 
 
+@router.post("/bulk", response_model=BulkUploadResponse)
+async def bulk_upload_documents(
+    background_tasks: BackgroundTasks,
+    files: List[UploadFile] = File(..., description="PDFs and/or ZIP/TAR archives of PDFs"),
+    source: str = "upload",
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db),
+    storage_ledger: StorageLedger = Depends(get_storage_ledger),
+    blob_store: BlobStore = Depends(get_blob_store),
+    extraction_pool: ExtractionPool = Depends(get_extraction_pool),
+    task_registry: TaskRegistry = Depends(get_task_registry)
+):
+    """
+    Upload many documents in one request.
+    
+    Accepts any mix of PDF files and ZIP/TAR archives of PDFs (up to
+    BULK_UPLOAD_MAX_FILES PDFs of at most UPLOAD_MAX_BYTES each; files
+    without a PDF header are skipped; PDFs already stored are reported as
+    'duplicate' with the existing document_id). Archives are unpacked
+    member by member straight to document storage. All PDFs are processed
+    by a single background task: extraction is spread across the
+    extraction workers and papers are indexed in batches. Per-file results
+    ('indexed', 'near_duplicate' or 'failed') are reported on
+    /api/v1/stats/processing/{task_id} when it completes.
+    """
+    logger.info("bulk_upload_documents", files=len(files))
+    
+    try:
+        results: list[dict] = []
+        for upload in files:
+            limit = settings.bulk_upload_max_files - sum(
+                result["status"] == "queued" for result in results
+            )
+            results.extend(
+                await asyncio.to_thread(
+                    _unpack_bulk_file, upload, storage_ledger, blob_store, limit
+                )
+            )
+        
+        queued = sum(result["status"] == "queued" for result in results)
+        if not queued:
+            if any(result["status"] == "duplicate" for result in results):
+                return BulkUploadResponse(
+                    status="duplicate",
+                    message="All documents were already uploaded",
+                    queued=0,
+                    skipped=len(results),
+                    files=[BulkUploadFile(**result) for result in results]
+                )
+            raise HTTPException(status_code=400, detail="No PDF files found in upload")
+        
+        task_id = task_registry.create("bulk_upload", {"queued": queued, "source": source})
+        background_tasks.add_task(
+            _process_bulk_upload,
+            task_id=task_id,
+            files=results,
+            source=source,
+            vector_db=vector_db,
+            storage_ledger=storage_ledger,
+            blob_store=blob_store,
+            extraction_pool=extraction_pool,
+            task_registry=task_registry,
+        )
+        
+        logger.info("bulk_upload_queued", task_id=task_id, queued=queued, skipped=len(results) - queued)
+        
+        return BulkUploadResponse(
+            status="processing",
+            message=f"{queued} documents uploaded; processing in background",
+            processing_task_id=task_id,
+            queued=queued,
+            skipped=len(results) - queued,
+            files=[BulkUploadFile(**result) for result in results]
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("bulk_upload_documents_error", error=str(e))
+        raise HTTPException(status_code=500, detail=f"Failed to upload documents: {str(e)}")
+
+
 @router.delete("/{document_id}")
 async def delete_document(
     document_id: str,
-    vector_db: VectorDatabase = Depends(get_vector_db)
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db),
+    storage_ledger: StorageLedger = Depends(get_storage_ledger),
+    blob_store: BlobStore = Depends(get_blob_store)
 ):
     """
     Delete a document from the system.
     
-    Removes document metadata, files, and embeddings.
+    Removes document metadata, files, and embeddings, including the
+    document's PDF in the blob store. A document uploaded more than once
+    is shared: each delete releases one upload's reference, and the
+    document is removed with the last one.
     """
     logger.info("delete_document", document_id=document_id)
     
     try:
         # Get paper info to find file path
-        paper = vector_db.get_paper(document_id)
+        paper = await vector_db.get_paper(document_id, fields=["metadata"])
         
         if not paper:
             raise HTTPException(status_code=404, detail=f"Document {document_id} not found")
         
-        # Delete file from disk if it exists
+        # Other uploads of the same bytes still reference the document
+        references = blob_store.references(document_id)
+        if references > 1:
+            remaining = blob_store.release(document_id)
+            logger.info("document_reference_released", document_id=document_id, remaining=remaining)
+            return {
+                "status": "success",
+                "message": f"Document {document_id} is still referenced by {remaining} other upload(s); reference released"
+            }
+        
+        # Remove from vector DB first, so a failure leaves the file in place
+        await vector_db.delete_paper(document_id)
+        
+        # Release the stored PDF; files from before the blob store are
+        # deleted directly
         metadata = paper.get("metadata", {})
         file_path_str = metadata.get("file_path")
-        if file_path_str:
+        if references:
+            blob_store.release(document_id)
+            logger.info("document_blob_released", document_id=document_id)
+        elif file_path_str:
             file_path = Path(file_path_str)
             if file_path.exists():
                 file_path.unlink()
                 logger.info("document_file_deleted", path=str(file_path))
-        
-        # Remove from vector DB
-        vector_db.delete_paper(document_id)
+        storage_ledger.release(document_id)
         
         logger.info("document_deleted", document_id=document_id)
         
@@ -456,84 +684,70 @@ async def delete_document(
 @router.post("/search", response_model=SearchResults)
 async def search_documents(
     query: SearchQuery,
-    vector_db: VectorDatabase = Depends(get_vector_db)
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db)
 ):
     """
     Search documents using keyword or semantic search.
     
-    Supports two search types:
+    Supports three search types:
     - 'semantic': Vector similarity search using embeddings
     - 'keyword': Traditional text matching
+    - 'hybrid': Both retrievers run concurrently, merged by rank fusion
+    
+    With collapse_duplicates, near-duplicate papers (see
+    NEAR_DUPLICATE_POLICY=link) are folded into their best-ranked member.
     """
     logger.info("search_documents", query=query.query, search_type=query.search_type)
     
     import time
     start_time = time.time()
+    timings = None
     
     try:
-        if query.search_type == "semantic":
+        if query.search_type == "hybrid":
+            if query.fusion and query.fusion not in ("rrf", "weighted"):
+                raise HTTPException(status_code=422, detail=f"Unknown fusion method: {query.fusion}")
+            # Run semantic and keyword retrievers concurrently and fuse
+            raw_results, timings = await vector_db.hybrid_search(
+                query=query.query,
+                n_results=query.limit * (COLLAPSE_OVERFETCH if query.collapse_duplicates else 1),
+                filters=query.filters,
+                fusion=query.fusion,
+                depth=query.depth,
+                fields=["metadata"]
+            )
+            if query.collapse_duplicates:
+                raw_results = (await vector_db.collapse_duplicates(raw_results))[:query.limit]
+        elif query.search_type == "semantic":
             # Perform semantic search using vector DB
-            raw_results = vector_db.search(
+            raw_results = await vector_db.search(
                 query=query.query,
                 n_results=query.limit,
                 filters=query.filters,
-                search_type="semantic"
+                search_type="semantic",
+                fields=["metadata"],
+                collapse=query.collapse_duplicates
             )
         elif query.search_type == "keyword":
             # Perform keyword search using vector DB
-            raw_results = vector_db.search(
+            raw_results = await vector_db.search(
                 query=query.query,
                 n_results=query.limit,
                 filters=query.filters,
-                search_type="keyword"
+                search_type="keyword",
+                fields=["metadata"],
+                collapse=query.collapse_duplicates
             )
         else:
             logger.warning("unknown_search_type", search_type=query.search_type)
             raw_results = []
         
         # Convert to API response format
-        results = []
-        for result in raw_results:
-            metadata = result.get("metadata", {})
-            
-            # Parse timestamps
-            created_at = datetime.now()
-            updated_at = datetime.now()
-            if metadata.get("created_at"):
-                try:
-                    created_at = datetime.fromisoformat(metadata["created_at"])
-                except:
-                    pass
-            if metadata.get("updated_at"):
-                try:
-                    updated_at = datetime.fromisoformat(metadata["updated_at"])
-                except:
-                    pass
-            
-            document = DocumentMetadata(
-                id=result["id"],
-                title=metadata.get("title", "Untitled"),
-                authors=metadata.get("authors", "").split(", ") if metadata.get("authors") else None,
-                abstract=None,  # Not stored in metadata
-                year=metadata.get("year"),
-                journal=None,
-                doi=metadata.get("doi"),
-                url=None,
-                source=metadata.get("source", "unknown"),
-                created_at=created_at,
-                updated_at=updated_at,
-                file_path=metadata.get("file_path"),
-                indexed=True
-            )
-            
-            search_result = SearchResult(
-                document=document,
-                score=result["similarity"],
-                highlights=None  # TODO: Add text highlighting
-            )
-            results.append(search_result)
+        results = [_to_search_result(result) for result in raw_results]
         
         execution_time = (time.time() - start_time) * 1000
+        if timings is not None:
+            timings["total_ms"] = round(execution_time, 2)
         
         # Publish search event
         try:
@@ -558,18 +772,83 @@ async def search_documents(
             query=query.query,
             search_type=query.search_type,
             total=len(results),
-            execution_time_ms=execution_time
+            execution_time_ms=execution_time,
+            timings=timings
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("search_documents_error", query=query.query, error=str(e))
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
+@router.post("/search/batch", response_model=BatchSearchResults)
+async def search_documents_batch(
+    query: BatchSearchQuery,
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db)
+):
+    """
+    Run several searches in one request.
+    
+    Semantic queries are embedded together and sent to the vector store as
+    one multi-query request. Results are returned per query, in order.
+    With dedup enabled a document appears only under the query it matched
+    best.
+    """
+    logger.info(
+        "search_documents_batch",
+        query_count=len(query.queries),
+        search_type=query.search_type,
+        dedup=query.dedup
+    )
+    
+    import time
+    start_time = time.time()
+    
+    try:
+        if query.search_type not in ("semantic", "keyword", "hybrid"):
+            raise HTTPException(status_code=422, detail=f"Unknown search type: {query.search_type}")
+        
+        raw_batches = await vector_db.search_many(
+            queries=query.queries,
+            n_results=query.limit,
+            filters=query.filters,
+            search_type=query.search_type,
+            dedup=query.dedup,
+            fields=["metadata"]
+        )
+        
+        execution_time = (time.time() - start_time) * 1000
+        
+        results = []
+        for text, raw_results in zip(query.queries, raw_batches):
+            converted = [_to_search_result(result) for result in raw_results]
+            results.append(SearchResults(
+                results=converted,
+                query=text,
+                search_type=query.search_type,
+                total=len(converted),
+                execution_time_ms=execution_time
+            ))
+        
+        return BatchSearchResults(
+            results=results,
+            search_type=query.search_type,
+            total=sum(r.total for r in results),
+            execution_time_ms=execution_time
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("search_documents_batch_error", query_count=len(query.queries), error=str(e))
+        raise HTTPException(status_code=500, detail=f"Batch search failed: {str(e)}")
+
+
 @router.get("/{document_id}/summary", response_model=DocumentSummary)
 async def generate_document_summary(
     document_id: str,
     max_length: int = Query(500, ge=100, le=2000, description="Maximum summary length in words"),
-    vector_db: VectorDatabase = Depends(get_vector_db),
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db),
     llm_client: LLMClient = Depends(get_llm_client)
 ):
     """
@@ -581,7 +860,7 @@ async def generate_document_summary(
     
     try:
         # Get document content
-        paper = vector_db.get_paper(document_id)
+        paper = await vector_db.get_paper(document_id)
         
         if not paper:
             raise HTTPException(status_code=404, detail=f"Document {document_id} not found")
@@ -641,3 +920,370 @@ async def generate_document_summary(
     except Exception as e:
         logger.error("generate_summary_error", document_id=document_id, error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to generate summary: {str(e)}")
+
+
+# Helper functions
+
+def _to_search_result(result: dict) -> SearchResult:
+    """Convert a vector DB search hit into a SearchResult."""
+    metadata = result.get("metadata", {})
+    
+    # Parse timestamps
+    created_at = datetime.now()
+    updated_at = datetime.now()
+    if metadata.get("created_at"):
+        try:
+            created_at = datetime.fromisoformat(metadata["created_at"])
+        except:
+            pass
+    if metadata.get("updated_at"):
+        try:
+            updated_at = datetime.fromisoformat(metadata["updated_at"])
+        except:
+            pass
+    
+    document = DocumentMetadata(
+        id=result["id"],
+        title=metadata.get("title", "Untitled"),
+        authors=metadata.get("authors", "").split(", ") if metadata.get("authors") else None,
+        abstract=None,  # Not stored in metadata
+        year=metadata.get("year"),
+        journal=None,
+        doi=metadata.get("doi"),
+        url=None,
+        source=metadata.get("source", "unknown"),
+        created_at=created_at,
+        updated_at=updated_at,
+        file_path=metadata.get("file_path"),
+        indexed=True
+    )
+    
+    return SearchResult(
+        document=document,
+        score=result["similarity"],
+        highlights=None,  # TODO: Add text highlighting
+        duplicates=result.get("duplicates")
+    )
+
+
+async def _process_upload(
+    task_id: str,
+    document_id: str,
+    file_path: Path,
+    sha256: str,
+    filename: str,
+    title: Optional[str],
+    authors: Optional[str],
+    year: Optional[int],
+    source: str,
+    vector_db: AsyncVectorDatabase,
+    storage_ledger: StorageLedger,
+    blob_store: BlobStore,
+    extraction_pool: ExtractionPool,
+    task_registry: TaskRegistry,
+) -> None:
+    """Extract, embed and index an uploaded PDF, reporting progress on the task."""
+    await task_registry.start(task_id, "Extracting text")
+    try:
+        paper_data = await _extract_paper(
+            document_id, file_path, filename, source, extraction_pool,
+            title=title, authors=authors, year=year, sha256=sha256,
+        )
+        await task_registry.progress(task_id, 50.0, "Text extracted, indexing")
+        
+        # Add to vector database; waits out slow writes, so a failure here
+        # means nothing was indexed and the upload can be discarded
+        duplicates = await vector_db.ingest_papers([paper_data])
+        duplicate = duplicates[document_id]
+        
+    except Exception as e:
+        logger.error("pdf_processing_error", document_id=document_id, error=str(e))
+        _discard_upload(document_id, storage_ledger, blob_store)
+        await task_registry.fail(task_id, **_error_details(e))
+        return
+    
+    if duplicate and duplicate["policy"] != "link":
+        # Not indexed under its own ID, so its file is not needed either
+        logger.info("document_near_duplicate", document_id=document_id, **duplicate)
+        _discard_upload(document_id, storage_ledger, blob_store)
+        await task_registry.complete(
+            task_id,
+            f"Near-duplicate of {duplicate['canonical_id']}; not indexed separately",
+            duplicate_of=duplicate["canonical_id"],
+            similarity=duplicate["similarity"],
+        )
+        return
+    
+    logger.info("document_indexed", document_id=document_id, title=paper_data["title"])
+    await task_registry.complete(
+        task_id,
+        "Document uploaded and indexed successfully",
+        **({"duplicate_of": duplicate["canonical_id"]} if duplicate else {}),
+    )
+    await _publish_document_indexed(paper_data)
+
+
+async def _process_bulk_upload(
+    task_id: str,
+    files: list[dict],
+    source: str,
+    vector_db: AsyncVectorDatabase,
+    storage_ledger: StorageLedger,
+    blob_store: BlobStore,
+    extraction_pool: ExtractionPool,
+    task_registry: TaskRegistry,
+) -> None:
+    """
+    Extract and index a batch of stored PDFs, reporting per-file results on the task.
+    
+    All files are handed to the extraction pool at once, so its workers
+    stay busy; extracted papers are written to the vector database in
+    batches of BULK_INDEX_BATCH_SIZE.
+    """
+    queued = [result for result in files if result["status"] == "queued"]
+    total = len(queued)
+    await task_registry.start(task_id, f"Extracting {total} documents")
+    
+    batch: list[tuple[dict, dict]] = []
+    done = 0
+    
+    async def index_batch() -> None:
+        papers = [paper_data for _, paper_data in batch]
+        try:
+            # Not bound by the request timeout: a batch of full papers and
+            # their passages may take a while, and must not be discarded
+            # while it is still being written
+            duplicates = await vector_db.ingest_papers(papers)
+        except Exception as e:
+            logger.error("bulk_index_error", task_id=task_id, papers=len(papers), error=str(e))
+            for result, _ in batch:
+                _discard_upload(result["document_id"], storage_ledger, blob_store)
+                result.update(status="failed", **_error_details(e))
+        else:
+            for result, paper_data in batch:
+                duplicate = duplicates[result["document_id"]]
+                if duplicate:
+                    result["duplicate_of"] = duplicate["canonical_id"]
+                if duplicate and duplicate["policy"] != "link":
+                    _discard_upload(result["document_id"], storage_ledger, blob_store)
+                    result["status"] = "near_duplicate"
+                else:
+                    result["status"] = "indexed"
+                    await _publish_document_indexed(paper_data)
+        batch.clear()
+    
+    async def extract(result: dict) -> tuple[dict, dict | None]:
+        try:
+            paper_data = await _extract_paper(
+                result["document_id"], Path(result["file_path"]), result["filename"],
+                source, extraction_pool, sha256=result["sha256"],
+            )
+            return result, paper_data
+        except Exception as e:
+            logger.warning("bulk_extraction_error", filename=result["filename"], error=str(e))
+            _discard_upload(result["document_id"], storage_ledger, blob_store)
+            result.update(status="failed", **_error_details(e))
+            return result, None
+    
+    for future in asyncio.as_completed([extract(result) for result in queued]):
+        result, paper_data = await future
+        done += 1
+        if paper_data is not None:
+            batch.append((result, paper_data))
+            if len(batch) >= settings.bulk_index_batch_size:
+                await index_batch()
+        await task_registry.progress(
+            task_id, 99.0 * done / total, f"{done}/{total} documents extracted"
+        )
+    if batch:
+        await index_batch()
+    
+    for result in files:
+        result.pop("file_path", None)
+    indexed = sum(result["status"] == "indexed" for result in files)
+    failed = sum(result["status"] == "failed" for result in files)
+    logger.info("bulk_upload_processed", task_id=task_id, indexed=indexed, failed=failed)
+    await task_registry.complete(
+        task_id,
+        f"Indexed {indexed} of {total} documents",
+        indexed=indexed,
+        failed=failed,
+        files=files,
+    )
+
+
+async def _extract_paper(
+    document_id: str,
+    file_path: Path,
+    filename: str,
+    source: str,
+    extraction_pool: ExtractionPool,
+    title: Optional[str] = None,
+    authors: Optional[str] = None,
+    year: Optional[int] = None,
+    sha256: Optional[str] = None,
+) -> dict:
+    """Extract a stored PDF into paper data for the vector database."""
+    pdf_text, pdf_metadata = await extraction_pool.extract_async(
+        file_path,
+        max_pages=settings.pdf_max_pages or None,
+        max_chars=settings.pdf_max_chars or None,
+        sha256=sha256,
+    )
+    # Reads and rewrites the extraction cache entry; keep it off the event loop
+    parsed_metadata = await asyncio.to_thread(
+        parse_research_paper_metadata, pdf_text, pdf_metadata
+    )
+    
+    # Use provided metadata or fall back to extracted
+    now = datetime.now().isoformat()
+    return {
+        "id": document_id,
+        "title": title or parsed_metadata.get("title") or filename,
+        "abstract": parsed_metadata.get("abstract", ""),
+        "full_text": pdf_text,
+        "page_offsets": pdf_metadata.get("page_offsets"),
+        "authors": authors.split(",") if authors else parsed_metadata.get("authors", []),
+        "year": year or parsed_metadata.get("year"),
+        "source": source,
+        "file_path": str(file_path),
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def _parse_range(value: str, name: str) -> tuple[int, Optional[int]]:
+    """Parse 'N', 'N-M' or 'N-' into (first, last); last is None if open."""
+    first, separator, last = value.strip().partition("-")
+    try:
+        start = int(first)
+        end = (int(last) if last else None) if separator else start
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name} range: {value!r}")
+    return start, end
+
+
+def _incoming_path(document_id: str) -> Path:
+    """Where an upload is written before it is moved into the blob store."""
+    incoming = Path(settings.document_storage_path) / "incoming"
+    incoming.mkdir(parents=True, exist_ok=True)
+    return incoming / f"{document_id}.pdf"
+
+
+def _discard_upload(document_id: str, storage_ledger: StorageLedger, blob_store: BlobStore) -> None:
+    """
+    Release a stored upload whose processing failed or was skipped.
+    
+    Only the upload's own reference is dropped; the file stays while
+    duplicate uploads of the same bytes still reference it.
+    """
+    if not blob_store.release(document_id, reference=document_id):
+        storage_ledger.release(document_id)
+
+
+def _error_details(error: Exception) -> dict:
+    """Task error message, plus the structured code for extraction failures."""
+    if isinstance(error, ExtractionError):
+        return {"error": error.message, "error_code": error.code}
+    return {"error": f"Failed to process PDF: {str(error)}"}
+
+
+async def _publish_document_indexed(paper_data: dict) -> None:
+    """Announce a newly indexed document on the event bus."""
+    try:
+        event_bus = get_event_bus()
+        if event_bus.is_connected():
+            await event_bus.publish(
+                event_type=EventType.DOCUMENT_INDEXED,
+                task_id=paper_data["id"],
+                data={
+                    "document_id": paper_data["id"],
+                    "title": paper_data["title"],
+                    "authors": paper_data["authors"],
+                    "year": paper_data["year"],
+                    "source": paper_data["source"],
+                }
+            )
+    except Exception as e:
+        logger.warning("event_publish_failed", error=str(e))
+
+
+def _unpack_bulk_file(
+    upload: UploadFile,
+    storage_ledger: StorageLedger,
+    blob_store: BlobStore,
+    limit: int,
+) -> list[dict]:
+    """
+    Store the PDFs in one bulk upload part, which may be a PDF or an archive.
+    
+    Archives are read member by member (TAR archives as a stream), so only
+    one PDF is ever held in a buffer at a time. Blocking; run it off the
+    event loop.
+    
+    Args:
+        upload: Uploaded PDF, ZIP or TAR (optionally compressed) file
+        storage_ledger: Ledger recording each stored file
+        blob_store: Store the PDFs are moved into
+        limit: Maximum number of PDFs to store; the rest are skipped
+    
+    Returns:
+        Per-file results with filename, document_id, status ('queued',
+        'duplicate' or 'skipped'), error, sha256 and file_path
+    """
+    results: list[dict] = []
+    
+    def store(filename: str, stream) -> None:
+        if not filename.lower().endswith(".pdf"):
+            results.append({"filename": filename, "status": "skipped", "error": "Not a PDF file"})
+            return
+        if limit <= sum(result["status"] == "queued" for result in results):
+            results.append({"filename": filename, "status": "skipped", "error": "Batch limit reached"})
+            return
+        document_id = str(uuid.uuid4())
+        try:
+            stored = write_upload(stream, _incoming_path(document_id), settings.upload_max_bytes)
+        except UploadRejected as e:
+            results.append({"filename": filename, "status": "skipped", "error": e.message})
+            return
+        blob = blob_store.add(stored.path, stored.sha256, document_id)
+        if not blob.created:
+            results.append({
+                "filename": filename,
+                "document_id": blob.document_id,
+                "status": "duplicate",
+                "sha256": stored.sha256,
+            })
+            return
+        storage_ledger.record(document_id, blob.path)
+        results.append({
+            "filename": filename,
+            "document_id": document_id,
+            "status": "queued",
+            "sha256": stored.sha256,
+            "file_path": str(blob.path),
+        })
+    
+    name = upload.filename or ""
+    lower = name.lower()
+    if lower.endswith(".zip"):
+        try:
+            with zipfile.ZipFile(upload.file) as archive:
+                for member in archive.infolist():
+                    if not member.is_dir():
+                        with archive.open(member) as stream:
+                            store(f"{name}/{member.filename}", stream)
+        except zipfile.BadZipFile as e:
+            results.append({"filename": name, "status": "skipped", "error": f"Invalid ZIP archive: {e}"})
+    elif lower.endswith(TAR_SUFFIXES):
+        try:
+            with tarfile.open(fileobj=upload.file, mode="r|*") as archive:
+                for member in archive:
+                    if member.isfile():
+                        store(f"{name}/{member.name}", archive.extractfile(member))
+        except tarfile.TarError as e:
+            results.append({"filename": name, "status": "skipped", "error": f"Invalid TAR archive: {e}"})
+    else:
+        store(name, upload.file)
+    
+    return results
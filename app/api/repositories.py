@@ -10,7 +10,8 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 import structlog
 
-from app.services.vector_db import VectorDatabase, get_vector_db
+from app.services.async_vector_db import AsyncVectorDatabase, get_async_vector_db
+from app.services.catalog import decode_cursor, encode_cursor
 
 logger = structlog.get_logger(__name__)
 
@@ -71,6 +72,7 @@ class RepositoryDocuments(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
 
 
 # Endpoints
@@ -79,7 +81,7 @@ class RepositoryDocuments(BaseModel):
 async def list_repositories(
     status: Optional[str] = Query(None, description="Filter by status"),
     type: Optional[str] = Query(None, description="Filter by repository type"),
-    vector_db: VectorDatabase = Depends(get_vector_db)
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db)
 ):
     """
     List all configured repositories (MCP servers and local sources).
@@ -90,7 +92,7 @@ async def list_repositories(
     
     try:
         # Get vector DB stats for local repository
-        db_stats = vector_db.get_stats()
+        db_stats = await vector_db.get_stats()
         total_papers = db_stats.get("total_papers", 0)
         
         # Create local repository entry
@@ -122,6 +124,8 @@ async def list_repositories(
             repositories=repositories,
             total=len(repositories)
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("list_repositories_error", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to list repositories: {str(e)}")
@@ -130,7 +134,7 @@ async def list_repositories(
 @router.get("/{repository_id}/status", response_model=RepositoryStatus)
 async def get_repository_status(
     repository_id: str,
-    vector_db: VectorDatabase = Depends(get_vector_db)
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db)
 ):
     """
     Get detailed status for a specific repository.
@@ -142,7 +146,7 @@ async def get_repository_status(
     try:
         if repository_id == "local":
             # Get local repository status
-            db_stats = vector_db.get_stats()
+            db_stats = await vector_db.get_stats()
             total_papers = db_stats.get("total_papers", 0)
             
             repo_info = RepositoryInfo(
@@ -216,24 +220,34 @@ async def list_repository_documents(
     repository_id: str,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    vector_db: VectorDatabase = Depends(get_vector_db)
+    cursor: Optional[str] = Query(None, description="Resume after this cursor (from next_cursor); overrides offset"),
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db)
 ):
     """
     List documents from a specific repository.
     
-    Returns documents that originated from the specified repository.
+    Returns documents that originated from the specified repository, in
+    creation order. Pass next_cursor back as cursor to walk all pages.
     """
-    logger.info("list_repository_documents", repository_id=repository_id, limit=limit, offset=offset)
+    logger.info("list_repository_documents", repository_id=repository_id, limit=limit, offset=offset, cursor=cursor)
     
     try:
+        after = None
+        if cursor:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        
         # Query vector DB for documents from this repository
         # Use source filter to match repository_id
         filters = {"source": repository_id} if repository_id != "all" else None
         
-        papers, total = vector_db.get_all_papers(
+        papers, total = await vector_db.list_papers(
             limit=limit,
             offset=offset,
-            filters=filters
+            filters=filters,
+            after=after
         )
         
         # Convert to dict format
@@ -248,13 +262,26 @@ async def list_repository_documents(
                 "source": metadata.get("source", "unknown")
             })
         
+        if after is not None:
+            has_next = len(papers) == limit
+        else:
+            has_next = (offset + limit) < total
+        
+        next_cursor = None
+        if has_next and papers:
+            last = papers[-1]
+            next_cursor = encode_cursor(str(last["metadata"].get("created_at", "")), last["id"])
+        
         return RepositoryDocuments(
             repository_id=repository_id,
             documents=documents,
             total=total,
             limit=limit,
-            offset=offset
+            offset=offset,
+            next_cursor=next_cursor
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("list_repository_documents_error", repository_id=repository_id, error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to list repository documents: {str(e)}")
@@ -263,7 +290,7 @@ async def list_repository_documents(
 @router.post("/{repository_id}/test", response_model=dict)
 async def test_repository_connection(
     repository_id: str,
-    vector_db: VectorDatabase = Depends(get_vector_db)
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db)
 ):
     """
     Test connection to a repository.
@@ -276,7 +303,7 @@ async def test_repository_connection(
         if repository_id == "local":
             # Test local repository
             try:
-                db_stats = vector_db.get_stats()
+                db_stats = await vector_db.get_stats()
                 return {
                     "repository_id": repository_id,
                     "status": "connected",
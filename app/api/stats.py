@@ -10,10 +10,10 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 import structlog
 import time
-from pathlib import Path
 
-from app.services.vector_db import VectorDatabase, get_vector_db
-from app.config import settings
+from app.services.async_vector_db import AsyncVectorDatabase, get_async_vector_db
+from app.services.storage_ledger import StorageLedger, get_storage_ledger
+from app.services.task_registry import TaskRegistry, get_task_registry
 
 logger = structlog.get_logger(__name__)
 
@@ -88,6 +88,26 @@ class AgentStats(BaseModel):
     last_active: Optional[datetime] = None
 
 
+class EmbeddingStats(BaseModel):
+    """Query embedding batching metrics"""
+    total_requests: int
+    total_texts: int
+    total_batches: int
+    avg_batch_size: float
+    max_batch_size: int
+    requests_per_second: float
+    queue_depth: int
+    latency_ms: dict = Field(default_factory=dict, description="Latency percentiles (p50, p95, p99)")
+    config: dict = Field(default_factory=dict, description="Batching configuration")
+
+
+class CacheStats(BaseModel):
+    """Query embedding and search result cache statistics"""
+    query_embeddings: dict = Field(default_factory=dict, description="Embedding cache occupancy and hit rate")
+    search_results: dict = Field(default_factory=dict, description="Result cache occupancy and hit rate")
+    generation: int = Field(0, description="Write generation; bumped on every add, delete and reset")
+
+
 class AllStats(BaseModel):
     """Comprehensive system statistics"""
     system: SystemStats
@@ -100,7 +120,8 @@ class AllStats(BaseModel):
 
 @router.get("/stats", response_model=SystemStats)
 async def get_system_stats(
-    vector_db: VectorDatabase = Depends(get_vector_db)
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db),
+    storage_ledger: StorageLedger = Depends(get_storage_ledger)
 ):
     """
     Get high-level system statistics.
@@ -111,16 +132,11 @@ async def get_system_stats(
     
     try:
         # Get vector DB stats
-        db_stats = vector_db.get_stats()
+        db_stats = await vector_db.get_stats()
         total_documents = db_stats.get("total_papers", 0)
         
-        # Calculate storage usage
-        storage_used_mb = 0.0
-        storage_path = Path(settings.document_storage_path)
-        if storage_path.exists():
-            storage_used_mb = sum(
-                f.stat().st_size for f in storage_path.rglob("*") if f.is_file()
-            ) / (1024 * 1024)
+        # Storage usage is tracked in memory by the ledger
+        storage_used_mb = storage_ledger.get_stats()["bytes"] / (1024 * 1024)
         
         # Calculate server uptime
         uptime_seconds = time.time() - _server_start_time
@@ -134,6 +150,8 @@ async def get_system_stats(
             last_updated=datetime.now(),
             uptime_seconds=round(uptime_seconds, 2)
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("get_system_stats_error", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to get system stats: {str(e)}")
@@ -141,7 +159,8 @@ async def get_system_stats(
 
 @router.get("/stats/all", response_model=AllStats)
 async def get_all_stats(
-    vector_db: VectorDatabase = Depends(get_vector_db)
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db),
+    storage_ledger: StorageLedger = Depends(get_storage_ledger)
 ):
     """
     Get comprehensive statistics for all system components.
@@ -152,15 +171,11 @@ async def get_all_stats(
     
     try:
         # Get system stats
-        db_stats = vector_db.get_stats()
+        db_stats = await vector_db.get_stats()
         total_documents = db_stats.get("total_papers", 0)
         
-        storage_used_mb = 0.0
-        storage_path = Path(settings.document_storage_path)
-        if storage_path.exists():
-            storage_used_mb = sum(
-                f.stat().st_size for f in storage_path.rglob("*") if f.is_file()
-            ) / (1024 * 1024)
+        # Storage usage is tracked in memory by the ledger
+        storage_used_mb = storage_ledger.get_stats()["bytes"] / (1024 * 1024)
         
         uptime_seconds = time.time() - _server_start_time
         
@@ -174,44 +189,14 @@ async def get_all_stats(
             uptime_seconds=round(uptime_seconds, 2)
         )
         
-        # Get all papers and calculate document stats
-        papers, _ = vector_db.get_all_papers(limit=1000)
-        
-        doc_stats = DocumentStats()
-        by_year = {}
-        by_source = {}
-        author_counts = {}
-        
-        for paper in papers:
-            metadata = paper.get("metadata", {})
-            
-            # Count by year
-            year = metadata.get("year")
-            if year:
-                by_year[str(year)] = by_year.get(str(year), 0) + 1
-            
-            # Count by source
-            source = metadata.get("source", "unknown")
-            by_source[source] = by_source.get(source, 0) + 1
-            
-            # Count authors
-            authors = metadata.get("authors", "")
-            if authors:
-                for author in authors.split(", "):
-                    author = author.strip()
-                    if author:
-                        author_counts[author] = author_counts.get(author, 0) + 1
+        # Facet counts are maintained incrementally by the catalog
+        facets = await vector_db.get_facets(top_authors=10)
         
-        doc_stats.by_year = by_year
-        doc_stats.by_source = by_source
-        
-        # Get top 10 authors
-        top_authors = sorted(
-            [{"name": k, "count": v} for k, v in author_counts.items()],
-            key=lambda x: x["count"],
-            reverse=True
-        )[:10]
-        doc_stats.top_authors = top_authors
+        doc_stats = DocumentStats(
+            by_year=facets["by_year"],
+            by_source=facets["by_source"],
+            top_authors=facets["top_authors"]
+        )
         
         # Repository stats (currently just local)
         repo_stats = [
@@ -231,6 +216,8 @@ async def get_all_stats(
             documents=doc_stats,
             agents=[]  # Agent stats will be populated when agents are active
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("get_all_stats_error", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to get all stats: {str(e)}")
@@ -239,7 +226,8 @@ async def get_all_stats(
 @router.get("/status/processing", response_model=ProcessingStatus)
 async def get_processing_status(
     limit: int = 20,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    task_registry: TaskRegistry = Depends(get_task_registry)
 ):
     """
     Get status of background processing tasks.
@@ -249,15 +237,14 @@ async def get_processing_status(
     logger.info("get_processing_status", limit=limit, status=status)
     
     try:
-        # TODO: Implement task tracking
-        # Query task queue or database for task status
+        counts = task_registry.counts()
         
         return ProcessingStatus(
-            pending_tasks=0,
-            running_tasks=0,
-            completed_tasks=0,
-            failed_tasks=0,
-            tasks=[]
+            pending_tasks=counts["pending"],
+            running_tasks=counts["running"],
+            completed_tasks=counts["completed"],
+            failed_tasks=counts["failed"],
+            tasks=[ProcessingTask(**task) for task in task_registry.list(limit, status)]
         )
     except Exception as e:
         logger.error("get_processing_status_error", error=str(e))
@@ -265,19 +252,25 @@ async def get_processing_status(
 
 
 @router.get("/status/processing/{task_id}", response_model=ProcessingTask)
-async def get_task_status(task_id: str):
+@router.get("/stats/processing/{task_id}", response_model=ProcessingTask)
+async def get_task_status(
+    task_id: str,
+    task_registry: TaskRegistry = Depends(get_task_registry)
+):
     """
     Get status of a specific processing task.
     
-    Returns detailed information about a background task.
+    Returns detailed information about a background task, such as the
+    processing_task_id returned by a document upload.
     """
     logger.info("get_task_status", task_id=task_id)
     
     try:
-        # TODO: Implement task lookup
-        # Query task database for specific task
+        task = task_registry.get(task_id)
+        if task is None:
+            raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
         
-        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+        return ProcessingTask(**task)
     except HTTPException:
         raise
     except Exception as e:
@@ -285,6 +278,44 @@ async def get_task_status(task_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to get task status: {str(e)}")
 
 
+@router.get("/stats/embeddings", response_model=EmbeddingStats)
+async def get_embedding_stats(
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db)
+):
+    """
+    Get query embedding throughput and latency.
+    
+    Returns batch sizes, requests per second and latency percentiles for
+    the micro-batching embedding service.
+    """
+    logger.info("get_embedding_stats")
+    
+    try:
+        return EmbeddingStats(**vector_db.sync.embedding_service.get_metrics())
+    except Exception as e:
+        logger.error("get_embedding_stats_error", error=str(e))
+        raise HTTPException(status_code=500, detail=f"Failed to get embedding stats: {str(e)}")
+
+
+@router.get("/stats/cache", response_model=CacheStats)
+async def get_cache_stats(
+    vector_db: AsyncVectorDatabase = Depends(get_async_vector_db)
+):
+    """
+    Get query cache statistics.
+    
+    Returns entry counts, byte usage and hit rates for the query embedding
+    and search result caches.
+    """
+    logger.info("get_cache_stats")
+    
+    try:
+        return CacheStats(**vector_db.sync.get_cache_stats())
+    except Exception as e:
+        logger.error("get_cache_stats_error", error=str(e))
+        raise HTTPException(status_code=500, detail=f"Failed to get cache stats: {str(e)}")
+
+
 @router.get("/stats/agents", response_model=List[AgentStats])
 async def get_agent_stats():
     """
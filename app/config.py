@@ -50,11 +50,61 @@ class Settings(BaseSettings):
     embedding_model: str = Field(
         default="all-MiniLM-L6-v2", alias="EMBEDDING_MODEL"
     )
-    
+    embedding_batch_size: int = Field(default=64, alias="EMBEDDING_BATCH_SIZE")
+    vector_db_max_workers: int = Field(default=4, alias="VECTOR_DB_MAX_WORKERS")
+    vector_db_max_pending: int = Field(default=64, alias="VECTOR_DB_MAX_PENDING")
+    vector_db_timeout: float = Field(default=30.0, alias="VECTOR_DB_TIMEOUT")
+    query_embedding_batch_size: int = Field(default=32, alias="QUERY_EMBEDDING_BATCH_SIZE")
+    query_embedding_max_wait_ms: float = Field(default=5.0, alias="QUERY_EMBEDDING_MAX_WAIT_MS")
+    query_embedding_cache_bytes: int = Field(default=16 * 1024 * 1024, alias="QUERY_EMBEDDING_CACHE_BYTES")
+    search_result_cache_bytes: int = Field(default=64 * 1024 * 1024, alias="SEARCH_RESULT_CACHE_BYTES")
+
+    # Passage-level chunk index (full-text semantic search)
+    chunk_index_enabled: bool = Field(default=True, alias="CHUNK_INDEX_ENABLED")
+    chunk_size: int = Field(default=1000, alias="CHUNK_SIZE")
+    chunk_overlap: int = Field(default=200, alias="CHUNK_OVERLAP")
+    chunk_search_multiplier: int = Field(default=4, alias="CHUNK_SEARCH_MULTIPLIER")
+
+    # Hybrid (semantic + keyword) search
+    hybrid_fusion: Literal["rrf", "weighted"] = Field(default="rrf", alias="HYBRID_FUSION")
+    hybrid_search_depth: int = Field(default=3, alias="HYBRID_SEARCH_DEPTH")
+    hybrid_rrf_k: int = Field(default=60, alias="HYBRID_RRF_K")
+    hybrid_semantic_weight: float = Field(default=0.5, alias="HYBRID_SEMANTIC_WEIGHT")
+
+    # Near-duplicate detection at ingest (MinHash/LSH over word shingles)
+    near_duplicate_policy: Literal["off", "skip", "merge", "link"] = Field(
+        default="link", alias="NEAR_DUPLICATE_POLICY"
+    )
+    near_duplicate_threshold: float = Field(default=0.8, alias="NEAR_DUPLICATE_THRESHOLD")
+
+    # Compressed full-text store ("" = next to ChromaDB)
+    text_store_path: str = Field(default="", alias="TEXT_STORE_PATH")
+
     # Document Storage
     document_storage_path: str = Field(
         default="./data/documents", alias="DOCUMENT_STORAGE_PATH"
     )
+    storage_reconcile_interval: float = Field(default=300.0, alias="STORAGE_RECONCILE_INTERVAL")
+    # Largest accepted PDF upload in bytes (0 = no limit)
+    upload_max_bytes: int = Field(default=100 * 1024 * 1024, alias="UPLOAD_MAX_BYTES")
+    # Extraction caps for uploaded PDFs (0 = no limit)
+    pdf_max_pages: int = Field(default=0, alias="PDF_MAX_PAGES")
+    pdf_max_chars: int = Field(default=0, alias="PDF_MAX_CHARS")
+
+    # Sandboxed PDF extraction workers
+    extraction_workers: int = Field(default=2, alias="EXTRACTION_WORKERS")
+    extraction_timeout: float = Field(default=60.0, alias="EXTRACTION_TIMEOUT")
+    extraction_max_memory_mb: int = Field(default=1024, alias="EXTRACTION_MAX_MEMORY_MB")
+    extraction_max_tasks_per_worker: int = Field(default=50, alias="EXTRACTION_MAX_TASKS_PER_WORKER")
+    # Content-hash cache of extraction results ("" = next to ChromaDB; 0 bytes disables)
+    extraction_cache_path: str = Field(default="", alias="EXTRACTION_CACHE_PATH")
+    extraction_cache_bytes: int = Field(default=512 * 1024 * 1024, alias="EXTRACTION_CACHE_BYTES")
+
+    # Background processing tasks kept for status queries
+    processing_task_retention: int = Field(default=1000, alias="PROCESSING_TASK_RETENTION")
+    # Bulk upload: PDFs accepted per request, papers per vector DB write
+    bulk_upload_max_files: int = Field(default=1000, alias="BULK_UPLOAD_MAX_FILES")
+    bulk_index_batch_size: int = Field(default=64, alias="BULK_INDEX_BATCH_SIZE")
 
     # Redis (Event Bus & Caching)
     redis_host: str = Field(default="localhost", alias="REDIS_HOST")
@@ -13,6 +13,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.config import settings
+from app.utils.upload_writer import UPLOAD_TOO_LARGE
 
 # Configure structured logging
 structlog.configure(
@@ -58,6 +59,10 @@ async def lifespan(app: FastAPI):
         logger.info("continuing_without_event_bus")
         # Don't raise - server can continue without event bus
 
+    # Start storage accounting (periodic reconciliation in the background)
+    from app.services.storage_ledger import get_storage_ledger
+    get_storage_ledger().start()
+
     # TODO: Initialize resources (Phase 1)
     # - Initialize Vector Database ✅ (done in services)
     # - Start Agent Coordinator (needs Event Bus first)
@@ -77,6 +82,11 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("event_bus_shutdown_error", error=str(e))
 
+    get_storage_ledger().stop()
+
+    from app.services.extraction_pool import shutdown_extraction_pool
+    shutdown_extraction_pool()
+
     # TODO: Cleanup resources
     # - Close Vector DB
     # - Stop agents gracefully
@@ -102,6 +112,38 @@ app.add_middleware(
 )
 
 
+# Allowance for multipart boundaries and headers around an uploaded file
+UPLOAD_FORM_OVERHEAD = 64 * 1024
+
+
+@app.middleware("http")
+async def limit_upload_size(request, call_next):
+    """
+    Refuse single-document uploads whose declared size exceeds UPLOAD_MAX_BYTES.
+
+    Runs before the multipart body is read, so oversized uploads are turned
+    away without being spooled to disk.
+    """
+    if (
+        settings.upload_max_bytes
+        and request.method == "POST"
+        and request.url.path == "/api/v1/documents"
+    ):
+        length = request.headers.get("content-length", "")
+        if length.isdigit() and int(length) > settings.upload_max_bytes + UPLOAD_FORM_OVERHEAD:
+            logger.warning("upload_rejected", code=UPLOAD_TOO_LARGE, content_length=int(length))
+            return JSONResponse(
+                status_code=413,
+                content={
+                    "detail": {
+                        "code": UPLOAD_TOO_LARGE,
+                        "message": f"File exceeds the upload limit of {settings.upload_max_bytes} bytes",
+                    }
+                },
+            )
+    return await call_next(request)
+
+
 @app.get("/")
 async def root():
     """Root endpoint - health check."""
@@ -5,11 +5,29 @@ External service clients (Vector DB, LLM, MCP).
 """
 
 from app.services.vector_db import VectorDatabase, get_vector_db
+from app.services.async_vector_db import AsyncVectorDatabase, get_async_vector_db
+from app.services.embedding_service import BatchingEmbeddingService
 from app.services.llm_client import LLMClient, get_llm_client
+from app.services.blob_store import BlobStore, get_blob_store
+from app.services.storage_ledger import StorageLedger, get_storage_ledger
+from app.services.extraction_pool import ExtractionError, ExtractionPool, get_extraction_pool
+from app.services.task_registry import TaskRegistry, get_task_registry
 
 __all__ = [
     "VectorDatabase",
     "get_vector_db",
+    "AsyncVectorDatabase",
+    "get_async_vector_db",
+    "BatchingEmbeddingService",
     "LLMClient",
     "get_llm_client",
+    "StorageLedger",
+    "get_storage_ledger",
+    "BlobStore",
+    "get_blob_store",
+    "ExtractionError",
+    "ExtractionPool",
+    "get_extraction_pool",
+    "TaskRegistry",
+    "get_task_registry",
 ]
@@ -0,0 +1,300 @@
+"""
+Async Vector Database Facade
+
+Non-blocking wrapper around VectorDatabase for use in async code (FastAPI
+handlers, agents). ChromaDB and embedding work runs on a dedicated,
+bounded thread pool so it never blocks the event loop.
+"""
+
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+import structlog
+from fastapi import Depends, HTTPException
+
+from app.config import settings
+from app.services.text_store import StoredText
+from app.services.vector_db import VectorDatabase, get_vector_db
+
+logger = structlog.get_logger(__name__)
+
+
+class VectorDatabaseBusyError(HTTPException):
+    """Raised when too many vector database operations are already queued."""
+
+    def __init__(self, pending: int):
+        super().__init__(
+            status_code=503,
+            detail=f"Vector database busy ({pending} operations pending), retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+
+class VectorDatabaseTimeoutError(HTTPException):
+    """Raised when a vector database operation exceeds its timeout."""
+
+    def __init__(self, operation: str, timeout: float):
+        super().__init__(
+            status_code=504,
+            detail=f"Vector database operation '{operation}' timed out after {timeout}s",
+        )
+
+
+class AsyncVectorDatabase:
+    """
+    Async facade over a VectorDatabase.
+
+    Every call is submitted to a private ThreadPoolExecutor. At most
+    max_pending operations may be queued or running at once; further calls
+    fail fast with VectorDatabaseBusyError. Callers stop waiting after
+    timeout seconds (VectorDatabaseTimeoutError); the pending slot is only
+    released once the underlying work has actually finished.
+
+    Background ingest writes (ingest_papers) run on a separate single
+    thread without these limits, so a slow embedding batch is never
+    reported as failed while it is still being written.
+
+    Example usage:
+        async_db = AsyncVectorDatabase(get_vector_db())
+        results = await async_db.search("CRISPR gene editing", n_results=5)
+    """
+
+    def __init__(
+        self,
+        vector_db: VectorDatabase,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        timeout: float | None = None,
+    ):
+        """
+        Initialize the facade.
+
+        Args:
+            vector_db: Synchronous VectorDatabase to wrap
+            max_workers: Executor threads (default: config.vector_db_max_workers)
+            max_pending: Queue-depth limit (default: config.vector_db_max_pending)
+            timeout: Per-operation timeout in seconds (default: config.vector_db_timeout)
+        """
+        self.sync = vector_db
+        self.max_pending = max_pending or settings.vector_db_max_pending
+        self.timeout = timeout or settings.vector_db_timeout
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or settings.vector_db_max_workers,
+            thread_name_prefix="vector-db",
+        )
+        self._ingest_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="vector-db-ingest"
+        )
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Number of operations queued or running."""
+        return self._pending
+
+    async def add_papers(self, papers: list[dict[str, Any]]) -> int:
+        """Add papers (see VectorDatabase.add_papers)."""
+        return await self._run(self.sync.add_papers, papers)
+
+    async def ingest_papers(
+        self, papers: list[dict[str, Any]]
+    ) -> dict[str, dict[str, Any] | None]:
+        """
+        Add papers from a background task and report their near-duplicates.
+        
+        Unlike add_papers, this waits for the write to finish however long
+        it takes and is not subject to the queue-depth limit, so when it
+        raises, the write has failed rather than merely been abandoned.
+        
+        Returns:
+            Map of each paper ID to its duplicate_of() result after the write
+        """
+        return await asyncio.wrap_future(self._ingest_executor.submit(self._ingest, papers))
+
+    async def search(
+        self,
+        query: str,
+        n_results: int = 10,
+        filters: dict[str, Any] | None = None,
+        search_type: str = "semantic",
+        fields: list[str] | None = None,
+        collapse: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Search for papers (see VectorDatabase.search)."""
+        return await self._run(
+            self.sync.search, query, n_results, filters, search_type, fields, collapse
+        )
+
+    async def collapse_duplicates(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Collapse near-duplicate clusters (see VectorDatabase.collapse_duplicates)."""
+        return await self._run(self.sync.collapse_duplicates, results)
+
+    async def get_text(
+        self,
+        paper_id: str,
+        pages: tuple[int, int | None] | None = None,
+        byte_range: tuple[int, int | None] | None = None,
+        section: str | None = None,
+    ) -> StoredText | None:
+        """Read a paper's full text (see VectorDatabase.get_text)."""
+        return await self._run(self.sync.get_text, paper_id, pages, byte_range, section)
+
+    async def duplicate_of(self, paper_id: str) -> dict[str, Any] | None:
+        """Canonical paper of a near-duplicate (see VectorDatabase.duplicate_of)."""
+        return await self._run(self.sync.duplicate_of, paper_id)
+
+    async def search_many(
+        self,
+        queries: list[str],
+        n_results: int = 10,
+        filters: dict[str, Any] | None = None,
+        search_type: str = "semantic",
+        dedup: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Run several searches at once (see VectorDatabase.search_many)."""
+        return await self._run(
+            self.sync.search_many, queries, n_results, filters, search_type, dedup, fields
+        )
+
+    async def hybrid_search(
+        self,
+        query: str,
+        n_results: int = 10,
+        filters: dict[str, Any] | None = None,
+        fusion: str | None = None,
+        depth: int | None = None,
+        fields: list[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], dict[str, float]]:
+        """Hybrid search with timings (see VectorDatabase.hybrid_search)."""
+        return await self._run(
+            self.sync.hybrid_search, query, n_results, filters, fusion, depth, fields
+        )
+
+    async def find_similar(
+        self,
+        paper_id: str,
+        n_results: int = 10,
+        fields: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Find similar papers (see VectorDatabase.find_similar)."""
+        return await self._run(self.sync.find_similar, paper_id, n_results, fields)
+
+    async def get_paper(
+        self, paper_id: str, fields: list[str] | None = None
+    ) -> dict[str, Any] | None:
+        """Retrieve a paper (see VectorDatabase.get_paper)."""
+        return await self._run(self.sync.get_paper, paper_id, fields)
+
+    async def get_all_papers(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        filters: dict[str, Any] | None = None,
+        fields: list[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """List papers (see VectorDatabase.get_all_papers)."""
+        return await self._run(self.sync.get_all_papers, limit, offset, filters, fields)
+
+    async def list_papers(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        filters: dict[str, Any] | None = None,
+        after: tuple[str, str] | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """List paper metadata from the catalog (see VectorDatabase.list_papers)."""
+        return await self._run(self.sync.list_papers, limit, offset, filters, after)
+
+    async def delete_paper(self, paper_id: str) -> bool:
+        """Delete a paper (see VectorDatabase.delete_paper)."""
+        return await self._run(self.sync.delete_paper, paper_id)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get database statistics (see VectorDatabase.get_stats)."""
+        return await self._run(self.sync.get_stats)
+
+    async def get_facets(self, top_authors: int = 10) -> dict[str, Any]:
+        """Get corpus facet counts (see VectorDatabase.get_facets)."""
+        return await self._run(self.sync.get_facets, top_authors)
+
+    async def reset(self) -> None:
+        """Reset the database (see VectorDatabase.reset)."""
+        return await self._run(self.sync.reset)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the executors."""
+        self._executor.shutdown(wait=wait)
+        self._ingest_executor.shutdown(wait=wait)
+
+    # Private helper methods
+
+    async def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking call on the executor with queue-depth and time limits."""
+        operation = fn.__name__
+
+        with self._pending_lock:
+            if self._pending >= self.max_pending:
+                logger.warning(
+                    "vector_db_queue_full",
+                    operation=operation,
+                    pending=self._pending,
+                )
+                raise VectorDatabaseBusyError(self._pending)
+            self._pending += 1
+
+        try:
+            future: Future = self._executor.submit(functools.partial(fn, *args, **kwargs))
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            logger.error("vector_db_timeout", operation=operation, timeout=self.timeout)
+            raise VectorDatabaseTimeoutError(operation, self.timeout)
+
+    def _ingest(self, papers: list[dict[str, Any]]) -> dict[str, dict[str, Any] | None]:
+        """Write papers and look up their near-duplicates (ingest thread)."""
+        self.sync.add_papers(papers)
+        return {str(paper["id"]): self.sync.duplicate_of(str(paper["id"])) for paper in papers}
+
+    def _release(self) -> None:
+        with self._pending_lock:
+            self._pending -= 1
+
+
+# One facade (and executor) per underlying VectorDatabase
+_async_instances: "weakref.WeakKeyDictionary[VectorDatabase, AsyncVectorDatabase]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_instances_lock = threading.Lock()
+
+
+def get_async_vector_db(
+    vector_db: VectorDatabase = Depends(get_vector_db),
+) -> AsyncVectorDatabase:
+    """
+    Get the AsyncVectorDatabase wrapping a VectorDatabase.
+
+    Used as a FastAPI dependency; it builds on get_vector_db, so overriding
+    get_vector_db also changes the database this facade wraps. Outside
+    FastAPI, pass the VectorDatabase explicitly.
+
+    Returns:
+        AsyncVectorDatabase shared by all callers of the same VectorDatabase
+    """
+    with _async_instances_lock:
+        async_db = _async_instances.get(vector_db)
+        if async_db is None:
+            async_db = AsyncVectorDatabase(vector_db)
+            _async_instances[vector_db] = async_db
+        return async_db
@@ -0,0 +1,259 @@
+"""
+Blob Store
+
+Content-addressed storage for uploaded PDFs. Each distinct file is stored
+once, named by its SHA-256 under a two-level sharded directory
+(blobs/ab/cd/<sha256>.pdf) so no directory grows beyond a few hundred
+entries. A SQLite index next to ChromaDB records one reference per upload
+of each blob, all pointing at the document the first upload created; the
+blob is deleted when its last reference is released.
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS refs (
+    sha256 TEXT NOT NULL,
+    reference TEXT NOT NULL,
+    document_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (sha256, reference)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_refs_document ON refs (document_id);
+"""
+
+
+@dataclass
+class BlobRef:
+    """Where an upload's bytes live, and whether they were new."""
+
+    document_id: str
+    sha256: str
+    path: Path
+    created: bool
+
+
+class BlobStore:
+    """
+    Reference-counted, content-addressed file store.
+
+    add() moves a freshly written file into the store under a reference
+    (the upload's own ID). A file whose hash is already stored is discarded
+    and the reference is added to the existing blob, pointing at the
+    document that owns it, so identical uploads share one document, one
+    extraction and one set of embeddings. Each upload holds its reference
+    until it is released; the document and its blob go with the last one.
+
+    Example usage:
+        store = BlobStore("./data/documents", "./data/chroma/blob_store.sqlite3")
+        ref = store.add(incoming_path, sha256, upload_id)
+        if not ref.created:
+            return ref.document_id  # Same bytes already uploaded
+        ...
+        if store.release(document_id) == 0:
+            ...  # Last reference gone, blob deleted
+    """
+
+    def __init__(self, root: str | Path, db_path: str | Path):
+        """
+        Open or create the store.
+
+        Args:
+            root: Document storage directory (blobs go under root/blobs)
+            db_path: Path to the SQLite reference index
+        """
+        self.root = Path(root)
+        self.blob_root = self.root / "blobs"
+        self.db_path = Path(db_path)
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._migrate()
+        self._conn.commit()
+
+    def path_for(self, sha256: str) -> Path:
+        """Sharded location of a blob."""
+        return self.blob_root / sha256[:2] / sha256[2:4] / f"{sha256}.pdf"
+
+    def add(self, file_path: str | Path, sha256: str, reference: str) -> BlobRef:
+        """
+        Move a file into the store and take a reference on it.
+
+        Args:
+            file_path: Fully written file; it is moved or, if these bytes
+                       are already stored, deleted
+            sha256: SHA-256 of the file
+            reference: ID of the upload; it becomes the document ID when
+                       the bytes are new
+
+        Returns:
+            BlobRef; created is False when the bytes were already stored,
+            and document_id is then the existing document
+        """
+        file_path = Path(file_path)
+        blob_path = self.path_for(sha256)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT document_id FROM refs WHERE sha256 = ? ORDER BY created_at LIMIT 1",
+                (sha256,),
+            ).fetchone()
+            document_id = row[0] if row else reference
+
+            if row is not None:
+                file_path.unlink(missing_ok=True)
+                logger.info("blob_deduplicated", sha256=sha256, document_id=document_id)
+            else:
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                file_path.replace(blob_path)
+
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO refs (sha256, reference, document_id, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (sha256, reference, document_id, time.time()),
+                )
+
+        return BlobRef(document_id, sha256, blob_path, created=row is None)
+
+    def release(self, document_id: str, reference: str | None = None) -> int | None:
+        """
+        Drop one reference to a document's blob, deleting the blob if it
+        was the last one.
+
+        Args:
+            document_id: Document the reference points at
+            reference: Specific reference to drop (default: the newest
+                       duplicate upload's, then the document's own)
+
+        Returns:
+            Number of references left, or None if the document had none
+        """
+        with self._lock:
+            if reference is None:
+                row = self._conn.execute(
+                    "SELECT sha256, reference FROM refs WHERE document_id = ? "
+                    "ORDER BY reference = document_id, created_at DESC LIMIT 1",
+                    (document_id,),
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT sha256, reference FROM refs WHERE document_id = ? AND reference = ?",
+                    (document_id, reference),
+                ).fetchone()
+            if row is None:
+                return None
+            sha256, reference = row
+
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM refs WHERE sha256 = ? AND reference = ?", (sha256, reference)
+                )
+                remaining = self._conn.execute(
+                    "SELECT COUNT(*) FROM refs WHERE sha256 = ?", (sha256,)
+                ).fetchone()[0]
+
+            if remaining == 0:
+                self.path_for(sha256).unlink(missing_ok=True)
+                logger.info("blob_deleted", sha256=sha256, document_id=document_id)
+
+        return remaining
+
+    def references(self, document_id: str) -> int:
+        """Number of uploads holding a reference to a document's blob."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM refs WHERE document_id = ?", (document_id,)
+            ).fetchone()[0]
+
+    def document_for(self, sha256: str) -> str | None:
+        """ID of the document a blob belongs to, or None if it is not stored."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT document_id FROM refs WHERE sha256 = ? LIMIT 1", (sha256,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def owners(self) -> dict[str, str]:
+        """
+        Map each blob's SHA-256 to the document it belongs to.
+
+        Used by StorageLedger to attribute blob files to documents.
+        """
+        with self._lock:
+            return dict(
+                self._conn.execute("SELECT DISTINCT sha256, document_id FROM refs").fetchall()
+            )
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get blob and reference counts.
+
+        Returns:
+            Dictionary with blobs and references
+        """
+        with self._lock:
+            blobs, references = self._conn.execute(
+                "SELECT COUNT(DISTINCT sha256), COUNT(*) FROM refs"
+            ).fetchone()
+        return {"blobs": blobs, "references": references}
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # Private helper methods
+
+    def _migrate(self) -> None:
+        """Create the schema, converting an index from before per-upload references."""
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(refs)")]
+        legacy = bool(columns) and "reference" not in columns
+        if legacy:
+            self._conn.execute("DROP INDEX IF EXISTS idx_refs_sha256")
+            self._conn.execute("ALTER TABLE refs RENAME TO refs_legacy")
+        self._conn.executescript(SCHEMA)
+        if legacy:
+            # Each old row was a document owning its blob
+            self._conn.execute(
+                "INSERT OR IGNORE INTO refs (sha256, reference, document_id, created_at) "
+                "SELECT sha256, document_id, document_id, created_at FROM refs_legacy"
+            )
+            self._conn.execute("DROP TABLE refs_legacy")
+            logger.info("blob_index_migrated", path=str(self.db_path))
+
+
+# Singleton instance for application-wide use
+_blob_store_instance: BlobStore | None = None
+
+
+def get_blob_store() -> BlobStore:
+    """
+    Get or create the global BlobStore for document storage.
+
+    Returns:
+        BlobStore singleton instance
+    """
+    global _blob_store_instance
+
+    if _blob_store_instance is None:
+        _blob_store_instance = BlobStore(
+            settings.document_storage_path,
+            Path(settings.chroma_persist_directory) / "blob_store.sqlite3",
+        )
+
+    return _blob_store_instance
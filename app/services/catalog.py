@@ -0,0 +1,349 @@
+"""
+Document Catalog Service
+
+SQLite metadata sidecar written alongside ChromaDB. Holds one row per paper
+with its display metadata, indexed for filtering and paging, so listing
+documents never loads embeddings or document bodies.
+"""
+
+import base64
+import binascii
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL DEFAULT '',
+    source TEXT,
+    year INTEGER,
+    authors TEXT,
+    created_at TEXT NOT NULL DEFAULT '',
+    updated_at TEXT,
+    metadata TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_documents_source ON documents (source);
+CREATE INDEX IF NOT EXISTS idx_documents_year ON documents (year);
+CREATE INDEX IF NOT EXISTS idx_documents_created_at ON documents (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_documents_title ON documents (title);
+
+CREATE TABLE IF NOT EXISTS facets (
+    facet TEXT NOT NULL,
+    value TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (facet, value)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_facets_count ON facets (facet, count DESC);
+"""
+
+# Facets counted per document
+FACETS = ("year", "source", "author")
+
+
+def encode_cursor(created_at: str, paper_id: str) -> str:
+    """
+    Encode a catalog position as an opaque pagination cursor.
+
+    Args:
+        created_at: created_at value of the last paper on the page
+        paper_id: ID of the last paper on the page
+
+    Returns:
+        URL-safe cursor token
+    """
+    raw = json.dumps([str(created_at), str(paper_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Returns:
+        Tuple of (created_at, paper ID) to resume after
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, paper_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(created_at, str) or not isinstance(paper_id, str):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return created_at, paper_id
+
+
+class DocumentCatalog:
+    """
+    Metadata catalog for papers in the vector store.
+
+    Rows mirror the metadata stored in ChromaDB and are kept in sync by
+    VectorDatabase on every add, delete and reset. Per-value document
+    counts for year, source and author are maintained in the same
+    transactions, so corpus facets never require a scan.
+    """
+
+    def __init__(self, db_path: str | Path):
+        """
+        Open or create the catalog.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+        if self._facets_missing():
+            self.rebuild_facets()
+
+    def upsert(self, entries: list[tuple[str, dict[str, Any]]]) -> int:
+        """
+        Insert or replace catalog rows.
+
+        Args:
+            entries: List of (paper ID, metadata) tuples, where metadata is
+                    the dictionary stored in ChromaDB for the paper
+
+        Returns:
+            Number of rows written
+        """
+        if not entries:
+            return 0
+
+        rows = [
+            (
+                str(paper_id),
+                str(metadata.get("title", "")),
+                metadata.get("source"),
+                metadata.get("year"),
+                metadata.get("authors"),
+                str(metadata.get("created_at", "")),
+                metadata.get("updated_at"),
+                json.dumps(metadata),
+            )
+            for paper_id, metadata in entries
+        ]
+
+        with self._lock, self._conn:
+            # Replaced rows give back their facet counts first
+            self._apply_facets(self._existing_metadata([row[0] for row in rows]), -1)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO documents "
+                "(id, title, source, year, authors, created_at, updated_at, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._apply_facets([metadata for _, metadata in entries], 1)
+
+        return len(rows)
+
+    def delete(self, paper_id: str) -> bool:
+        """
+        Remove a paper from the catalog.
+
+        Returns:
+            True if a row was deleted
+        """
+        with self._lock, self._conn:
+            self._apply_facets(self._existing_metadata([str(paper_id)]), -1)
+            cursor = self._conn.execute("DELETE FROM documents WHERE id = ?", (str(paper_id),))
+            return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM documents")
+            self._conn.execute("DELETE FROM facets")
+
+    def facet_counts(self, facet: str, limit: int | None = None) -> dict[str, int]:
+        """
+        Get document counts per value of a facet.
+
+        Args:
+            facet: One of FACETS ("year", "source", "author")
+            limit: Only return the most frequent values
+
+        Returns:
+            Mapping of value to document count, most frequent first
+        """
+        if facet not in FACETS:
+            raise ValueError(f"Unknown facet: {facet}")
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT value, count FROM facets WHERE facet = ? "
+                "ORDER BY count DESC, value LIMIT ?",
+                (facet, -1 if limit is None else limit),
+            ).fetchall()
+        return {value: count for value, count in rows}
+
+    def rebuild_facets(self) -> None:
+        """Recount all facets from the documents table."""
+        logger.info("rebuilding_catalog_facets")
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM facets")
+            rows = self._conn.execute("SELECT metadata FROM documents")
+            self._apply_facets([json.loads(metadata) for (metadata,) in rows], 1)
+
+    def get(self, paper_id: str) -> dict[str, Any] | None:
+        """
+        Get a paper's metadata.
+
+        Returns:
+            Metadata dictionary or None if not cataloged
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT metadata FROM documents WHERE id = ?", (str(paper_id),)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count(self, filters: dict[str, Any] | None = None) -> int:
+        """
+        Count papers matching filters.
+
+        Args:
+            filters: Optional filters (source, year, year_min, year_max)
+
+        Returns:
+            Number of matching papers
+        """
+        where, params = self._where_clause(filters or {})
+        with self._lock:
+            row = self._conn.execute(f"SELECT COUNT(*) FROM documents{where}", params).fetchone()
+        return int(row[0])
+
+    def page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        filters: dict[str, Any] | None = None,
+        after: tuple[str, str] | None = None,
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Read one page of papers ordered by (created_at, id).
+
+        With after set, the page starts right after that position (keyset
+        pagination) and is served by a range scan on the (created_at, id)
+        index; offset is then ignored.
+
+        Args:
+            limit: Maximum number of papers to return
+            offset: Number of matching papers to skip
+            filters: Optional filters (source, year, year_min, year_max)
+            after: Optional (created_at, paper ID) position to resume after
+
+        Returns:
+            List of (paper ID, metadata) tuples
+        """
+        where, params = self._where_clause(filters or {})
+        if after is not None:
+            where += " AND " if where else " WHERE "
+            where += "(created_at, id) > (?, ?)"
+            params.extend(after)
+            offset = 0
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, metadata FROM documents{where} "
+                "ORDER BY created_at, id LIMIT ? OFFSET ?",
+                (*params, limit, offset),
+            ).fetchall()
+        return [(paper_id, json.loads(metadata)) for paper_id, metadata in rows]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # Private helper methods
+
+    def _facets_missing(self) -> bool:
+        """Whether documents exist without any facet counts (pre-facet catalogs)."""
+        with self._lock:
+            has_documents = self._conn.execute("SELECT 1 FROM documents LIMIT 1").fetchone()
+            has_facets = self._conn.execute("SELECT 1 FROM facets LIMIT 1").fetchone()
+        return has_documents is not None and has_facets is None
+
+    def _existing_metadata(self, paper_ids: list[str]) -> list[dict[str, Any]]:
+        """Metadata of the given papers that are already cataloged (caller holds the lock)."""
+        metadatas = []
+        for paper_id in paper_ids:
+            row = self._conn.execute(
+                "SELECT metadata FROM documents WHERE id = ?", (paper_id,)
+            ).fetchone()
+            if row:
+                metadatas.append(json.loads(row[0]))
+        return metadatas
+
+    def _apply_facets(self, metadatas: list[dict[str, Any]], delta: int) -> None:
+        """Add delta to the facet counts of each document (caller holds the lock)."""
+        counts: dict[tuple[str, str], int] = {}
+        for metadata in metadatas:
+            for key in _facet_values(metadata):
+                counts[key] = counts.get(key, 0) + delta
+
+        if not counts:
+            return
+
+        self._conn.executemany(
+            "INSERT INTO facets (facet, value, count) VALUES (?, ?, ?) "
+            "ON CONFLICT (facet, value) DO UPDATE SET count = count + excluded.count",
+            [(facet, value, count) for (facet, value), count in counts.items()],
+        )
+        if delta < 0:
+            self._conn.executemany(
+                "DELETE FROM facets WHERE facet = ? AND value = ? AND count <= 0",
+                list(counts),
+            )
+
+    @staticmethod
+    def _where_clause(filters: dict[str, Any]) -> tuple[str, list[Any]]:
+        """Build a WHERE clause from filter dictionary."""
+        conditions = []
+        params: list[Any] = []
+
+        if "source" in filters:
+            conditions.append("source = ?")
+            params.append(filters["source"])
+        if "year" in filters:
+            conditions.append("year = ?")
+            params.append(int(filters["year"]))
+        if "year_min" in filters:
+            conditions.append("year >= ?")
+            params.append(int(filters["year_min"]))
+        if "year_max" in filters:
+            conditions.append("year <= ?")
+            params.append(int(filters["year_max"]))
+
+        if not conditions:
+            return "", params
+        return " WHERE " + " AND ".join(conditions), params
+
+
+def _facet_values(metadata: dict[str, Any]) -> set[tuple[str, str]]:
+    """(facet, value) pairs a document contributes to."""
+    values = {("source", str(metadata.get("source") or "unknown"))}
+    if metadata.get("year"):
+        values.add(("year", str(metadata["year"])))
+    for author in str(metadata.get("authors") or "").split(", "):
+        author = author.strip()
+        if author:
+            values.add(("author", author))
+    return values
@@ -0,0 +1,334 @@
+"""
+Near-Duplicate Index
+
+MinHash signatures of paper text with an LSH band index, stored in SQLite
+alongside the vector store. Preprints, journal versions and repository
+copies of one paper share most of their word shingles; LSH finds such
+candidates by looking up a few band hashes instead of comparing against
+every paper, and the signatures then estimate the shingle Jaccard
+similarity of each candidate.
+
+Every indexed paper belongs to a cluster named by its canonical paper
+(the first one indexed). Papers that were not indexed because of a
+near-duplicate (skipped or merged) are remembered as aliases of the
+canonical paper.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import structlog
+
+from app.services.keyword_index import TOKEN_PATTERN
+
+logger = structlog.get_logger(__name__)
+
+# Signature length and LSH banding (32 bands of 4 rows finds pairs above
+# ~0.5 Jaccard with high probability; candidates are then verified)
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+
+# Words per shingle
+SHINGLE_SIZE = 5
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# Fixed permutations, so signatures stay comparable across processes
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(1, int(_MERSENNE_PRIME), size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.randint(0, int(_MERSENNE_PRIME), size=NUM_PERM, dtype=np.uint64)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    doc_id TEXT PRIMARY KEY,
+    signature BLOB NOT NULL,
+    canonical_id TEXT NOT NULL,
+    similarity REAL,
+    indexed_at REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_signatures_canonical ON signatures (canonical_id);
+
+CREATE TABLE IF NOT EXISTS bands (
+    band INTEGER NOT NULL,
+    key BLOB NOT NULL,
+    doc_id TEXT NOT NULL,
+    PRIMARY KEY (band, key, doc_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_bands_doc ON bands (doc_id);
+
+CREATE TABLE IF NOT EXISTS aliases (
+    doc_id TEXT PRIMARY KEY,
+    canonical_id TEXT NOT NULL,
+    similarity REAL NOT NULL,
+    policy TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_aliases_canonical ON aliases (canonical_id);
+"""
+
+
+def minhash(text: str) -> np.ndarray | None:
+    """
+    MinHash signature of the word shingles of a text.
+
+    Args:
+        text: Text to sign
+
+    Returns:
+        NUM_PERM uint64 values, or None if the text has no words
+    """
+    words = TOKEN_PATTERN.findall(text.lower())
+    if not words:
+        return None
+
+    size = min(SHINGLE_SIZE, len(words))
+    shingles = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+    hashes = np.array(
+        [
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little")
+            for s in shingles
+        ],
+        dtype=np.uint64,
+    )
+
+    # Universal hashing (a * x + b) mod p, truncated to 32 bits
+    permuted = np.bitwise_and(
+        (np.outer(hashes, _PERM_A) + _PERM_B) % _MERSENNE_PRIME, _MAX_HASH
+    )
+    return permuted.min(axis=0)
+
+
+def jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimate the Jaccard similarity of two signatures' shingle sets."""
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+def _band_keys(signature: np.ndarray) -> list[bytes]:
+    """One hash per LSH band of a signature."""
+    return [
+        hashlib.blake2b(signature[i * ROWS:(i + 1) * ROWS].tobytes(), digest_size=8).digest()
+        for i in range(BANDS)
+    ]
+
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH index of paper signatures backed by SQLite.
+
+    Example usage:
+        index = NearDuplicateIndex("./data/chroma/dedup_index.sqlite3")
+        signature = minhash(text)
+        match = index.find(signature, threshold=0.8)
+        if match is None:
+            index.add(paper_id, signature)
+    """
+
+    def __init__(self, db_path: str | Path):
+        """
+        Open or create the index.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def count(self) -> int:
+        """Return the number of indexed papers."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+
+    def find(
+        self,
+        signature: np.ndarray,
+        threshold: float,
+        exclude_id: str | None = None,
+    ) -> tuple[str, float] | None:
+        """
+        Find the most similar indexed paper at or above a threshold.
+
+        Only papers sharing at least one LSH band with the signature are
+        compared.
+
+        Args:
+            signature: MinHash signature (see minhash)
+            threshold: Minimum estimated Jaccard similarity
+            exclude_id: Paper to ignore, along with the cluster it is
+                        canonical for (e.g. the paper being re-indexed)
+
+        Returns:
+            Tuple of (canonical paper ID, similarity) or None
+        """
+        keys = _band_keys(signature)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT s.doc_id, s.signature, s.canonical_id FROM signatures s "
+                "WHERE s.doc_id IN (SELECT doc_id FROM bands WHERE "
+                + " OR ".join(["(band = ? AND key = ?)"] * BANDS)
+                + ")",
+                [value for band, key in enumerate(keys) for value in (band, key)],
+            ).fetchall()
+
+        best: tuple[str, float] | None = None
+        for doc_id, blob, canonical_id in rows:
+            if exclude_id in (doc_id, canonical_id):
+                continue
+            similarity = jaccard(signature, np.frombuffer(blob, dtype=np.uint64))
+            if similarity >= threshold and (best is None or similarity > best[1]):
+                best = (canonical_id, similarity)
+        return best
+
+    def add(
+        self,
+        doc_id: str,
+        signature: np.ndarray,
+        canonical_id: str | None = None,
+        similarity: float | None = None,
+    ) -> None:
+        """
+        Index a paper's signature, replacing any previous entry. A paper
+        indexed under its own ID is no longer an alias of another.
+
+        Args:
+            doc_id: Paper identifier
+            signature: MinHash signature
+            canonical_id: Canonical paper of its cluster (default: itself)
+            similarity: Similarity to the canonical paper, if linked
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM bands WHERE doc_id = ?", (doc_id,))
+            self._conn.execute("DELETE FROM aliases WHERE doc_id = ?", (doc_id,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO signatures "
+                "(doc_id, signature, canonical_id, similarity, indexed_at) VALUES (?, ?, ?, ?, ?)",
+                (doc_id, signature.tobytes(), canonical_id or doc_id, similarity, time.time()),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO bands (band, key, doc_id) VALUES (?, ?, ?)",
+                [(band, key, doc_id) for band, key in enumerate(_band_keys(signature))],
+            )
+
+    def add_alias(self, doc_id: str, canonical_id: str, similarity: float, policy: str) -> None:
+        """Remember a paper that was skipped or merged into a canonical paper."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO aliases (doc_id, canonical_id, similarity, policy) "
+                "VALUES (?, ?, ?, ?)",
+                (doc_id, canonical_id, similarity, policy),
+            )
+
+    def duplicate_of(self, doc_id: str) -> dict[str, Any] | None:
+        """
+        Get the canonical paper a paper duplicates.
+
+        Returns:
+            Dictionary with canonical_id, similarity and policy ('skip',
+            'merge' or 'link'), or None if the paper is not a duplicate
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT canonical_id, similarity, policy FROM aliases WHERE doc_id = ?",
+                (doc_id,),
+            ).fetchone()
+            if row is None:
+                row = self._conn.execute(
+                    "SELECT canonical_id, similarity, 'link' FROM signatures "
+                    "WHERE doc_id = ? AND canonical_id != doc_id",
+                    (doc_id,),
+                ).fetchone()
+        if row is None:
+            return None
+        return {"canonical_id": row[0], "similarity": row[1], "policy": row[2]}
+
+    def canonical_ids(self, doc_ids: list[str]) -> dict[str, str]:
+        """Map paper IDs to the canonical IDs of their clusters."""
+        if not doc_ids:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT doc_id, canonical_id FROM signatures "
+                f"WHERE doc_id IN ({','.join('?' * len(doc_ids))})",
+                doc_ids,
+            ).fetchall()
+        return dict(rows)
+
+    def cluster(self, canonical_id: str) -> list[str]:
+        """IDs of the indexed papers in a cluster, canonical paper first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT doc_id FROM signatures WHERE canonical_id = ? "
+                "ORDER BY doc_id != canonical_id, indexed_at",
+                (canonical_id,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def remove(self, doc_id: str) -> None:
+        """
+        Remove a paper. If it was a cluster's canonical paper, the oldest
+        remaining member becomes canonical; its aliases are forgotten.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM bands WHERE doc_id = ?", (doc_id,))
+            self._conn.execute("DELETE FROM signatures WHERE doc_id = ?", (doc_id,))
+            self._conn.execute(
+                "DELETE FROM aliases WHERE doc_id = ? OR canonical_id = ?", (doc_id, doc_id)
+            )
+
+            successor = self._conn.execute(
+                "SELECT doc_id FROM signatures WHERE canonical_id = ? "
+                "ORDER BY indexed_at LIMIT 1",
+                (doc_id,),
+            ).fetchone()
+            if successor is not None:
+                self._conn.execute(
+                    "UPDATE signatures SET canonical_id = ? WHERE canonical_id = ?",
+                    (successor[0], doc_id),
+                )
+                self._conn.execute(
+                    "UPDATE signatures SET similarity = NULL WHERE doc_id = ?", (successor[0],)
+                )
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with papers, clusters (with more than one member),
+            linked and aliases
+        """
+        with self._lock:
+            papers, linked = self._conn.execute(
+                "SELECT COUNT(*), COUNT(*) FILTER (WHERE canonical_id != doc_id) FROM signatures"
+            ).fetchone()
+            clusters = self._conn.execute(
+                "SELECT COUNT(DISTINCT canonical_id) FROM signatures WHERE canonical_id != doc_id"
+            ).fetchone()[0]
+            aliases = self._conn.execute("SELECT COUNT(*) FROM aliases").fetchone()[0]
+        return {"papers": papers, "clusters": clusters, "linked": linked, "aliases": aliases}
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM bands")
+            self._conn.execute("DELETE FROM signatures")
+            self._conn.execute("DELETE FROM aliases")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
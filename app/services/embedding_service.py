@@ -0,0 +1,220 @@
+"""
+Embedding Service
+
+Dynamic micro-batching in front of the sentence-transformers embedding
+function. Concurrent query embeddings are collected for a few milliseconds
+(or until the batch is full) and encoded in a single forward pass.
+"""
+
+import math
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class _PendingRequest:
+    """Texts waiting to be embedded by the batching worker."""
+    texts: list[str]
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    done: threading.Event = field(default_factory=threading.Event)
+    embeddings: list[Any] | None = None
+    error: Exception | None = None
+
+
+class BatchingEmbeddingService:
+    """
+    Collects concurrent embedding requests into batched calls.
+
+    Callers block in embed() until their texts have been encoded. A single
+    worker thread takes the first waiting request, gathers more until
+    max_batch_size texts are queued or max_wait_ms has passed, then runs
+    the embedding function once for the whole batch.
+
+    Example usage:
+        service = BatchingEmbeddingService(embedding_fn, max_batch_size=32)
+        [embedding] = service.embed(["CRISPR gene editing"])
+        print(service.get_metrics()["latency_ms"]["p99"])
+    """
+
+    def __init__(
+        self,
+        embedding_fn: Callable[[list[str]], list[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        metrics_window: int = 1000,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            embedding_fn: Function embedding a list of texts in one call
+            max_batch_size: Maximum number of texts per batched call
+            max_wait_ms: How long to wait for more requests after the first
+            metrics_window: Number of recent requests kept for latency stats
+        """
+        self.embedding_fn = embedding_fn
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max(max_wait_ms, 0.0) / 1000
+
+        self._queue: queue.Queue[_PendingRequest] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+
+        # Metrics
+        self._metrics_lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=metrics_window)
+        self._completions: deque[float] = deque(maxlen=metrics_window)
+        self._total_requests = 0
+        self._total_texts = 0
+        self._total_batches = 0
+        self._max_observed_batch = 0
+
+    def embed(self, texts: list[str]) -> list[Any]:
+        """
+        Embed texts, sharing a batched call with concurrent callers.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding per text, in order
+
+        Raises:
+            Exception: Whatever the embedding function raised for the batch
+        """
+        if not texts:
+            return []
+
+        self._ensure_worker()
+        request = _PendingRequest(texts=list(texts))
+        self._queue.put(request)
+        request.done.wait()
+
+        if request.error is not None:
+            raise request.error
+        return request.embeddings  # type: ignore
+
+    def __call__(self, input: list[str]) -> list[Any]:
+        """Allow the service to be used wherever an embedding function is."""
+        return self.embed(input)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Get batching throughput and latency statistics.
+
+        Returns:
+            Dictionary with request/text/batch totals, average and max batch
+            size, requests per second and latency percentiles (ms) over the
+            recent window
+        """
+        with self._metrics_lock:
+            latencies = sorted(self._latencies)
+            completions = list(self._completions)
+            total_requests = self._total_requests
+            total_texts = self._total_texts
+            total_batches = self._total_batches
+            max_batch = self._max_observed_batch
+
+        throughput = 0.0
+        if len(completions) > 1:
+            elapsed = completions[-1] - completions[0]
+            if elapsed > 0:
+                throughput = (len(completions) - 1) / elapsed
+
+        return {
+            "total_requests": total_requests,
+            "total_texts": total_texts,
+            "total_batches": total_batches,
+            "avg_batch_size": round(total_texts / total_batches, 2) if total_batches else 0.0,
+            "max_batch_size": max_batch,
+            "requests_per_second": round(throughput, 2),
+            "queue_depth": self._queue.qsize(),
+            "latency_ms": {
+                "p50": _percentile(latencies, 50),
+                "p95": _percentile(latencies, 95),
+                "p99": _percentile(latencies, 99),
+            },
+            "config": {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000,
+            },
+        }
+
+    # Private helper methods
+
+    def _ensure_worker(self) -> None:
+        """Start the batching worker thread on first use."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="embedding-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        """Worker loop: gather a batch, embed it, hand results back."""
+        while True:
+            first = self._queue.get()
+            batch = [first]
+            size = len(first.texts)
+            deadline = first.enqueued_at + self.max_wait
+
+            while size < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    if remaining > 0:
+                        request = self._queue.get(timeout=remaining)
+                    else:
+                        request = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(request)
+                size += len(request.texts)
+
+            self._process(batch, size)
+
+    def _process(self, batch: list[_PendingRequest], size: int) -> None:
+        """Embed one batch and distribute the embeddings."""
+        texts = [text for request in batch for text in request.texts]
+
+        try:
+            embeddings = list(self.embedding_fn(texts))
+            offset = 0
+            for request in batch:
+                request.embeddings = embeddings[offset:offset + len(request.texts)]
+                offset += len(request.texts)
+        except Exception as e:
+            logger.error("batched_embedding_error", batch_size=size, error=str(e))
+            for request in batch:
+                request.error = e
+
+        now = time.perf_counter()
+        with self._metrics_lock:
+            self._total_batches += 1
+            self._total_requests += len(batch)
+            self._total_texts += size
+            self._max_observed_batch = max(self._max_observed_batch, size)
+            for request in batch:
+                self._latencies.append((now - request.enqueued_at) * 1000)
+                self._completions.append(now)
+
+        for request in batch:
+            request.done.set()
+
+
+def _percentile(sorted_values: list[float], percentile: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percentile / 100 * len(sorted_values)), 1)
+    return round(sorted_values[rank - 1], 2)
@@ -0,0 +1,294 @@
+"""
+PDF Extraction Pool
+
+Supervised worker processes for PDF text extraction. A pathological PDF can
+make pypdf spin or allocate without bound; running extraction in separate
+processes with a wall-clock timeout and an address-space limit keeps that
+away from the API process. Workers that time out, crash or grow too large
+are killed and replaced, and healthy workers are recycled after a fixed
+number of documents.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from app.config import settings
+from app.utils.pdf_worker import (
+    ERROR_CRASHED,
+    ERROR_MEMORY,
+    ERROR_TIMEOUT,
+    worker_main,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class ExtractionError(Exception):
+    """Structured failure from the extraction pool."""
+
+    def __init__(self, code: str, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+    def to_dict(self) -> dict[str, str]:
+        """Error as a JSON-serializable dictionary."""
+        return {"code": self.code, "message": self.message}
+
+
+class _Worker:
+    """One extraction process and the supervisor's end of its pipe."""
+
+    def __init__(self, ctx: Any, max_memory_mb: int):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=worker_main,
+            args=(child_conn, max_memory_mb),
+            name="pdf-extractor",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self) -> None:
+        """Kill the worker immediately."""
+        self.process.kill()
+        self.process.join(timeout=1)
+        self.conn.close()
+
+
+class ExtractionPool:
+    """
+    Pool of sandboxed PDF extraction processes.
+
+    Each document is handed to one idle worker; the calling thread waits at
+    most timeout seconds for the result. Workers are spawned on demand and
+    replaced after a timeout, a crash, a memory error, a peak RSS above
+    max_memory_mb or max_tasks_per_worker documents.
+
+    Example usage:
+        pool = ExtractionPool(max_workers=2, timeout=60)
+        try:
+            text, metadata = await pool.extract_async(file_path)
+        except ExtractionError as e:
+            print(e.code, e.message)
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        max_memory_mb: int | None = None,
+        max_tasks_per_worker: int | None = None,
+    ):
+        """
+        Initialize the pool (no processes are started until needed).
+
+        Args:
+            max_workers: Concurrent extraction processes (default: config.extraction_workers)
+            timeout: Per-document wall-clock limit in seconds (default: config.extraction_timeout)
+            max_memory_mb: Per-worker memory limit, 0 for none (default: config.extraction_max_memory_mb)
+            max_tasks_per_worker: Documents before a worker is recycled
+                                 (default: config.extraction_max_tasks_per_worker)
+        """
+        self.max_workers = max_workers or settings.extraction_workers
+        self.timeout = timeout or settings.extraction_timeout
+        self.max_memory_mb = (
+            settings.extraction_max_memory_mb if max_memory_mb is None else max_memory_mb
+        )
+        self.max_tasks_per_worker = max_tasks_per_worker or settings.extraction_max_tasks_per_worker
+
+        # spawn: never fork a process that is running threads
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: list[_Worker] = []
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="pdf-extraction"
+        )
+
+        self._stats = {"completed": 0, "failed": 0, "timeouts": 0, "crashes": 0, "recycled": 0}
+
+    def extract(
+        self,
+        pdf_path: str | Path,
+        max_pages: int | None = None,
+        max_chars: int | None = None,
+        sha256: str | None = None,
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Extract text and metadata from a PDF in a worker process.
+
+        Args:
+            pdf_path: Path to PDF file
+            max_pages: Only extract the first max_pages pages
+            max_chars: Stop after this many characters of text
+            sha256: SHA-256 of the file, if already known (the worker
+                    otherwise hashes it for the extraction cache)
+
+        Returns:
+            Tuple of (text, metadata) as returned by extract_pdf
+
+        Raises:
+            ExtractionError: On timeout, memory limit, worker crash or an
+                            unreadable PDF
+        """
+        with self._slots:
+            worker = self._checkout()
+            healthy = False
+            try:
+                try:
+                    worker.conn.send((str(pdf_path), max_pages, max_chars, sha256))
+                    if not worker.conn.poll(self.timeout):
+                        self._count("timeouts")
+                        logger.warning(
+                            "pdf_extraction_timeout", file=str(pdf_path), timeout=self.timeout
+                        )
+                        raise ExtractionError(
+                            ERROR_TIMEOUT, f"Extraction took longer than {self.timeout}s"
+                        )
+                    reply = worker.conn.recv()
+                except (EOFError, OSError):
+                    self._count("crashes")
+                    logger.error(
+                        "pdf_extraction_worker_crashed",
+                        file=str(pdf_path),
+                        exitcode=worker.process.exitcode,
+                    )
+                    raise ExtractionError(ERROR_CRASHED, "Extraction worker exited unexpectedly")
+
+                worker.tasks += 1
+                healthy = (
+                    reply.get("code") != ERROR_MEMORY
+                    and not (self.max_memory_mb and reply["rss_mb"] > self.max_memory_mb)
+                    and worker.tasks < self.max_tasks_per_worker
+                )
+
+                if not reply["ok"]:
+                    logger.warning(
+                        "pdf_extraction_failed",
+                        file=str(pdf_path),
+                        code=reply["code"],
+                        error=reply["message"],
+                    )
+                    raise ExtractionError(reply["code"], reply["message"])
+
+                self._count("completed")
+                return reply["text"], reply["metadata"]
+
+            except ExtractionError:
+                self._count("failed")
+                raise
+            finally:
+                self._checkin(worker, healthy)
+
+    async def extract_async(
+        self,
+        pdf_path: str | Path,
+        max_pages: int | None = None,
+        max_chars: int | None = None,
+        sha256: str | None = None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Extract without blocking the event loop (see extract)."""
+        future = self._executor.submit(self.extract, pdf_path, max_pages, max_chars, sha256)
+        return await asyncio.wrap_future(future)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with max_workers, idle_workers, completed, failed,
+            timeouts, crashes and recycled
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "idle_workers": len(self._idle),
+                **self._stats,
+            }
+
+    def close(self) -> None:
+        """Stop all idle workers; busy ones stop when their document finishes."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+        self._executor.shutdown(wait=False)
+
+    # Private helper methods
+
+    def _checkout(self) -> _Worker:
+        """Take an idle worker, or start one (caller holds a slot)."""
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.is_alive():
+                    return worker
+                worker.conn.close()
+        return _Worker(self._ctx, self.max_memory_mb)
+
+    def _checkin(self, worker: _Worker, healthy: bool) -> None:
+        """Return a worker to the idle list, or retire it."""
+        if healthy:
+            with self._lock:
+                if not self._closed:
+                    self._idle.append(worker)
+                    return
+            worker.stop()
+            return
+
+        self._count("recycled")
+        worker.kill()
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+
+# Singleton instance for application-wide use
+_extraction_pool_instance: ExtractionPool | None = None
+
+
+def get_extraction_pool() -> ExtractionPool:
+    """
+    Get or create the global ExtractionPool.
+
+    Returns:
+        ExtractionPool singleton instance
+    """
+    global _extraction_pool_instance
+
+    if _extraction_pool_instance is None:
+        _extraction_pool_instance = ExtractionPool()
+
+    return _extraction_pool_instance
+
+
+def shutdown_extraction_pool() -> None:
+    """Stop the global ExtractionPool's workers."""
+    global _extraction_pool_instance
+
+    if _extraction_pool_instance is not None:
+        _extraction_pool_instance.close()
+        _extraction_pool_instance = None
@@ -0,0 +1,358 @@
+"""
+Ingest Manifest
+
+SQLite record of which PDFs have been indexed, stored alongside ChromaDB.
+Each entry holds the file's path, size, mtime and SHA-256 plus the paper
+ID it was indexed under, so bulk ingestion can skip unchanged files and
+clean up after removed ones.
+
+Ingestion runs are checkpointed here too: every committed batch is
+recorded in the same transaction as its files, and failed files are kept
+until they are indexed successfully, so an interrupted run can be resumed
+and failures retried on their own.
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from app.utils.extraction_cache import file_sha256
+
+logger = structlog.get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    sha256 TEXT NOT NULL,
+    paper_id TEXT NOT NULL,
+    indexed_at REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    status TEXT NOT NULL,
+    total_files INTEGER NOT NULL,
+    committed_batches INTEGER NOT NULL DEFAULT 0,
+    committed_files INTEGER NOT NULL DEFAULT 0,
+    started_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS run_files (
+    run_id INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, path)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS failures (
+    path TEXT PRIMARY KEY,
+    error TEXT NOT NULL,
+    failed_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Run status values
+RUN_RUNNING = "running"
+RUN_COMPLETED = "completed"
+RUN_ABANDONED = "abandoned"
+
+
+@dataclass
+class ManifestEntry:
+    """Indexed state of one file."""
+    path: str
+    size: int
+    mtime: float
+    sha256: str
+    paper_id: str
+
+
+@dataclass
+class ManifestDiff:
+    """Files grouped by what an incremental run has to do with them."""
+    new: list[ManifestEntry] = field(default_factory=list)
+    changed: list[ManifestEntry] = field(default_factory=list)
+    unchanged: list[ManifestEntry] = field(default_factory=list)
+    removed: list[ManifestEntry] = field(default_factory=list)
+
+    @property
+    def to_index(self) -> list[ManifestEntry]:
+        """New and changed files, which need extracting and embedding."""
+        return self.new + self.changed
+
+
+class IngestManifest:
+    """
+    Tracks indexed files for incremental re-indexing.
+
+    Example usage:
+        manifest = IngestManifest(storage_path / "ingest_manifest.sqlite3")
+        diff = manifest.diff(pdf_files)
+        run_id = manifest.start_run([e.path for e in diff.to_index])
+        # ... index diff.to_index in batches, delete diff.removed ...
+        manifest.commit_batch(run_id, batch_entries)
+        manifest.finish_run(run_id)
+    """
+
+    def __init__(self, db_path: str | Path):
+        """
+        Open or create the manifest.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    @property
+    def embedding_model(self) -> str | None:
+        """Embedding model the indexed files were embedded with."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'embedding_model'"
+            ).fetchone()
+        return row[0] if row else None
+
+    @embedding_model.setter
+    def embedding_model(self, model: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('embedding_model', ?)",
+                (model,),
+            )
+
+    def count(self) -> int:
+        """Number of indexed files."""
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0])
+
+    def get(self, path: str | Path) -> ManifestEntry | None:
+        """Get the indexed state of a file, or None if not indexed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path, size, mtime, sha256, paper_id FROM files WHERE path = ?",
+                (_key(path),),
+            ).fetchone()
+        return ManifestEntry(*row) if row else None
+
+    def entry_for(self, path: Path, paper_id=lambda path: path.stem) -> ManifestEntry:
+        """Describe a file's current state (stat and content hash)."""
+        stat = path.stat()
+        return ManifestEntry(
+            path=_key(path),
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            sha256=file_sha256(path),
+            paper_id=paper_id(path),
+        )
+
+    def diff(self, files: list[Path], paper_id=lambda path: path.stem) -> ManifestDiff:
+        """
+        Compare files on disk with the manifest.
+
+        Files whose size and mtime match are unchanged without being read.
+        Otherwise the content hash decides, so touched-but-identical files
+        are not re-indexed.
+
+        Args:
+            files: Files currently present
+            paper_id: Function mapping a file path to its paper ID
+
+        Returns:
+            ManifestDiff with new, changed, unchanged and removed entries
+            (new/changed entries carry the current size, mtime and hash)
+        """
+        with self._lock:
+            indexed = {
+                row[0]: ManifestEntry(*row)
+                for row in self._conn.execute(
+                    "SELECT path, size, mtime, sha256, paper_id FROM files"
+                )
+            }
+
+        diff = ManifestDiff()
+        for path in files:
+            key = _key(path)
+            stat = path.stat()
+            previous = indexed.pop(key, None)
+
+            if previous and previous.size == stat.st_size and previous.mtime == stat.st_mtime:
+                diff.unchanged.append(previous)
+                continue
+
+            entry = self.entry_for(path, paper_id)
+            if previous is None:
+                diff.new.append(entry)
+            elif previous.sha256 == entry.sha256:
+                # Touched but identical: refresh the stat fields only
+                self.record([entry])
+                diff.unchanged.append(entry)
+            else:
+                diff.changed.append(entry)
+
+        diff.removed = list(indexed.values())
+        return diff
+
+    def record(self, entries: list[ManifestEntry]) -> None:
+        """Mark files as indexed in their current state."""
+        with self._lock, self._conn:
+            self._record(entries)
+
+    # Checkpointed runs
+
+    def start_run(self, paths: list[str]) -> int:
+        """
+        Start a checkpointed ingestion run.
+
+        Only the latest run can be resumed, so any earlier unfinished run
+        is marked abandoned.
+
+        Args:
+            paths: Files the run will index
+
+        Returns:
+            Run ID
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE runs SET status = ?, updated_at = ? WHERE status = ?",
+                (RUN_ABANDONED, now, RUN_RUNNING),
+            )
+            self._conn.execute("DELETE FROM run_files")
+            cursor = self._conn.execute(
+                "INSERT INTO runs (status, total_files, started_at, updated_at) VALUES (?, ?, ?, ?)",
+                (RUN_RUNNING, len(paths), now, now),
+            )
+            run_id = int(cursor.lastrowid)  # type: ignore
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO run_files (run_id, path) VALUES (?, ?)",
+                [(run_id, _key(path)) for path in paths],
+            )
+        logger.info("ingest_run_started", run_id=run_id, total_files=len(paths))
+        return run_id
+
+    def commit_batch(self, run_id: int, entries: list[ManifestEntry]) -> None:
+        """
+        Checkpoint a batch that has been written to the vector store.
+
+        The files, the run's progress and cleared failures are updated in
+        one transaction.
+        """
+        paths = [(e.path,) for e in entries]
+        with self._lock, self._conn:
+            self._record(entries)
+            self._conn.executemany(
+                "UPDATE run_files SET done = 1 WHERE run_id = ? AND path = ?",
+                [(run_id, e.path) for e in entries],
+            )
+            self._conn.executemany("DELETE FROM failures WHERE path = ?", paths)
+            self._conn.execute(
+                "UPDATE runs SET committed_batches = committed_batches + 1, "
+                "committed_files = committed_files + ?, updated_at = ? WHERE id = ?",
+                (len(entries), time.time(), run_id),
+            )
+
+    def record_failure(self, path: str | Path, error: str) -> None:
+        """Remember a file that could not be indexed."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO failures (path, error, failed_at) VALUES (?, ?, ?)",
+                (_key(path), error, time.time()),
+            )
+
+    def finish_run(self, run_id: int) -> None:
+        """Mark a run as completed; it will no longer be resumed."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE runs SET status = ?, updated_at = ? WHERE id = ?",
+                (RUN_COMPLETED, time.time(), run_id),
+            )
+            self._conn.execute("DELETE FROM run_files WHERE run_id = ?", (run_id,))
+
+    def last_run(self) -> dict[str, Any] | None:
+        """
+        Get the most recent run.
+
+        Returns:
+            Dictionary with id, status, total_files, committed_batches,
+            committed_files, started_at and updated_at, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, status, total_files, committed_batches, committed_files, "
+                "started_at, updated_at FROM runs ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ("id", "status", "total_files", "committed_batches",
+                "committed_files", "started_at", "updated_at")
+        return dict(zip(keys, row))
+
+    def pending_paths(self, run_id: int) -> list[str]:
+        """Files of a run that have not been committed yet."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM run_files WHERE run_id = ? AND done = 0 ORDER BY path",
+                (run_id,),
+            ).fetchall()
+        return [path for (path,) in rows]
+
+    def failures(self) -> dict[str, str]:
+        """Files that failed to index, mapped to their last error."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, error FROM failures ORDER BY path"
+            ).fetchall()
+        return dict(rows)
+
+    def remove(self, paths: list[str]) -> None:
+        """Forget files."""
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in paths])
+
+    def clear(self) -> None:
+        """Forget all files, runs, failures and the recorded embedding model."""
+        with self._lock, self._conn:
+            for table in ("files", "meta", "runs", "run_files", "failures"):
+                self._conn.execute(f"DELETE FROM {table}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # Private helper methods
+
+    def _record(self, entries: list[ManifestEntry]) -> None:
+        """Upsert file rows (caller holds the lock and transaction)."""
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO files (path, size, mtime, sha256, paper_id, indexed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(e.path, e.size, e.mtime, e.sha256, e.paper_id, now) for e in entries],
+        )
+
+
+def _key(path: str | Path) -> str:
+    """Manifest key for a path (absolute, so reruns from any cwd match)."""
+    return str(Path(path).absolute())
@@ -0,0 +1,287 @@
+"""
+Keyword Index Service
+
+Persistent BM25 inverted index stored in SQLite alongside the vector store.
+Keeps a term dictionary, postings lists and document lengths so keyword
+queries only touch the postings of the query terms.
+"""
+
+import heapq
+import math
+import re
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# BM25 parameters (standard defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Title terms count this many times toward term frequency
+TITLE_WEIGHT = 5
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that "
+    "the this to was were which with we our".split()
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    tf REAL NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_postings_doc ON postings (doc_id);
+
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id TEXT PRIMARY KEY,
+    length REAL NOT NULL,
+    year INTEGER,
+    source TEXT
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS stats (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase alphanumeric terms, dropping stopwords.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms in order of appearance
+    """
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+class KeywordIndex:
+    """
+    BM25 keyword index backed by SQLite.
+
+    Documents are indexed incrementally; corpus statistics (document
+    count and total length) are maintained on every write so scoring
+    never scans the whole corpus.
+    """
+
+    def __init__(self, db_path: str | Path):
+        """
+        Open or create the index.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def count(self) -> int:
+        """Return the number of indexed documents."""
+        with self._lock:
+            return int(self._get_stat("doc_count"))
+
+    def add_documents(self, documents: list[dict[str, Any]]) -> int:
+        """
+        Index documents, replacing any existing entries with the same ID.
+
+        Args:
+            documents: List of dictionaries with keys:
+                      - id: Document identifier
+                      - title: Title text (weighted by TITLE_WEIGHT)
+                      - text: Body text
+                      - year: Publication year (optional, for filtering)
+                      - source: Data source (optional, for filtering)
+
+        Returns:
+            Number of documents indexed
+        """
+        if not documents:
+            return 0
+
+        with self._lock, self._conn:
+            for doc in documents:
+                doc_id = str(doc["id"])
+                self._remove(doc_id)
+
+                tf: Counter[str] = Counter(tokenize(doc.get("text", "")))
+                for term in tokenize(doc.get("title", "")):
+                    tf[term] += TITLE_WEIGHT
+                length = float(sum(tf.values()))
+
+                year = doc.get("year")
+                self._conn.execute(
+                    "INSERT INTO documents (doc_id, length, year, source) VALUES (?, ?, ?, ?)",
+                    (doc_id, length, int(year) if year is not None else None, doc.get("source")),
+                )
+                self._conn.executemany(
+                    "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                    [(term, doc_id, float(freq)) for term, freq in tf.items()],
+                )
+                self._conn.executemany(
+                    "INSERT INTO terms (term, df) VALUES (?, 1) "
+                    "ON CONFLICT(term) DO UPDATE SET df = df + 1",
+                    [(term,) for term in tf],
+                )
+                self._add_stat("doc_count", 1)
+                self._add_stat("total_length", length)
+
+        logger.info("keyword_index_updated", added=len(documents))
+        return len(documents)
+
+    def remove_document(self, doc_id: str) -> bool:
+        """
+        Remove a document from the index.
+
+        Args:
+            doc_id: Document identifier
+
+        Returns:
+            True if the document was indexed, False otherwise
+        """
+        with self._lock, self._conn:
+            return self._remove(str(doc_id))
+
+    def clear(self) -> None:
+        """Remove all documents from the index."""
+        with self._lock, self._conn:
+            for table in ("terms", "postings", "documents", "stats"):
+                self._conn.execute(f"DELETE FROM {table}")
+
+    def search(
+        self,
+        query: str,
+        n_results: int = 10,
+        filters: dict[str, Any] | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Score documents against a query with BM25.
+
+        Args:
+            query: Search terms
+            n_results: Maximum number of results
+            filters: Optional filters (year_min, year_max, source)
+
+        Returns:
+            List of (document ID, BM25 score) tuples, best first
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+
+        conditions, params = self._filter_clause(filters or {})
+
+        with self._lock:
+            doc_count = self._get_stat("doc_count")
+            if doc_count == 0:
+                return []
+            avg_length = self._get_stat("total_length") / doc_count
+
+            scores: dict[str, float] = {}
+            for term in terms:
+                row = self._conn.execute(
+                    "SELECT df FROM terms WHERE term = ?", (term,)
+                ).fetchone()
+                if row is None:
+                    continue
+
+                df = row[0]
+                idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+
+                postings = self._conn.execute(
+                    "SELECT p.doc_id, p.tf, d.length FROM postings p "
+                    "JOIN documents d ON d.doc_id = p.doc_id "
+                    f"WHERE p.term = ?{conditions}",
+                    (term, *params),
+                )
+                for doc_id, tf, length in postings:
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                    score = idf * tf * (BM25_K1 + 1) / (tf + norm)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + score
+
+        return heapq.nlargest(n_results, scores.items(), key=lambda item: item[1])
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # Private helper methods
+
+    def _remove(self, doc_id: str) -> bool:
+        """Remove a document's postings and update statistics (lock held)."""
+        row = self._conn.execute(
+            "SELECT length FROM documents WHERE doc_id = ?", (doc_id,)
+        ).fetchone()
+        if row is None:
+            return False
+
+        terms = [
+            (term,) for (term,) in self._conn.execute(
+                "SELECT term FROM postings WHERE doc_id = ?", (doc_id,)
+            )
+        ]
+        self._conn.executemany("UPDATE terms SET df = df - 1 WHERE term = ?", terms)
+        self._conn.execute("DELETE FROM terms WHERE df <= 0")
+        self._conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        self._conn.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,))
+        self._add_stat("doc_count", -1)
+        self._add_stat("total_length", -row[0])
+        return True
+
+    def _get_stat(self, key: str) -> float:
+        row = self._conn.execute("SELECT value FROM stats WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0.0
+
+    def _add_stat(self, key: str, delta: float) -> None:
+        self._conn.execute(
+            "INSERT INTO stats (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value",
+            (key, delta),
+        )
+
+    @staticmethod
+    def _filter_clause(filters: dict[str, Any]) -> tuple[str, list[Any]]:
+        """Build SQL conditions on the documents table from search filters."""
+        conditions = []
+        params: list[Any] = []
+
+        if "year" in filters:
+            conditions.append("d.year = ?")
+            params.append(int(filters["year"]))
+        if "year_min" in filters:
+            conditions.append("d.year >= ?")
+            params.append(int(filters["year_min"]))
+        if "year_max" in filters:
+            conditions.append("d.year <= ?")
+            params.append(int(filters["year_max"]))
+        if "source" in filters:
+            conditions.append("d.source = ?")
+            params.append(filters["source"])
+
+        clause = "".join(f" AND {condition}" for condition in conditions)
+        return clause, params
@@ -0,0 +1,157 @@
+"""
+Query Cache
+
+Byte-bounded LRU cache used by VectorDatabase for query embeddings and
+search results. Entries are evicted least-recently-used first once the
+configured byte budget is exceeded.
+"""
+
+import copy
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate the memory footprint of a cached value in bytes.
+
+    Arrays report their buffer size; everything else is measured by its
+    JSON encoding, which tracks the text and metadata that dominate search
+    results.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, (list, tuple)) and value and all(
+        isinstance(getattr(item, "nbytes", None), int) for item in value
+    ):
+        return sum(item.nbytes for item in value)
+    return len(json.dumps(value, default=str))
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache with a byte budget and hit-rate statistics.
+
+    Values are deep-copied on the way in and out so callers can mutate
+    what they get back without corrupting the cache.
+
+    Example usage:
+        cache = LRUCache(max_bytes=16 * 1024 * 1024)
+        cache.put(("all-MiniLM-L6-v2", "CRISPR"), embedding)
+        embedding = cache.get(("all-MiniLM-L6-v2", "CRISPR"))
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        sizeof: Callable[[Any], int] = estimate_size,
+        copy_values: bool = True,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Byte budget; 0 disables the cache
+            sizeof: Function estimating the size of a value in bytes
+            copy_values: Deep-copy values on put and get
+        """
+        self.max_bytes = max(max_bytes, 0)
+        self.sizeof = sizeof
+        self.copy_values = copy_values
+
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.max_bytes > 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Look up a value and mark it as recently used.
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            value = entry[0]
+
+        return copy.deepcopy(value) if self.copy_values else value
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """
+        Store a value, evicting least-recently-used entries as needed.
+
+        Returns:
+            True if stored; False if the cache is disabled or the value
+            alone exceeds the byte budget
+        """
+        if not self.enabled:
+            return False
+
+        size = self.sizeof(value)
+        if size > self.max_bytes:
+            return False
+
+        if self.copy_values:
+            value = copy.deepcopy(value)
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            self._entries[key] = (value, size)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+        return True
+
+    def clear(self) -> None:
+        """Drop all entries (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache occupancy and hit-rate statistics.
+
+        Returns:
+            Dictionary with entries, bytes, max_bytes, hits, misses,
+            evictions and hit_rate
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,214 @@
+"""
+Storage Ledger
+
+In-memory accounting of bytes and files under the document storage
+directory. Uploads and deletes update it as they happen; a background
+thread periodically rescans the directory to correct any drift, so stats
+requests never walk the filesystem.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class StorageLedger:
+    """
+    Tracks storage usage per document.
+
+    Files are attributed to the document ID that prefixes their name
+    ("<document_id>.pdf", "<document_id>.txt.gz", ...), or, for
+    content-addressed blobs ("<sha256>.pdf"), to the document that owns
+    them according to the owners callback.
+
+    Example usage:
+        ledger = StorageLedger("./data/documents")
+        ledger.record(document_id, file_path)
+        print(ledger.get_stats()["bytes"])
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        reconcile_interval: float = 300.0,
+        owners: Callable[[], dict[str, str]] | None = None,
+    ):
+        """
+        Initialize the ledger.
+
+        Args:
+            root: Document storage directory
+            reconcile_interval: Seconds between background rescans
+            owners: Returns a mapping of file name prefixes (such as blob
+                    hashes) to the document IDs that own them
+        """
+        self.root = Path(root)
+        self.reconcile_interval = reconcile_interval
+        self.owners = owners
+
+        self._usage: dict[str, tuple[int, int]] = {}
+        self._bytes = 0
+        self._files = 0
+        self._lock = threading.Lock()
+        self._last_reconciled: float | None = None
+
+        self._stop = threading.Event()
+        self._worker: threading.Thread | None = None
+
+    def record(self, document_id: str, *paths: str | Path) -> None:
+        """
+        Add files written for a document.
+
+        Args:
+            document_id: Document the files belong to
+            paths: Files that were just written
+        """
+        added_bytes = 0
+        added_files = 0
+        for path in paths:
+            try:
+                added_bytes += Path(path).stat().st_size
+                added_files += 1
+            except OSError:
+                logger.warning("storage_ledger_stat_failed", path=str(path))
+
+        with self._lock:
+            used_bytes, used_files = self._usage.get(document_id, (0, 0))
+            self._usage[document_id] = (used_bytes + added_bytes, used_files + added_files)
+            self._bytes += added_bytes
+            self._files += added_files
+
+    def release(self, document_id: str) -> None:
+        """Forget all files of a deleted document."""
+        with self._lock:
+            used_bytes, used_files = self._usage.pop(document_id, (0, 0))
+            self._bytes -= used_bytes
+            self._files -= used_files
+
+    def usage(self, document_id: str) -> dict[str, int]:
+        """
+        Get storage used by one document.
+
+        Returns:
+            Dictionary with bytes and files
+        """
+        with self._lock:
+            used_bytes, used_files = self._usage.get(document_id, (0, 0))
+        return {"bytes": used_bytes, "files": used_files}
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get storage totals from memory.
+
+        Never scans the directory, so it is safe to call from async code.
+        Until the first reconciliation (started by start() at application
+        startup) has finished, totals only cover files recorded since and
+        last_reconciled is None.
+
+        Returns:
+            Dictionary with bytes, files, documents and last_reconciled
+            (Unix timestamp, or None before the first scan)
+        """
+        with self._lock:
+            return {
+                "bytes": self._bytes,
+                "files": self._files,
+                "documents": len(self._usage),
+                "last_reconciled": self._last_reconciled,
+            }
+
+    def reconcile(self) -> None:
+        """Rescan the storage directory and replace the in-memory totals."""
+        started = time.perf_counter()
+        usage: dict[str, tuple[int, int]] = {}
+        owners = self.owners() if self.owners else {}
+
+        if self.root.exists():
+            for path in self.root.rglob("*"):
+                try:
+                    if not path.is_file():
+                        continue
+                    size = path.stat().st_size
+                except OSError:
+                    # Removed while scanning
+                    continue
+                prefix = path.name.split(".", 1)[0]
+                document_id = owners.get(prefix, prefix)
+                used_bytes, used_files = usage.get(document_id, (0, 0))
+                usage[document_id] = (used_bytes + size, used_files + 1)
+
+        with self._lock:
+            drift = sum(b for b, _ in usage.values()) - self._bytes
+            self._usage = usage
+            self._bytes = sum(b for b, _ in usage.values())
+            self._files = sum(f for _, f in usage.values())
+            self._last_reconciled = time.time()
+
+        logger.info(
+            "storage_ledger_reconciled",
+            documents=len(usage),
+            bytes=self._bytes,
+            drift_bytes=drift,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+
+    def start(self) -> None:
+        """Start periodic background reconciliation."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(
+            target=self._run, name="storage-ledger", daemon=True
+        )
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Stop background reconciliation."""
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join(timeout=5)
+            self._worker = None
+
+    # Private helper methods
+
+    def _run(self) -> None:
+        """Reconcile now, then every reconcile_interval seconds until stopped."""
+        while True:
+            try:
+                self.reconcile()
+            except Exception as e:
+                logger.error("storage_ledger_reconcile_error", error=str(e))
+            if self._stop.wait(self.reconcile_interval):
+                return
+
+
+# Singleton instance for application-wide use
+_storage_ledger_instance: StorageLedger | None = None
+
+
+def get_storage_ledger() -> StorageLedger:
+    """
+    Get or create the global StorageLedger for document storage.
+
+    Returns:
+        StorageLedger singleton instance
+    """
+    global _storage_ledger_instance
+
+    if _storage_ledger_instance is None:
+        from app.services.blob_store import get_blob_store
+
+        _storage_ledger_instance = StorageLedger(
+            settings.document_storage_path,
+            reconcile_interval=settings.storage_reconcile_interval,
+            owners=lambda: get_blob_store().owners(),
+        )
+
+    return _storage_ledger_instance
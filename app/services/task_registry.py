@@ -0,0 +1,234 @@
+"""
+Processing Task Registry
+
+In-memory status of background processing tasks (uploads, syncs, ...).
+Tasks move pending → running → completed/failed; their progress is
+published on the event bus as it changes, and the most recent tasks stay
+queryable through the stats API.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any
+
+import structlog
+
+from app.config import settings
+from app.utils.event_bus import EventType, get_event_bus
+
+logger = structlog.get_logger(__name__)
+
+# Task status values
+TASK_PENDING = "pending"
+TASK_RUNNING = "running"
+TASK_COMPLETED = "completed"
+TASK_FAILED = "failed"
+TASK_STATUSES = (TASK_PENDING, TASK_RUNNING, TASK_COMPLETED, TASK_FAILED)
+
+
+class TaskRegistry:
+    """
+    Tracks background tasks for status queries and progress events.
+
+    Finished tasks beyond max_tasks are forgotten oldest first; pending and
+    running tasks are always kept.
+
+    Example usage:
+        registry = get_task_registry()
+        task_id = registry.create("upload", {"document_id": document_id})
+        await registry.start(task_id)
+        await registry.progress(task_id, 50.0, "Text extracted")
+        await registry.complete(task_id, "Document indexed")
+    """
+
+    def __init__(self, max_tasks: int = 1000):
+        """
+        Initialize the registry.
+
+        Args:
+            max_tasks: Number of tasks to retain
+        """
+        self.max_tasks = max_tasks
+        self._tasks: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, task_type: str, metadata: dict[str, Any] | None = None) -> str:
+        """
+        Register a pending task.
+
+        Args:
+            task_type: Task type ('upload', 'sync', 'embedding', ...)
+            metadata: Task-specific metadata
+
+        Returns:
+            New task ID
+        """
+        task_id = str(uuid.uuid4())
+        task = {
+            "task_id": task_id,
+            "type": task_type,
+            "status": TASK_PENDING,
+            "progress": 0.0,
+            "message": "Queued",
+            "error": None,
+            "created_at": datetime.now(),
+            "started_at": None,
+            "completed_at": None,
+            "metadata": dict(metadata or {}),
+        }
+        with self._lock:
+            self._tasks[task_id] = task
+            self._prune()
+        logger.info("task_created", task_id=task_id, type=task_type)
+        return task_id
+
+    async def start(self, task_id: str, message: str = "Processing") -> None:
+        """Mark a task as running."""
+        task = self._update(
+            task_id, status=TASK_RUNNING, message=message, started_at=datetime.now()
+        )
+        await self._publish(EventType.TASK_STARTED, task)
+
+    async def progress(self, task_id: str, progress: float, message: str, **metadata: Any) -> None:
+        """Record progress (0-100) of a running task."""
+        task = self._update(task_id, progress=progress, message=message, metadata=metadata)
+        await self._publish(EventType.TASK_PROGRESS, task)
+
+    async def complete(self, task_id: str, message: str = "Completed", **metadata: Any) -> None:
+        """Mark a task as completed."""
+        task = self._update(
+            task_id,
+            status=TASK_COMPLETED,
+            progress=100.0,
+            message=message,
+            completed_at=datetime.now(),
+            metadata=metadata,
+        )
+        await self._publish(EventType.TASK_COMPLETED, task)
+
+    async def fail(self, task_id: str, error: str, **metadata: Any) -> None:
+        """Mark a task as failed."""
+        task = self._update(
+            task_id,
+            status=TASK_FAILED,
+            message="Failed",
+            error=error,
+            completed_at=datetime.now(),
+            metadata=metadata,
+        )
+        await self._publish(EventType.TASK_ERROR, task)
+
+    def get(self, task_id: str) -> dict[str, Any] | None:
+        """
+        Get a task's current state.
+
+        Returns:
+            Task dictionary (see ProcessingTask) or None if unknown
+        """
+        with self._lock:
+            task = self._tasks.get(task_id)
+            return _copy(task) if task else None
+
+    def list(self, limit: int = 20, status: str | None = None) -> list[dict[str, Any]]:
+        """
+        List tasks, most recent first.
+
+        Args:
+            limit: Maximum number of tasks
+            status: Only tasks with this status
+
+        Returns:
+            List of task dictionaries
+        """
+        with self._lock:
+            tasks = [
+                _copy(task)
+                for task in reversed(self._tasks.values())
+                if status is None or task["status"] == status
+            ]
+        return tasks[:limit]
+
+    def counts(self) -> dict[str, int]:
+        """
+        Count retained tasks by status.
+
+        Returns:
+            Mapping of each status to its task count
+        """
+        counts = dict.fromkeys(TASK_STATUSES, 0)
+        with self._lock:
+            for task in self._tasks.values():
+                counts[task["status"]] += 1
+        return counts
+
+    # Private helper methods
+
+    def _update(self, task_id: str, metadata: dict[str, Any] | None = None, **fields: Any) -> dict[str, Any]:
+        """Apply field changes and merge metadata; returns a snapshot."""
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                raise KeyError(f"Unknown task: {task_id}")
+            task.update(fields)
+            if metadata:
+                task["metadata"].update(metadata)
+            return _copy(task)
+
+    def _prune(self) -> None:
+        """Forget the oldest finished tasks beyond max_tasks (caller holds the lock)."""
+        excess = len(self._tasks) - self.max_tasks
+        if excess <= 0:
+            return
+        for task_id in [
+            task_id
+            for task_id, task in self._tasks.items()
+            if task["status"] in (TASK_COMPLETED, TASK_FAILED)
+        ][:excess]:
+            del self._tasks[task_id]
+
+    async def _publish(self, event_type: EventType, task: dict[str, Any]) -> None:
+        """Publish a task snapshot on the event bus, if connected."""
+        try:
+            event_bus = get_event_bus()
+            if not event_bus.is_connected():
+                return
+            await event_bus.publish(
+                event_type=event_type,
+                task_id=task["task_id"],
+                data={
+                    "type": task["type"],
+                    "status": task["status"],
+                    "progress": task["progress"],
+                    "message": task["message"],
+                    "error": task["error"],
+                    "metadata": task["metadata"],
+                },
+            )
+        except Exception as e:
+            logger.warning("event_publish_failed", task_id=task["task_id"], error=str(e))
+
+
+def _copy(task: dict[str, Any]) -> dict[str, Any]:
+    """Snapshot of a task that callers can keep."""
+    return {**task, "metadata": dict(task["metadata"])}
+
+
+# Singleton instance for application-wide use
+_task_registry_instance: TaskRegistry | None = None
+
+
+def get_task_registry() -> TaskRegistry:
+    """
+    Get or create the global TaskRegistry.
+
+    Returns:
+        TaskRegistry singleton instance
+    """
+    global _task_registry_instance
+
+    if _task_registry_instance is None:
+        _task_registry_instance = TaskRegistry(max_tasks=settings.processing_task_retention)
+
+    return _task_registry_instance
@@ -0,0 +1,382 @@
+"""
+Document Text Store
+
+Full extracted text of each paper, kept outside ChromaDB. The vector
+store only holds the truncated text that is embedded; the complete text
+is written here at ingest as one compressed file per document, named by a
+hash of the document ID (text/ab/<sha1>.zst), so serving it is a single
+keyed file read instead of a collection query.
+
+Each file is a one-line JSON header followed by the compressed UTF-8
+body. The header records the codec, the body length, the byte offset of
+every page and the sections found at ingest (abstract, introduction,
+methods, ...), so a page, section or byte range is served by streaming
+through the body and keeping only the requested slice.
+"""
+
+import hashlib
+import json
+import re
+import shutil
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import structlog
+
+from app.utils.text_chunking import find_sections
+
+try:
+    import zstandard
+except ImportError:  # Optional; files are written with zlib instead
+    zstandard = None
+
+logger = structlog.get_logger(__name__)
+
+# Compression level for new files (both codecs accept 3)
+COMPRESSION_LEVEL = 3
+
+# File suffix per codec
+CODEC_SUFFIXES = {"zstd": ".zst", "zlib": ".zz"}
+
+# Decompressed bytes read at a time when streaming to a range
+READ_CHUNK = 64 * 1024
+
+
+@dataclass
+class StoredText:
+    """A document's text, or a range of it."""
+
+    text: str
+    total_bytes: int
+    page_count: int
+    start: int
+    end: int
+    sections: list[dict[str, Any]]
+
+
+class TextStore:
+    """
+    Compressed full-text store keyed by document ID.
+
+    Ranges are expressed over the UTF-8 encoding of the text; a range that
+    cuts through a multi-byte character drops the partial character.
+    Sections are located with find_sections() when the text is stored and
+    carry both character offsets (start, end) and byte offsets
+    (byte_start, byte_end).
+
+    Example usage:
+        store = TextStore("./data/chroma/text")
+        store.put(paper_id, full_text, page_offsets)
+        page_two = store.read(paper_id, pages=(2, 2)).text
+        methods = store.read(paper_id, section="methods").text
+    """
+
+    def __init__(self, root: str | Path, codec: str | None = None):
+        """
+        Open or create the store.
+
+        Args:
+            root: Directory for the text files
+            codec: 'zstd' or 'zlib' for new files (default: zstd if the
+                   zstandard package is installed)
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.codec = codec or ("zstd" if zstandard is not None else "zlib")
+        if self.codec not in CODEC_SUFFIXES:
+            raise ValueError(f"Unknown text store codec: {self.codec}")
+
+    def put(
+        self, document_id: str, text: str, page_offsets: list[int] | None = None
+    ) -> int:
+        """
+        Store a document's text, replacing any previous version.
+
+        Args:
+            document_id: Document identifier
+            text: Full text
+            page_offsets: Character offsets where each page of text starts
+
+        Returns:
+            Size of the written file in bytes
+        """
+        body = text.encode("utf-8")
+        sections = find_sections(text)
+        section_bytes = _byte_offsets(
+            text, [offset for section in sections for offset in (section["start"], section["end"])]
+        )
+        header = {
+            "id": document_id,
+            "codec": self.codec,
+            "bytes": len(body),
+            "pages": _byte_offsets(text, page_offsets or [0]),
+            "sections": [
+                {
+                    **section,
+                    "byte_start": section_bytes[2 * i],
+                    "byte_end": section_bytes[2 * i + 1],
+                }
+                for i, section in enumerate(sections)
+            ],
+        }
+        data = json.dumps(header).encode("utf-8") + b"\n" + _compress(self.codec, body)
+
+        self.delete(document_id)
+        path = self._path_for(document_id, self.codec)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part = path.with_name(path.name + ".part")
+        try:
+            part.write_bytes(data)
+            part.replace(path)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+        return len(data)
+
+    def put_many(self, documents: list[tuple[str, str, list[int] | None]]) -> int:
+        """
+        Store several documents.
+
+        Args:
+            documents: (document_id, text, page_offsets) tuples
+
+        Returns:
+            Total bytes written
+        """
+        return sum(self.put(*document) for document in documents)
+
+    def read(
+        self,
+        document_id: str,
+        pages: tuple[int, int | None] | None = None,
+        byte_range: tuple[int, int | None] | None = None,
+        section: str | None = None,
+    ) -> StoredText | None:
+        """
+        Read a document's text, or a page, byte or section range of it.
+
+        Only the requested slice is held in memory, however large the
+        document is.
+
+        Args:
+            document_id: Document identifier
+            pages: First and last page, 1-based and inclusive (last None =
+                   through the final page)
+            byte_range: First and last byte, 0-based and inclusive (last
+                        None = through the end)
+            section: Section name, e.g. 'methods' (see find_section)
+
+        Returns:
+            StoredText, or None if the document is not stored
+
+        Raises:
+            ValueError: If the range lies outside the document
+            KeyError: If the document has no such section
+        """
+        found = self._open(document_id)
+        if found is None:
+            return None
+        header, source = found
+        with source:
+            return self._read_range(header, source, pages, byte_range, section)
+
+    def get(self, document_id: str) -> str | None:
+        """Get a document's full text, or None if it is not stored."""
+        stored = self.read(document_id)
+        return stored.text if stored else None
+
+    def contains(self, document_id: str) -> bool:
+        """Check whether a document's text is stored."""
+        return any(
+            self._path_for(document_id, codec).exists() for codec in CODEC_SUFFIXES
+        )
+
+    def delete(self, document_id: str) -> bool:
+        """
+        Delete a document's text.
+
+        Returns:
+            True if a file was deleted
+        """
+        deleted = False
+        for codec in CODEC_SUFFIXES:
+            path = self._path_for(document_id, codec)
+            if path.exists():
+                path.unlink(missing_ok=True)
+                deleted = True
+        return deleted
+
+    def clear(self) -> None:
+        """Delete all stored text."""
+        shutil.rmtree(self.root, ignore_errors=True)
+        self.root.mkdir(parents=True, exist_ok=True)
+        logger.info("text_store_cleared", root=str(self.root))
+
+    # Private helper methods
+
+    def _read_range(
+        self,
+        header: dict[str, Any],
+        source: BinaryIO,
+        pages: tuple[int, int | None] | None,
+        byte_range: tuple[int, int | None] | None,
+        section: str | None,
+    ) -> StoredText:
+        """Resolve the requested range against a header and stream it from source."""
+        total = header["bytes"]
+        offsets = header["pages"]
+        sections = header.get("sections", [])
+
+        start, end = 0, total
+        if section is not None:
+            found_section = find_section(sections, section)
+            if found_section is None:
+                raise KeyError(section)
+            start, end = found_section["byte_start"], found_section["byte_end"]
+        elif pages is not None:
+            first, last = pages
+            last = len(offsets) if last is None else last
+            if first < 1 or last < first or first > len(offsets):
+                raise ValueError(f"Page range {first}-{last} outside 1-{len(offsets)}")
+            start = offsets[first - 1]
+            end = offsets[last] if last < len(offsets) else total
+        elif byte_range is not None:
+            first, last = byte_range
+            if first < 0 or (last is not None and last < first) or first >= max(total, 1):
+                raise ValueError(f"Byte range {first}-{last} outside 0-{total - 1}")
+            start = first
+            end = total if last is None else min(last + 1, total)
+
+        body = _decompress(header["codec"], source, start, end)
+        return StoredText(
+            text=body.decode("utf-8", errors="ignore"),
+            total_bytes=total,
+            page_count=len(offsets),
+            start=start,
+            end=end,
+            sections=sections,
+        )
+
+    def _path_for(self, document_id: str, codec: str) -> Path:
+        """Sharded location of a document's file for a codec."""
+        name = hashlib.sha1(document_id.encode("utf-8")).hexdigest()
+        return self.root / name[:2] / f"{name}{CODEC_SUFFIXES[codec]}"
+
+    def _open(self, document_id: str) -> tuple[dict[str, Any], BinaryIO] | None:
+        """
+        Open a document's file and read its header.
+
+        Returns:
+            Tuple of (header, file positioned at the compressed body), or
+            None if the document is not stored; the caller closes the file
+        """
+        for codec in (self.codec, *CODEC_SUFFIXES):
+            try:
+                source = open(self._path_for(document_id, codec), "rb")
+            except FileNotFoundError:
+                continue
+            try:
+                return json.loads(source.readline()), source
+            except BaseException:
+                source.close()
+                raise
+        return None
+
+
+def find_section(sections: list[dict[str, Any]], name: str) -> dict[str, Any] | None:
+    """
+    Find a section by name.
+
+    Names are compared after lowercasing and joining words with
+    underscores. An exact match wins; otherwise a section whose name
+    contains the requested words (e.g. 'methods' for
+    'materials_and_methods') is returned. The first of several matching
+    sections is used.
+    """
+    wanted = re.sub(r"\s+", "_", name.strip().lower())
+    for section in sections:
+        if section["name"] == wanted:
+            return section
+    for section in sections:
+        if f"_{wanted}_" in f"_{section['name']}_":
+            return section
+    return None
+
+
+def _byte_offsets(text: str, page_offsets: list[int]) -> list[int]:
+    """Convert character offsets of page starts into UTF-8 byte offsets."""
+    offsets = []
+    position = 0
+    size = 0
+    for offset in sorted(min(max(offset, 0), len(text)) for offset in page_offsets):
+        size += len(text[position:offset].encode("utf-8"))
+        position = offset
+        offsets.append(size)
+    return offsets
+
+
+def _compress(codec: str, body: bytes) -> bytes:
+    """Compress a document body."""
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is not installed")
+        return zstandard.ZstdCompressor(level=COMPRESSION_LEVEL).compress(body)
+    return zlib.compress(body, COMPRESSION_LEVEL)
+
+
+def _decompress(codec: str, source: BinaryIO, start: int, end: int) -> bytes:
+    """
+    Decompress bytes start to end of a document body.
+
+    The compressed file is read and decompressed in chunks, and output
+    before start is discarded, so memory use is bounded by the range plus
+    one chunk of each.
+    """
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is not installed")
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            source, read_size=READ_CHUNK, closefd=False
+        )
+    else:
+        reader = _ZlibReader(source)
+
+    body = bytearray()
+    position = 0
+    with reader:
+        while position < end:
+            chunk = reader.read(min(READ_CHUNK, end - position))
+            if not chunk:
+                break
+            if position + len(chunk) > start:
+                body += chunk[max(start - position, 0):]
+            position += len(chunk)
+    return bytes(body)
+
+
+class _ZlibReader:
+    """Minimal readable stream over a zlib-compressed file."""
+
+    def __init__(self, source: BinaryIO):
+        self._source = source
+        self._decompressor = zlib.decompressobj()
+        self._tail = b""
+
+    def read(self, size: int) -> bytes:
+        while True:
+            if not self._tail and not self._decompressor.eof:
+                self._tail = self._source.read(READ_CHUNK)
+                if not self._tail:
+                    return b""
+            chunk = self._decompressor.decompress(self._tail, size)
+            self._tail = self._decompressor.unconsumed_tail
+            if chunk or self._decompressor.eof:
+                return chunk
+
+    def __enter__(self) -> "_ZlibReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
@@ -5,7 +5,11 @@ ChromaDB wrapper for semantic search and document storage.
 Uses sentence-transformers/all-MiniLM-L6-v2 for embeddings.
 """
 
+import json
 import structlog
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -14,9 +18,31 @@ from chromadb.config import Settings as ChromaSettings
 from chromadb.utils import embedding_functions
 
 from app.config import settings
+from app.services.catalog import DocumentCatalog
+from app.services.dedup_index import NearDuplicateIndex, jaccard, minhash
+from app.services.embedding_service import BatchingEmbeddingService
+from app.services.keyword_index import KeywordIndex
+from app.services.query_cache import LRUCache
+from app.services.text_store import StoredText, TextStore
+from app.utils.text_chunking import chunk_text
 
 logger = structlog.get_logger(__name__)
 
+# Companion collection holding passage-level embeddings
+CHUNK_COLLECTION_NAME = "research_papers_chunks"
+
+# Projectable paper fields and the ChromaDB include entries that load them
+PAPER_FIELDS = {"document": "documents", "metadata": "metadatas"}
+
+# Metadata a merged near-duplicate may fill in on its canonical paper
+MERGEABLE_FIELDS = ("authors", "year", "doi", "arxiv_id")
+
+# Over-fetch factor when collapsing duplicate clusters in search results
+COLLAPSE_OVERFETCH = 2
+
+# Characters of full text signed for near-duplicate detection
+DEDUP_SIGNATURE_CHARS = 50_000
+
 
 class VectorDatabase:
     """
@@ -26,13 +52,15 @@ class VectorDatabase:
     for embedding generation.
     """
 
-    def __init__(self, storage_path: str | None = None):
+    def __init__(self, storage_path: str | None = None, chunk_index: bool | None = None):
         """
         Initialize ChromaDB client.
         
         Args:
             storage_path: Path to ChromaDB storage directory.
                          Defaults to config.chroma_persist_directory.
+            chunk_index: Whether to maintain the passage-level chunk index.
+                        Defaults to config.chunk_index_enabled.
         """
         self.storage_path = Path(storage_path or settings.chroma_persist_directory)
         self.storage_path.mkdir(parents=True, exist_ok=True)
@@ -57,6 +85,13 @@ class VectorDatabase:
             model_name=settings.embedding_model
         )
 
+        # Query embeddings from concurrent searches are batched together
+        self.embedding_service = BatchingEmbeddingService(
+            self.embedding_fn,
+            max_batch_size=settings.query_embedding_batch_size,
+            max_wait_ms=settings.query_embedding_max_wait_ms,
+        )
+
         # Get or create collection
         self.collection = self.client.get_or_create_collection(
             name="research_papers",
@@ -64,10 +99,70 @@ class VectorDatabase:
             metadata={"description": "Research papers corpus for semantic search"},
         )
 
+        # Passage-level index over full text (one entry per overlapping chunk)
+        if chunk_index is None:
+            chunk_index = settings.chunk_index_enabled
+        self.chunk_collection = None
+        if chunk_index:
+            self.chunk_collection = self.client.get_or_create_collection(
+                name=CHUNK_COLLECTION_NAME,
+                embedding_function=self.embedding_fn,  # type: ignore
+                metadata={"description": "Full-text passages for semantic search"},
+            )
+
+        # Query embedding and search result caches. Result cache keys carry
+        # the write generation, which every add, delete and reset bumps.
+        self.embedding_cache = LRUCache(
+            max_bytes=settings.query_embedding_cache_bytes, copy_values=False
+        )
+        self.result_cache = LRUCache(max_bytes=settings.search_result_cache_bytes)
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+
+        # Runs the semantic leg of hybrid searches while the calling thread
+        # runs the keyword leg; one slot per async facade worker, so
+        # concurrent hybrid searches do not queue behind each other
+        self._retriever_pool = ThreadPoolExecutor(
+            max_workers=max(settings.vector_db_max_workers, 1),
+            thread_name_prefix="hybrid-search",
+        )
+
+        # Metadata catalog for listing, paging and filtered counts
+        self.catalog = DocumentCatalog(self.storage_path / "catalog.sqlite3")
+        if self.catalog.count() == 0 and self.collection.count() > 0:
+            self._rebuild_catalog()
+
+        # Compressed full text of each paper, served by get_text()
+        self.text_store = TextStore(settings.text_store_path or self.storage_path / "text")
+
+        # BM25 inverted index for keyword search
+        self.keyword_index = KeywordIndex(self.storage_path / "keyword_index.sqlite3")
+        if self.keyword_index.count() == 0 and self.collection.count() > 0:
+            self._rebuild_keyword_index()
+
+        # MinHash/LSH signatures for near-duplicate detection
+        self.dedup_index = NearDuplicateIndex(self.storage_path / "dedup_index.sqlite3")
+        if (
+            settings.near_duplicate_policy != "off"
+            and self.dedup_index.count() == 0
+            and self.collection.count() > 0
+        ):
+            self._rebuild_dedup_index()
+
+        # Chunking and embedding a whole corpus is too slow for the first
+        # request; scripts/init_vector_db.py runs backfill_passages()
+        if self._passages_pending():
+            logger.warning(
+                "passage_backfill_pending",
+                paper_count=self.collection.count(),
+                hint="run scripts/init_vector_db.py",
+            )
+
         logger.info(
             "vector_database_initialized",
             collection_name="research_papers",
             paper_count=self.collection.count(),
+            chunk_index=self.chunk_collection is not None,
         )
 
     def add_papers(self, papers: list[dict[str, Any]]) -> int:
@@ -79,12 +174,21 @@ class VectorDatabase:
                    - id: Unique paper identifier
                    - title: Paper title
                    - abstract: Paper abstract
-                   - full_text: Full paper text (optional)
+                   - full_text: Full paper text (optional; stored whole in
+                     the text store, see get_text())
                    - authors: List of author names (optional)
                    - year: Publication year (optional)
                    - source: Data source (e.g., 'local', 'pubmed')
                    - doi: DOI identifier (optional)
                    - arxiv_id: arXiv identifier (optional)
+                   - page_offsets: Character offsets where each page of
+                     full_text starts (optional, used for passage pages)
+        
+        Near-duplicates of indexed papers (or of earlier papers in the same
+        batch) are handled according to config.near_duplicate_policy:
+        "skip" leaves them out, "merge" leaves them out but fills missing
+        metadata on the canonical paper, and "link" indexes them as members
+        of the canonical paper's cluster. See duplicate_of().
         
         Returns:
             Number of papers added
@@ -96,6 +200,13 @@ class VectorDatabase:
         logger.info("adding_papers_to_vector_db", count=len(papers))
 
         try:
+            papers, signatures, aliases, merges = self._resolve_duplicates(papers)
+            if not papers:
+                self._merge_duplicates(merges)
+                for alias in aliases:
+                    self.dedup_index.add_alias(*alias)
+                return 0
+
             # Prepare data for ChromaDB
             documents = [self._prepare_text(p) for p in papers]
             metadatas = [self._extract_metadata(p) for p in papers]
@@ -108,12 +219,43 @@ class VectorDatabase:
                 ids=ids,
             )
 
+            self.catalog.upsert(list(zip(ids, metadatas)))
+
+            if self.chunk_collection is not None:
+                self._add_passages(papers)
+
+            self.keyword_index.add_documents([
+                {
+                    "id": paper_id,
+                    "title": p.get("title", ""),
+                    "text": f"{p.get('abstract', '')} {p.get('full_text', '')}",
+                    "year": metadata.get("year"),
+                    "source": metadata.get("source"),
+                }
+                for paper_id, p, metadata in zip(ids, papers, metadatas)
+            ])
+
+            self.text_store.put_many([
+                (paper_id, p["full_text"], p.get("page_offsets"))
+                for paper_id, p in zip(ids, papers)
+                if p.get("full_text")
+            ])
+
+            # Recorded only once the papers they refer to are stored
+            for signature in signatures:
+                self.dedup_index.add(*signature)
+            self._merge_duplicates(merges)
+            for alias in aliases:
+                self.dedup_index.add_alias(*alias)
+
             logger.info("papers_added_successfully", count=len(papers))
             return len(papers)
 
         except Exception as e:
             logger.error("error_adding_papers", error=str(e))
             raise
+        finally:
+            self._bump_generation()
 
     def search(
         self,
@@ -121,6 +263,8 @@ class VectorDatabase:
         n_results: int = 10,
         filters: dict[str, Any] | None = None,
         search_type: str = "semantic",
+        fields: list[str] | None = None,
+        collapse: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Search for papers using semantic or keyword search.
@@ -133,11 +277,21 @@ class VectorDatabase:
                     - year_max: Maximum publication year
                     - source: Data source filter
                     - authors: Author name filter
-            search_type: "semantic" (default) or "keyword"
+            search_type: "semantic" (default), "keyword" or "hybrid"
+            fields: Paper fields to load ("document", "metadata");
+                   defaults to both. Omitted fields are left out of results.
+            collapse: Keep only the best-ranked paper of each near-duplicate
+                     cluster (see collapse_duplicates)
         
         Returns:
             List of search results with similarity scores
         """
+        if collapse:
+            results = self.search(
+                query, n_results * COLLAPSE_OVERFETCH, filters, search_type, fields
+            )
+            return self.collapse_duplicates(results)[:n_results]
+
         logger.info(
             "searching_vector_db",
             query=query[:100],
@@ -146,48 +300,169 @@ class VectorDatabase:
             search_type=search_type,
         )
 
+        if search_type == "hybrid":
+            # Cached by hybrid_search, keyed by its fusion settings
+            return self.hybrid_search(query, n_results, filters, fields=fields)[0]
+
+        include = self._include_for(fields)
+        cache_key = self._result_cache_key(query, n_results, filters, search_type, include)
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            logger.info("search_cache_hit", results_count=len(cached))
+            return cached
+
         try:
             if search_type == "keyword":
-                return self._keyword_search(query, n_results, filters)
+                results = self._keyword_search(query, n_results, filters, fields)
+            else:
+                results = self._semantic_search(query, n_results, filters, fields)
+
+            self.result_cache.put(cache_key, results)
+            return results
+
+        except Exception as e:
+            logger.error("search_error", error=str(e))
+            raise
+
+    def _semantic_search(
+        self,
+        query: str,
+        n_results: int,
+        filters: dict[str, Any] | None = None,
+        fields: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Embedding similarity search over papers and their passages."""
+        include = self._include_for(fields)
+
+        # Build where clause
+        where = self._build_filters(filters) if filters else None
+
+        # Embed once (cached, or batched with concurrent queries) and reuse
+        # for paper and passage queries
+        query_embeddings = self._embed_queries([query])
+
+        # Perform search
+        results = self.collection.query(
+            query_embeddings=query_embeddings,
+            n_results=n_results,
+            where=where,
+            include=[*include, "distances"],  # type: ignore
+        )
+
+        # Format results
+        formatted = self._format_results(results)
+
+        # Roll passage hits up to paper-level results
+        if self.chunk_collection is not None:
+            passages = self._query_passages(query_embeddings, n_results, where)
+            formatted = self._merge_passage_hits(formatted, passages, n_results, include)
+
+        logger.info("search_completed", results_count=len(formatted))
+        return formatted
+
+    def search_many(
+        self,
+        queries: list[str],
+        n_results: int = 10,
+        filters: dict[str, Any] | None = None,
+        search_type: str = "semantic",
+        dedup: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Run several searches that share filters.
+        
+        Semantic searches embed all queries in one call and issue a single
+        multi-query request per collection. Keyword and hybrid searches run
+        each query through search().
+        
+        Args:
+            queries: Search query texts
+            n_results: Maximum number of results per query
+            filters: Optional filters applied to every query (see search)
+            search_type: "semantic" (default), "keyword" or "hybrid"
+            dedup: Keep each paper only under the query where it scored
+                   highest (earliest query wins ties)
+            fields: Paper fields to load (see search)
+        
+        Returns:
+            One result list per query, in query order
+        """
+        logger.info(
+            "searching_vector_db_batch",
+            query_count=len(queries),
+            n_results=n_results,
+            filters=filters,
+            search_type=search_type,
+            dedup=dedup,
+        )
+
+        if not queries:
+            return []
+
+        include = self._include_for(fields)
+
+        try:
+            if search_type in ("keyword", "hybrid"):
+                batches = [
+                    self.search(query, n_results, filters, search_type, fields)
+                    for query in queries
+                ]
             else:
-                # Semantic search (default)
-                # Build where clause
                 where = self._build_filters(filters) if filters else None
+                query_embeddings = self._embed_queries(queries)
 
-                # Perform search
                 results = self.collection.query(
-                    query_texts=[query],
+                    query_embeddings=query_embeddings,
                     n_results=n_results,
                     where=where,
-                    include=["documents", "metadatas", "distances"],
+                    include=[*include, "distances"],  # type: ignore
                 )
 
-                # Format results
-                formatted = self._format_results(results)
+                batches = [
+                    self._format_results(results, batch_index=i) for i in range(len(queries))
+                ]
+
+                if self.chunk_collection is not None:
+                    passages = self._query_passages_many(query_embeddings, n_results, where)
+                    batches = [
+                        self._merge_passage_hits(batch, passages[i], n_results, include)
+                        for i, batch in enumerate(batches)
+                    ]
 
-                logger.info("search_completed", results_count=len(formatted))
-                return formatted
+            if dedup:
+                batches = self._dedup_across_queries(batches)
+
+            logger.info(
+                "search_batch_completed",
+                query_count=len(queries),
+                results_count=sum(len(batch) for batch in batches),
+            )
+            return batches
 
         except Exception as e:
-            logger.error("search_error", error=str(e))
+            logger.error("search_batch_error", error=str(e))
             raise
-    
+
     def _keyword_search(
         self,
         query: str,
         n_results: int = 10,
         filters: dict[str, Any] | None = None,
+        fields: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """
-        Simple keyword-based text search.
+        BM25 keyword search over the inverted index.
         
-        Searches for query terms in document text and returns matches
-        ranked by term frequency.
+        Only the postings lists of the query terms are read; the top
+        n_results are then loaded from the collection. Scores are
+        normalized so the best match has similarity 1.0.
         
         Args:
             query: Search terms
             n_results: Maximum results to return
             filters: Optional metadata filters
+            fields: Paper fields to load (see search)
         
         Returns:
             List of matching documents with relevance scores
@@ -195,51 +470,29 @@ class VectorDatabase:
         logger.info("keyword_search", query=query, n_results=n_results)
         
         try:
-            # Get all documents (with filters if specified)
-            where = self._build_filters(filters) if filters else None
-            all_docs = self.collection.get(
-                where=where,
-                include=["documents", "metadatas"],
-            )
+            hits = self.keyword_index.search(query, n_results, filters)
             
-            if not all_docs["ids"]:
+            if not hits:
                 return []
             
-            # Score documents by keyword matches
-            query_terms = query.lower().split()
-            scored_docs = []
-            
-            for i, doc_id in enumerate(all_docs["ids"]):
-                document = all_docs["documents"][i] if all_docs["documents"] else ""
-                metadata = all_docs["metadatas"][i] if all_docs["metadatas"] else {}
-                
-                # Count term occurrences in document
-                doc_lower = document.lower()
-                score = sum(doc_lower.count(term) for term in query_terms)
-                
-                # Boost score if terms appear in title
-                title = str(metadata.get("title", "")).lower()
-                title_matches = sum(title.count(term) for term in query_terms)
-                score += title_matches * 5  # Title matches weighted higher
-                
-                if score > 0:
-                    scored_docs.append({
-                        "id": doc_id,
-                        "document": document,
-                        "metadata": metadata,
-                        "score": score,
-                    })
-            
-            # Sort by score and take top n_results
-            scored_docs.sort(key=lambda x: x["score"], reverse=True)
-            results = scored_docs[:n_results]
+            found = self.collection.get(
+                ids=[doc_id for doc_id, _ in hits],
+                include=self._include_for(fields),  # type: ignore
+            )
+            papers = {
+                paper["id"]: paper
+                for paper in self._project(found)
+            }
             
-            # Normalize scores to 0-1 range
-            if results:
-                max_score = results[0]["score"]
-                for result in results:
-                    result["similarity"] = result["score"] / max_score if max_score > 0 else 0
-                    del result["score"]
+            max_score = hits[0][1]
+            results = []
+            for doc_id, score in hits:
+                if doc_id not in papers:
+                    continue
+                results.append({
+                    **papers[doc_id],
+                    "similarity": score / max_score if max_score > 0 else 0,
+                })
             
             logger.info("keyword_search_completed", results_count=len(results))
             return results
@@ -248,8 +501,95 @@ class VectorDatabase:
             logger.error("keyword_search_error", error=str(e))
             raise
 
+    def hybrid_search(
+        self,
+        query: str,
+        n_results: int = 10,
+        filters: dict[str, Any] | None = None,
+        fusion: str | None = None,
+        depth: int | None = None,
+        fields: list[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], dict[str, float]]:
+        """
+        Run semantic and keyword search concurrently and fuse the rankings.
+        
+        Args:
+            query: Search query text
+            n_results: Maximum number of results to return
+            filters: Optional filters (see search())
+            fusion: "rrf" (reciprocal-rank fusion) or "weighted" (weighted
+                   similarity merge). Defaults to config.hybrid_fusion.
+            depth: Over-fetch factor; each retriever returns
+                  n_results * depth candidates. Defaults to
+                  config.hybrid_search_depth.
+            fields: Paper fields to load (see search)
+        
+        Fused results are kept in the result cache like other searches.
+        
+        Returns:
+            Tuple of (fused results, per-stage timings in milliseconds;
+            only cache_ms when the results came from the cache)
+        """
+        fusion = fusion or settings.hybrid_fusion
+        depth = max(depth or settings.hybrid_search_depth, 1)
+        fetch = n_results * depth
+
+        if fusion not in ("rrf", "weighted"):
+            raise ValueError(f"Unknown fusion method: {fusion}")
+
+        started = time.perf_counter()
+        cache_key = self._result_cache_key(
+            query, n_results, filters, f"hybrid:{fusion}:{depth}", self._include_for(fields)
+        )
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            logger.info("search_cache_hit", results_count=len(cached))
+            return cached, {"cache_ms": round((time.perf_counter() - started) * 1000, 2)}
+
+        logger.info(
+            "hybrid_search",
+            query=query[:100],
+            n_results=n_results,
+            fusion=fusion,
+            depth=depth,
+        )
+
+        def timed(search_type: str) -> tuple[list[dict[str, Any]], float]:
+            started = time.perf_counter()
+            results = self.search(query, fetch, filters, search_type=search_type, fields=fields)
+            return results, (time.perf_counter() - started) * 1000
+
+        try:
+            started = time.perf_counter()
+            semantic_future = self._retriever_pool.submit(timed, "semantic")
+            keyword, keyword_ms = timed("keyword")
+            semantic, semantic_ms = semantic_future.result()
+            retrieval_ms = (time.perf_counter() - started) * 1000
+
+            fusion_started = time.perf_counter()
+            fused = self._fuse_results(semantic, keyword, fusion)[:n_results]
+            fusion_ms = (time.perf_counter() - fusion_started) * 1000
+
+            timings = {
+                "semantic_ms": round(semantic_ms, 2),
+                "keyword_ms": round(keyword_ms, 2),
+                "retrieval_ms": round(retrieval_ms, 2),
+                "fusion_ms": round(fusion_ms, 2),
+            }
+
+            logger.info("hybrid_search_completed", results_count=len(fused), **timings)
+            self.result_cache.put(cache_key, fused)
+            return fused, timings
+
+        except Exception as e:
+            logger.error("hybrid_search_error", error=str(e))
+            raise
+
     def find_similar(
-        self, paper_id: str, n_results: int = 10
+        self,
+        paper_id: str,
+        n_results: int = 10,
+        fields: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Find papers similar to a given paper.
@@ -257,12 +597,15 @@ class VectorDatabase:
         Args:
             paper_id: ID of the reference paper
             n_results: Maximum number of similar papers to return
+            fields: Paper fields to load (see search)
         
         Returns:
             List of similar papers with similarity scores
         """
         logger.info("finding_similar_papers", paper_id=paper_id, n_results=n_results)
 
+        include = self._include_for(fields)
+
         try:
             # Get the paper's embedding
             paper = self.collection.get(
@@ -279,12 +622,23 @@ class VectorDatabase:
             results = self.collection.query(
                 query_embeddings=[paper["embeddings"][0]],  # type: ignore
                 n_results=n_results + 1,  # +1 to account for self
-                include=["documents", "metadatas", "distances"],
+                include=[*include, "distances"],  # type: ignore
             )
 
             # Format and filter out the source paper
             formatted = self._format_results(results, exclude_id=str(paper_id))
 
+            # Include papers whose passages resemble the source paper
+            if self.chunk_collection is not None:
+                passages = self._query_passages(
+                    [paper["embeddings"][0]],  # type: ignore
+                    n_results,
+                    exclude_id=str(paper_id),
+                )
+                formatted = self._merge_passage_hits(formatted, passages, n_results, include)
+            else:
+                formatted = formatted[:n_results]
+
             logger.info("similar_papers_found", count=len(formatted))
             return formatted
 
@@ -292,12 +646,16 @@ class VectorDatabase:
             logger.error("find_similar_error", error=str(e), paper_id=paper_id)
             raise
 
-    def get_paper(self, paper_id: str) -> dict[str, Any] | None:
+    def get_paper(
+        self, paper_id: str, fields: list[str] | None = None
+    ) -> dict[str, Any] | None:
         """
         Retrieve a single paper by ID.
         
         Args:
             paper_id: Paper identifier
+            fields: Paper fields to load ("document", "metadata");
+                   defaults to both
         
         Returns:
             Paper data or None if not found
@@ -305,17 +663,13 @@ class VectorDatabase:
         try:
             result = self.collection.get(
                 ids=[str(paper_id)],
-                include=["documents", "metadatas"],
+                include=self._include_for(fields),  # type: ignore
             )
 
             if not result["ids"]:
                 return None
 
-            return {
-                "id": result["ids"][0],
-                "document": result["documents"][0] if result["documents"] else "",
-                "metadata": result["metadatas"][0] if result["metadatas"] else {},
-            }
+            return self._project(result)[0]
 
         except Exception as e:
             logger.error("get_paper_error", error=str(e), paper_id=paper_id)
@@ -326,52 +680,84 @@ class VectorDatabase:
         limit: int = 100,
         offset: int = 0,
         filters: dict[str, Any] | None = None,
+        fields: list[str] | None = None,
     ) -> tuple[list[dict[str, Any]], int]:
         """
         Get all papers with pagination and optional filtering.
         
+        The page and the filtered total come from the catalog; document
+        text is loaded from ChromaDB for the requested page only, and not
+        at all unless "document" is among the requested fields.
+        
         Args:
             limit: Maximum number of papers to return
             offset: Number of papers to skip
-            filters: Optional filters (year, source, etc.)
+            filters: Optional filters (year, year_min, year_max, source)
+            fields: Paper fields to load ("document", "metadata");
+                   defaults to both
         
         Returns:
-            Tuple of (papers list, total count)
+            Tuple of (papers list, total count matching filters)
         """
+        include = self._include_for(fields)
+
         try:
-            # Build where clause
-            where = self._build_filters(filters) if filters else None
+            papers, total = self.list_papers(limit=limit, offset=offset, filters=filters)
             
-            # Get total count
-            total = self.collection.count()
+            if "metadatas" not in include:
+                for paper in papers:
+                    del paper["metadata"]
+            
+            if not papers or "documents" not in include:
+                return papers, total
             
-            # Get papers with pagination
-            # ChromaDB doesn't support offset/limit in get(), so we get all and slice
-            # TODO: This is inefficient for large collections, consider alternative approach
             result = self.collection.get(
-                where=where,
-                include=["documents", "metadatas"],
+                ids=[paper["id"] for paper in papers],
+                include=["documents"],
             )
+            documents = dict(zip(result["ids"], result["documents"] or []))
             
-            if not result["ids"]:
-                return [], 0
+            for paper in papers:
+                paper["document"] = documents.get(paper["id"], "")
             
-            # Apply pagination manually
-            start_idx = min(offset, len(result["ids"]))
-            end_idx = min(offset + limit, len(result["ids"]))
+            return papers, total
             
-            papers = []
-            for i in range(start_idx, end_idx):
-                papers.append({
-                    "id": result["ids"][i],
-                    "document": result["documents"][i] if result["documents"] else "",
-                    "metadata": result["metadatas"][i] if result["metadatas"] else {},
-                })
+        except Exception as e:
+            logger.error("get_all_papers_error", error=str(e))
+            raise
+
+    def list_papers(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        filters: dict[str, Any] | None = None,
+        after: tuple[str, str] | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        List paper metadata from the catalog.
+        
+        Never touches embeddings or document bodies; cost depends on the
+        page size, not the corpus size.
+        
+        Args:
+            limit: Maximum number of papers to return
+            offset: Number of papers to skip (ignored when after is set)
+            filters: Optional filters (year, year_min, year_max, source)
+            after: Optional (created_at, paper ID) position to resume after,
+                   see app.services.catalog.decode_cursor
+        
+        Returns:
+            Tuple of (papers with id and metadata, total count matching filters)
+        """
+        try:
+            rows = self.catalog.page(limit=limit, offset=offset, filters=filters, after=after)
+            total = self.catalog.count(filters)
             
+            papers = [{"id": paper_id, "metadata": metadata} for paper_id, metadata in rows]
             return papers, total
             
         except Exception as e:
-            logger.error("get_all_papers_error", error=str(e))
+            logger.error("list_papers_error", error=str(e))
             raise
 
     def delete_paper(self, paper_id: str) -> bool:
@@ -386,12 +772,84 @@ class VectorDatabase:
         """
         try:
             self.collection.delete(ids=[str(paper_id)])
+            if self.chunk_collection is not None:
+                self.chunk_collection.delete(where={"paper_id": str(paper_id)})
+            self.keyword_index.remove_document(str(paper_id))
+            self.dedup_index.remove(str(paper_id))
+            self.text_store.delete(str(paper_id))
+            self.catalog.delete(str(paper_id))
             logger.info("paper_deleted", paper_id=paper_id)
             return True
 
         except Exception as e:
             logger.error("delete_paper_error", error=str(e), paper_id=paper_id)
             raise
+        finally:
+            self._bump_generation()
+
+    def get_text(
+        self,
+        paper_id: str,
+        pages: tuple[int, int | None] | None = None,
+        byte_range: tuple[int, int | None] | None = None,
+        section: str | None = None,
+    ) -> StoredText | None:
+        """
+        Read a paper's full text, or a page, byte or section range of it.
+        
+        Args:
+            paper_id: Paper identifier
+            pages: First and last page, 1-based and inclusive
+            byte_range: First and last byte of the UTF-8 text, inclusive
+            section: Section name parsed at ingest (e.g. 'methods')
+        
+        Returns:
+            StoredText with the section outline, or None if the paper's
+            full text was not stored
+        
+        Raises:
+            ValueError: If the range lies outside the text
+            KeyError: If the paper has no such section
+        """
+        return self.text_store.read(
+            str(paper_id), pages=pages, byte_range=byte_range, section=section
+        )
+
+    def duplicate_of(self, paper_id: str) -> dict[str, Any] | None:
+        """
+        Get the canonical paper that a paper near-duplicates.
+        
+        Args:
+            paper_id: Paper identifier
+        
+        Returns:
+            Dictionary with canonical_id, similarity (estimated shingle
+            Jaccard) and policy ('skip', 'merge' or 'link'), or None
+        """
+        return self.dedup_index.duplicate_of(str(paper_id))
+
+    def collapse_duplicates(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Collapse near-duplicate clusters in a ranked result list.
+        
+        Each cluster is represented by its best-ranked member, which lists
+        the IDs of the other members found in "duplicates".
+        
+        Args:
+            results: Search results, best first
+        
+        Returns:
+            Results with one entry per cluster, in the original order
+        """
+        canonical = self.dedup_index.canonical_ids([result["id"] for result in results])
+        kept: dict[str, dict[str, Any]] = {}
+        for result in results:
+            cluster = canonical.get(result["id"], result["id"])
+            if cluster in kept:
+                kept[cluster].setdefault("duplicates", []).append(result["id"])
+            else:
+                kept[cluster] = {**result}
+        return list(kept.values())
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -402,12 +860,52 @@ class VectorDatabase:
         """
         return {
             "total_papers": self.collection.count(),
+            "total_passages": (
+                self.chunk_collection.count() if self.chunk_collection is not None else 0
+            ),
             "embedding_model": settings.embedding_model,
             "embedding_dimension": 384,  # all-MiniLM-L6-v2
             "storage_path": str(self.storage_path),
             "collection_name": "research_papers",
         }
 
+    def get_facets(self, top_authors: int = 10) -> dict[str, Any]:
+        """
+        Get exact corpus facet counts from the catalog.
+        
+        Counts are maintained on every add and delete, so the cost does
+        not depend on the corpus size.
+        
+        Args:
+            top_authors: Number of most frequent authors to return
+        
+        Returns:
+            Dictionary with by_year, by_source and top_authors
+            ([{"name", "count"}], most frequent first)
+        """
+        return {
+            "by_year": self.catalog.facet_counts("year"),
+            "by_source": self.catalog.facet_counts("source"),
+            "top_authors": [
+                {"name": name, "count": count}
+                for name, count in self.catalog.facet_counts("author", limit=top_authors).items()
+            ],
+        }
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """
+        Get query embedding and search result cache statistics.
+        
+        Returns:
+            Dictionary with per-cache stats (entries, bytes, hits, misses,
+            evictions, hit_rate) and the current write generation
+        """
+        return {
+            "query_embeddings": self.embedding_cache.get_stats(),
+            "search_results": self.result_cache.get_stats(),
+            "generation": self._generation,
+        }
+
     def reset(self) -> None:
         """
         Reset the database (delete all papers).
@@ -421,10 +919,140 @@ class VectorDatabase:
             embedding_function=self.embedding_fn,  # type: ignore
             metadata={"description": "Research papers corpus for semantic search"},
         )
+        if self.chunk_collection is not None:
+            self.client.delete_collection(name=CHUNK_COLLECTION_NAME)
+            self.chunk_collection = self.client.create_collection(
+                name=CHUNK_COLLECTION_NAME,
+                embedding_function=self.embedding_fn,  # type: ignore
+                metadata={"description": "Full-text passages for semantic search"},
+            )
+        self.keyword_index.clear()
+        self.dedup_index.clear()
+        self.text_store.clear()
+        self.catalog.clear()
+        self._bump_generation()
         logger.info("vector_database_reset_complete")
 
+    def backfill_passages(self, batch_size: int = 1000) -> int:
+        """
+        Split papers already in the collection into passages.
+        
+        Needed once for stores created before the passage index existed
+        (or with it disabled); does nothing if passages are already indexed.
+        Full text comes from the text store where it was kept; otherwise
+        only the stored (truncated) document text can be chunked, and
+        re-ingesting those papers gives them complete passage coverage.
+        
+        Args:
+            batch_size: Papers read and chunked at a time
+        
+        Returns:
+            Number of papers chunked
+        """
+        if not self._passages_pending():
+            return 0
+
+        logger.info("backfilling_passage_index", paper_count=self.collection.count())
+        offset = 0
+        try:
+            while True:
+                batch = self.collection.get(
+                    include=["documents", "metadatas"],
+                    limit=batch_size,
+                    offset=offset,
+                )
+                if not batch["ids"]:
+                    break
+                self._add_passages([
+                    {
+                        **(batch["metadatas"][i] or {}),  # type: ignore
+                        "id": doc_id,
+                        "full_text": self.text_store.get(doc_id) or batch["documents"][i] or "",  # type: ignore
+                    }
+                    for i, doc_id in enumerate(batch["ids"])
+                ])
+                offset += len(batch["ids"])
+        finally:
+            self._bump_generation()
+
+        logger.info("passage_index_backfilled", paper_count=offset)
+        return offset
+
     # Private helper methods
 
+    def _bump_generation(self) -> None:
+        """Invalidate cached search results after a write."""
+        with self._generation_lock:
+            self._generation += 1
+            self.result_cache.clear()
+
+    def _result_cache_key(
+        self,
+        query: str,
+        n_results: int,
+        filters: dict[str, Any] | None,
+        search_type: str,
+        include: list[str],
+    ) -> tuple[Any, ...]:
+        """Key for the result cache, tied to the current write generation."""
+        return (
+            self._generation,
+            query,
+            json.dumps(filters or {}, sort_keys=True, default=str),
+            n_results,
+            search_type,
+            tuple(include),
+        )
+
+    @staticmethod
+    def _include_for(fields: list[str] | None) -> list[str]:
+        """
+        Map requested paper fields to a ChromaDB include list.
+        
+        Raises:
+            ValueError: If a field is not one of PAPER_FIELDS
+        """
+        if fields is None:
+            return list(PAPER_FIELDS.values())
+
+        unknown = set(fields) - PAPER_FIELDS.keys()
+        if unknown:
+            raise ValueError(f"Unknown fields: {sorted(unknown)}")
+        return [include for field, include in PAPER_FIELDS.items() if field in fields]
+
+    @staticmethod
+    def _project(result: Any) -> list[dict[str, Any]]:
+        """Turn a collection.get() result into paper dicts with the loaded fields."""
+        papers = []
+        for i, paper_id in enumerate(result["ids"]):
+            paper: dict[str, Any] = {"id": paper_id}
+            if result.get("documents") is not None:
+                paper["document"] = result["documents"][i]
+            if result.get("metadatas") is not None:
+                paper["metadata"] = result["metadatas"][i] or {}
+            papers.append(paper)
+        return papers
+
+    def _embed_queries(self, queries: list[str]) -> list[Any]:
+        """
+        Embed query texts, reusing cached embeddings.
+        
+        Misses are embedded together in one (micro-batched) call.
+        """
+        model = settings.embedding_model
+        embeddings: list[Any] = [self.embedding_cache.get((model, q)) for q in queries]
+
+        missing = sorted({q for q, e in zip(queries, embeddings) if e is None})
+        if missing:
+            computed = dict(zip(missing, self.embedding_service.embed(missing)))
+            for query, embedding in computed.items():
+                self.embedding_cache.put((model, query), embedding)
+            embeddings = [
+                e if e is not None else computed[q] for q, e in zip(queries, embeddings)
+            ]
+
+        return embeddings
+
     def _prepare_text(self, paper: dict[str, Any]) -> str:
         """
         Prepare paper text for embedding generation.
@@ -446,6 +1074,20 @@ class VectorDatabase:
 
         return combined.strip()
 
+    def _dedup_text(self, paper: dict[str, Any]) -> str:
+        """
+        Text signed for near-duplicate detection.
+        
+        The first DEDUP_SIGNATURE_CHARS of the full text, or the title and
+        abstract for papers without full text. Unlike _prepare_text nothing
+        is repeated, so versions of a paper that differ in the body are not
+        made to look alike by a shared title and abstract.
+        """
+        body = paper.get("full_text", "")
+        if body:
+            return body[:DEDUP_SIGNATURE_CHARS]
+        return f"{paper.get('title', '')} {paper.get('abstract', '')}".strip()
+
     def _extract_metadata(self, paper: dict[str, Any]) -> dict[str, Any]:
         """
         Extract metadata for filtering and display.
@@ -470,7 +1112,7 @@ class VectorDatabase:
             else:
                 metadata["authors"] = str(authors)
 
-        if "year" in paper:
+        if paper.get("year") is not None:
             metadata["year"] = int(paper["year"])
 
         if "doi" in paper:
@@ -489,12 +1131,16 @@ class VectorDatabase:
         Build ChromaDB where clause from filter dictionary.
         
         Supports:
+        - year: Exact publication year
         - year_min/year_max: Year range filtering
         - source: Exact source match
         - authors: Author name contains (not supported by ChromaDB directly)
         """
         where: dict[str, Any] = {}
 
+        if "year" in filters:
+            where["year"] = int(filters["year"])
+
         if "year_min" in filters:
             where["year"] = {"$gte": int(filters["year_min"])}
 
@@ -507,12 +1153,17 @@ class VectorDatabase:
         if "source" in filters:
             where["source"] = filters["source"]
 
+        # ChromaDB requires an explicit $and for more than one field
+        if len(where) > 1:
+            return {"$and": [{key: value} for key, value in where.items()]}
+
         return where if where else None
 
     def _format_results(
         self,
         results: Any,
         exclude_id: str | None = None,
+        batch_index: int = 0,
     ) -> list[dict[str, Any]]:
         """
         Format ChromaDB results into a standard structure.
@@ -522,12 +1173,11 @@ class VectorDatabase:
         """
         formatted = []
 
-        # ChromaDB returns lists of lists (batch results)
-        # We only query one at a time, so take first batch
-        ids = results["ids"][0]
-        documents = results["documents"][0]
-        metadatas = results["metadatas"][0]
-        distances = results["distances"][0]
+        # ChromaDB returns lists of lists (one list per query embedding)
+        ids = results["ids"][batch_index]
+        documents = results["documents"][batch_index] if results.get("documents") is not None else None
+        metadatas = results["metadatas"][batch_index] if results.get("metadatas") is not None else None
+        distances = results["distances"][batch_index]
 
         for i in range(len(ids)):
             paper_id = ids[i]
@@ -543,15 +1193,416 @@ class VectorDatabase:
             distance = distances[i]
             similarity = 1 / (1 + distance)
 
-            formatted.append({
-                "id": paper_id,
-                "similarity": float(similarity),
-                "document": documents[i],
-                "metadata": metadatas[i],
-            })
+            result = {"id": paper_id, "similarity": float(similarity)}
+            if documents is not None:
+                result["document"] = documents[i]
+            if metadatas is not None:
+                result["metadata"] = metadatas[i]
+            formatted.append(result)
 
         return formatted
 
+    def _fuse_results(
+        self,
+        semantic: list[dict[str, Any]],
+        keyword: list[dict[str, Any]],
+        fusion: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Merge two ranked result lists into one.
+        
+        "rrf" sums 1 / (k + rank) over both lists, scaled so a paper ranked
+        first by both retrievers scores 1.0. "weighted" combines the two
+        similarities with config.hybrid_semantic_weight. Each result keeps
+        its per-retriever similarities.
+        """
+        k = settings.hybrid_rrf_k
+        weight = settings.hybrid_semantic_weight
+        merged: dict[str, dict[str, Any]] = {}
+
+        for name, results in (("semantic", semantic), ("keyword", keyword)):
+            for rank, result in enumerate(results, start=1):
+                entry = merged.get(result["id"])
+                if entry is None:
+                    entry = {**result, "similarity": 0.0}
+                    merged[result["id"]] = entry
+                entry[f"{name}_similarity"] = result["similarity"]
+
+                if fusion == "rrf":
+                    entry["similarity"] += (1 / (k + rank)) * (k + 1) / 2
+                else:
+                    share = weight if name == "semantic" else 1 - weight
+                    entry["similarity"] += share * result["similarity"]
+
+        return sorted(merged.values(), key=lambda r: r["similarity"], reverse=True)
+
+    def _rebuild_catalog(self, batch_size: int = 1000) -> None:
+        """
+        Fill the catalog from metadata already in the collection.
+        
+        Used once for stores created before the catalog existed.
+        """
+        logger.info("rebuilding_catalog", paper_count=self.collection.count())
+        offset = 0
+        while True:
+            batch = self.collection.get(
+                include=["metadatas"],
+                limit=batch_size,
+                offset=offset,
+            )
+            if not batch["ids"]:
+                break
+            self.catalog.upsert([
+                (paper_id, dict(batch["metadatas"][i] or {}))  # type: ignore
+                for i, paper_id in enumerate(batch["ids"])
+            ])
+            offset += len(batch["ids"])
+
+    def _rebuild_keyword_index(self, batch_size: int = 1000) -> None:
+        """
+        Build the keyword index from documents already in the collection.
+        
+        Used once for stores created before the keyword index existed.
+        Papers are indexed from the text store where their full text was
+        kept; otherwise only the stored (truncated) document text is
+        available.
+        """
+        logger.info("rebuilding_keyword_index", paper_count=self.collection.count())
+        offset = 0
+        while True:
+            batch = self.collection.get(
+                include=["documents", "metadatas"],
+                limit=batch_size,
+                offset=offset,
+            )
+            if not batch["ids"]:
+                break
+            documents = []
+            for i, doc_id in enumerate(batch["ids"]):
+                metadata = batch["metadatas"][i] or {}  # type: ignore
+                documents.append({
+                    "id": doc_id,
+                    "title": str(metadata.get("title", "")),
+                    "text": self.text_store.get(doc_id) or batch["documents"][i] or "",  # type: ignore
+                    "year": metadata.get("year"),
+                    "source": metadata.get("source"),
+                })
+            self.keyword_index.add_documents(documents)
+            offset += len(batch["ids"])
+
+    def _passages_pending(self) -> bool:
+        """Whether the chunk index is enabled but holds no passages for stored papers."""
+        return (
+            self.chunk_collection is not None
+            and self.chunk_collection.count() == 0
+            and self.collection.count() > 0
+        )
+
+    def _rebuild_dedup_index(self, batch_size: int = 1000) -> None:
+        """
+        Sign documents already in the collection for near-duplicate detection.
+        
+        Used once for stores created before the index existed. Papers are
+        signed from the text store where their full text was kept, so
+        signatures match what add_papers computes; otherwise the stored
+        (truncated) document is signed. Existing papers are indexed as-is,
+        each in its own cluster.
+        """
+        logger.info("rebuilding_dedup_index", paper_count=self.collection.count())
+        offset = 0
+        while True:
+            batch = self.collection.get(
+                include=["documents", "metadatas"],
+                limit=batch_size,
+                offset=offset,
+            )
+            if not batch["ids"]:
+                break
+            for i, doc_id in enumerate(batch["ids"]):
+                metadata = batch["metadatas"][i] or {}  # type: ignore
+                full_text = self.text_store.get(doc_id)
+                if full_text is None:
+                    signature = minhash(batch["documents"][i] or "")  # type: ignore
+                else:
+                    signature = minhash(self._dedup_text({**metadata, "full_text": full_text}))
+                if signature is not None:
+                    self.dedup_index.add(doc_id, signature)
+            offset += len(batch["ids"])
+
+    def _resolve_duplicates(
+        self, papers: list[dict[str, Any]]
+    ) -> tuple[
+        list[dict[str, Any]],
+        list[tuple[Any, ...]],
+        list[tuple[Any, ...]],
+        list[tuple[str, dict[str, Any]]],
+    ]:
+        """
+        Check papers against the near-duplicate index and apply the policy.
+        
+        Nothing is written to the index here; add_papers records the
+        results once the papers themselves are stored.
+        
+        Returns:
+            Tuple of (papers to add, dedup_index.add() arguments for them,
+            dedup_index.add_alias() arguments for papers left out,
+            (canonical ID, paper) pairs to merge)
+        """
+        policy = settings.near_duplicate_policy
+        if policy == "off":
+            return papers, [], [], []
+
+        threshold = settings.near_duplicate_threshold
+        kept: list[dict[str, Any]] = []
+        signatures: list[tuple[Any, ...]] = []
+        aliases: list[tuple[Any, ...]] = []
+        merges: list[tuple[str, dict[str, Any]]] = []
+
+        for paper in papers:
+            paper_id = str(paper["id"])
+            signature = minhash(self._dedup_text(paper))
+            if signature is None:
+                kept.append(paper)
+                continue
+
+            match = self.dedup_index.find(signature, threshold, exclude_id=paper_id)
+            # Earlier papers of this batch are not in the index yet
+            for other_id, other_signature, other_canonical, _ in signatures:
+                similarity = jaccard(signature, other_signature)
+                if other_id != paper_id and similarity >= threshold and (
+                    match is None or similarity > match[1]
+                ):
+                    match = (other_canonical or other_id, similarity)
+
+            if match is None:
+                kept.append(paper)
+                signatures.append((paper_id, signature, None, None))
+                continue
+
+            canonical_id, similarity = match
+            logger.info(
+                "near_duplicate_detected",
+                paper_id=paper_id,
+                canonical_id=canonical_id,
+                similarity=similarity,
+                policy=policy,
+            )
+            if policy == "link":
+                kept.append(paper)
+                signatures.append((paper_id, signature, canonical_id, similarity))
+            else:
+                aliases.append((paper_id, canonical_id, similarity, policy))
+                if policy == "merge":
+                    merges.append((canonical_id, paper))
+
+        return kept, signatures, aliases, merges
+
+    def _merge_duplicates(self, merges: list[tuple[str, dict[str, Any]]]) -> None:
+        """Fill metadata missing on canonical papers from their merged duplicates."""
+        for canonical_id, paper in merges:
+            found = self.collection.get(ids=[canonical_id], include=["metadatas"])
+            if not found["ids"]:
+                continue
+            metadata = dict(found["metadatas"][0] or {})  # type: ignore
+            extra = self._extract_metadata(paper)
+            missing = {
+                key: extra[key]
+                for key in MERGEABLE_FIELDS
+                if key in extra and extra[key] not in ("", None) and not metadata.get(key)
+            }
+            if not missing:
+                continue
+            metadata.update(missing)
+            self.collection.update(ids=[canonical_id], metadatas=[metadata])  # type: ignore
+            self.catalog.upsert([(canonical_id, metadata)])
+            logger.info("near_duplicate_merged", canonical_id=canonical_id, fields=sorted(missing))
+
+    def _add_passages(self, papers: list[dict[str, Any]]) -> int:
+        """
+        Split papers into overlapping passages and add them to the chunk index.
+        
+        Passages from all papers are embedded together in batches of
+        settings.embedding_batch_size rather than one call per paper.
+        """
+        batch_size = max(settings.embedding_batch_size, 1)
+        ids: list[str] = []
+        documents: list[str] = []
+        metadatas: list[dict[str, Any]] = []
+        total = 0
+
+        def flush() -> None:
+            self.chunk_collection.add(  # type: ignore
+                documents=documents,
+                metadatas=metadatas,  # type: ignore
+                ids=ids,
+            )
+
+        for paper in papers:
+            body = paper.get("full_text", "")
+            if not body:
+                continue
+
+            paper_id = str(paper["id"])
+            chunks = chunk_text(
+                body,
+                chunk_size=settings.chunk_size,
+                overlap=settings.chunk_overlap,
+                page_offsets=paper.get("page_offsets"),
+            )
+
+            for chunk in chunks:
+                metadata: dict[str, Any] = {
+                    "paper_id": paper_id,
+                    "chunk_index": chunk["index"],
+                    "start": chunk["start"],
+                    "end": chunk["end"],
+                    "source": paper.get("source", "unknown"),
+                }
+                if chunk["section"]:
+                    metadata["section"] = chunk["section"]
+                if chunk["page"] is not None:
+                    metadata["page"] = chunk["page"]
+                if paper.get("year") is not None:
+                    metadata["year"] = int(paper["year"])
+
+                ids.append(f"{paper_id}#{chunk['index']}")
+                documents.append(chunk["text"])
+                metadatas.append(metadata)
+
+                if len(ids) >= batch_size:
+                    flush()
+                    total += len(ids)
+                    ids, documents, metadatas = [], [], []
+
+        if ids:
+            flush()
+            total += len(ids)
+
+        logger.info("passages_added", paper_count=len(papers), passage_count=total)
+        return total
+
+    def _query_passages(
+        self,
+        query_embeddings: Any,
+        n_results: int,
+        where: dict[str, Any] | None = None,
+        exclude_id: str | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Query the chunk index and keep the best passage per paper.
+        
+        Over-fetches by settings.chunk_search_multiplier since several
+        passages of one paper can occupy the top hits.
+        
+        Returns:
+            Mapping of paper ID to its best passage (text, section, page,
+            start, end, similarity)
+        """
+        return self._query_passages_many(query_embeddings, n_results, where, exclude_id)[0]
+
+    def _query_passages_many(
+        self,
+        query_embeddings: Any,
+        n_results: int,
+        where: dict[str, Any] | None = None,
+        exclude_id: str | None = None,
+    ) -> list[dict[str, dict[str, Any]]]:
+        """Query the chunk index once for several embeddings (see _query_passages)."""
+        if self.chunk_collection is None or self.chunk_collection.count() == 0:
+            return [{} for _ in query_embeddings]
+
+        if exclude_id:
+            exclude = {"paper_id": {"$ne": exclude_id}}
+            where = {"$and": [where, exclude]} if where else exclude
+
+        results = self.chunk_collection.query(
+            query_embeddings=query_embeddings,
+            n_results=n_results * max(settings.chunk_search_multiplier, 1),
+            where=where,
+            include=["documents", "metadatas", "distances"],
+        )
+
+        per_query = []
+        for batch_index in range(len(results["ids"])):
+            best: dict[str, dict[str, Any]] = {}
+            documents = results["documents"][batch_index]  # type: ignore
+            metadatas = results["metadatas"][batch_index]  # type: ignore
+            distances = results["distances"][batch_index]  # type: ignore
+
+            for i in range(len(results["ids"][batch_index])):
+                metadata = metadatas[i]
+                paper_id = str(metadata["paper_id"])
+                similarity = float(1 / (1 + distances[i]))
+
+                if paper_id in best and best[paper_id]["similarity"] >= similarity:
+                    continue
+
+                best[paper_id] = {
+                    "text": documents[i],
+                    "section": metadata.get("section"),
+                    "page": metadata.get("page"),
+                    "start": metadata.get("start"),
+                    "end": metadata.get("end"),
+                    "similarity": similarity,
+                }
+
+            per_query.append(best)
+
+        return per_query
+
+    def _merge_passage_hits(
+        self,
+        formatted: list[dict[str, Any]],
+        passages: dict[str, dict[str, Any]],
+        n_results: int,
+        include: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Merge paper-level results with rolled-up passage hits.
+        
+        A paper's score is the best of its own similarity and its best
+        passage's similarity. Papers found only through passages are
+        loaded from the main collection.
+        """
+        merged = {result["id"]: result for result in formatted}
+
+        missing = [paper_id for paper_id in passages if paper_id not in merged]
+        if missing:
+            found = self.collection.get(
+                ids=missing,
+                include=include if include is not None else list(PAPER_FIELDS.values()),  # type: ignore
+            )
+            for paper in self._project(found):
+                merged[paper["id"]] = {**paper, "similarity": 0.0}
+
+        for paper_id, passage in passages.items():
+            result = merged.get(paper_id)
+            if result is None:
+                # Passage of a paper no longer in the main collection
+                continue
+            result["passage"] = passage
+            result["similarity"] = max(result["similarity"], passage["similarity"])
+
+        ranked = sorted(merged.values(), key=lambda r: r["similarity"], reverse=True)
+        return ranked[:n_results]
+
+    @staticmethod
+    def _dedup_across_queries(
+        batches: list[list[dict[str, Any]]],
+    ) -> list[list[dict[str, Any]]]:
+        """Keep each paper only in the batch where it has the highest similarity."""
+        owner: dict[str, tuple[float, int]] = {}
+        for batch_index, batch in enumerate(batches):
+            for result in batch:
+                best = owner.get(result["id"])
+                if best is None or result["similarity"] > best[0]:
+                    owner[result["id"]] = (result["similarity"], batch_index)
+
+        return [
+            [result for result in batch if owner[result["id"]][1] == batch_index]
+            for batch_index, batch in enumerate(batches)
+        ]
+
 
 # Singleton instance for application-wide use
 _vector_db_instance: VectorDatabase | None = None
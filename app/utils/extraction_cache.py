@@ -0,0 +1,244 @@
+"""
+Extraction Cache
+
+On-disk cache of PDF extraction results keyed by the SHA-256 of the file
+bytes, so the same PDF arriving through uploads, repository syncs or
+re-indexing is only parsed once. Entries hold page texts, PDF metadata and
+parsed paper metadata as zlib-compressed JSON in a SQLite file, and the
+least recently used entries are evicted once the byte budget is exceeded.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Bump when extraction output changes so stale entries are ignored
+CACHE_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    sha256 TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_entries_last_used ON entries (last_used);
+"""
+
+
+def file_sha256(path: str | Path, chunk_size: int = 1024 * 1024) -> str:
+    """Hash a file's contents without reading it into memory at once."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Content-addressed cache of PDF extraction results.
+
+    Values are dictionaries such as {"pages": [...], "metadata": {...}};
+    update() merges extra fields (e.g. parsed paper metadata) into an
+    existing entry. Safe to share between threads and processes.
+
+    Example usage:
+        cache = ExtractionCache("./data/chroma/extraction_cache.sqlite3")
+        sha256 = file_sha256(pdf_path)
+        entry = cache.get(sha256)
+        if entry is None:
+            cache.put(sha256, {"pages": pages, "metadata": metadata})
+    """
+
+    def __init__(self, db_path: str | Path, max_bytes: int = 512 * 1024 * 1024):
+        """
+        Open or create the cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            max_bytes: Budget for compressed entries; 0 disables the cache
+        """
+        self.db_path = Path(db_path)
+        self.max_bytes = max(max_bytes, 0)
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        if not self.enabled:
+            return
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.max_bytes > 0
+
+    def get(self, sha256: str) -> dict[str, Any] | None:
+        """
+        Look up extraction results and mark them as recently used.
+
+        Returns:
+            Cached dictionary, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM entries WHERE sha256 = ? AND version = ?",
+                (sha256, CACHE_VERSION),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE entries SET last_used = ? WHERE sha256 = ?", (time.time(), sha256)
+                )
+
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, sha256: str, value: dict[str, Any]) -> bool:
+        """
+        Store extraction results, evicting least recently used entries as needed.
+
+        Returns:
+            True if stored; False if the cache is disabled or the entry
+            alone exceeds the byte budget
+        """
+        if not self.enabled:
+            return False
+
+        data = zlib.compress(json.dumps(value, default=str).encode("utf-8"))
+        if len(data) > self.max_bytes:
+            return False
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (sha256, version, data, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (sha256, CACHE_VERSION, data, len(data), time.time()),
+            )
+            self._evict()
+        return True
+
+    def update(self, sha256: str, **fields: Any) -> bool:
+        """
+        Merge fields into an existing entry.
+
+        Returns:
+            True if the entry existed and was updated
+        """
+        entry = self.get(sha256)
+        if entry is None:
+            return False
+        entry.update(fields)
+        return self.put(sha256, entry)
+
+    def clear(self) -> None:
+        """Drop all entries (statistics are kept)."""
+        if not self.enabled:
+            return
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache occupancy and hit-rate statistics for this process.
+
+        Returns:
+            Dictionary with entries, bytes, max_bytes, hits, misses,
+            evictions and hit_rate
+        """
+        entries, size = 0, 0
+        with self._lock:
+            if self.enabled:
+                entries, size = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+                ).fetchone()
+            lookups = self._hits + self._misses
+            return {
+                "entries": entries,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._conn.close()
+
+    # Private helper methods
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under budget (caller holds the lock)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = []
+        for sha256, size in self._conn.execute(
+            "SELECT sha256, size FROM entries ORDER BY last_used"
+        ):
+            if total <= self.max_bytes:
+                break
+            evicted.append((sha256,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM entries WHERE sha256 = ?", evicted)
+        self._evictions += len(evicted)
+        logger.info("extraction_cache_evicted", entries=len(evicted), bytes=total)
+
+
+# Singleton instance for application-wide use
+_extraction_cache_instance: ExtractionCache | None = None
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """
+    Get or create the global ExtractionCache.
+
+    Stored at EXTRACTION_CACHE_PATH, or next to ChromaDB if unset.
+
+    Returns:
+        ExtractionCache singleton instance
+    """
+    global _extraction_cache_instance
+
+    if _extraction_cache_instance is None:
+        db_path = settings.extraction_cache_path or (
+            Path(settings.chroma_persist_directory) / "extraction_cache.sqlite3"
+        )
+        _extraction_cache_instance = ExtractionCache(
+            db_path, max_bytes=settings.extraction_cache_bytes
+        )
+
+    return _extraction_cache_instance
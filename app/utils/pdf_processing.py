@@ -2,15 +2,304 @@
 PDF Processing Utilities
 
 Functions for extracting text and metadata from PDF files.
+
+PdfExtraction parses a file once and serves both page text (lazily, with
+optional page and character caps) and document metadata. Results are
+cached by file content hash (see app.utils.extraction_cache).
 """
 
 import structlog
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+from app.utils.extraction_cache import ExtractionCache, file_sha256, get_extraction_cache
 
 logger = structlog.get_logger(__name__)
 
 
+@dataclass
+class PdfPage:
+    """Text of one PDF page."""
+    number: int  # 1-based
+    text: str
+
+
+class PdfExtraction:
+    """
+    A PDF opened and parsed once, for both page text and metadata.
+
+    Pages are extracted lazily, so callers can stop early or stream text
+    without holding the whole document in memory.
+
+    Example usage:
+        with PdfExtraction(file_path) as pdf:
+            metadata = pdf.metadata
+            for page in pdf.pages(max_chars=1_000_000):
+                handle(page.number, page.text)
+    """
+
+    def __init__(self, pdf_path: str | Path):
+        """
+        Open a PDF file.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+        """
+        self.pdf_path = Path(pdf_path)
+
+        if not self.pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {self.pdf_path}")
+
+        self._metadata: dict[str, Any] | None = None
+        self.truncated = False
+
+        try:
+            from pypdf import PdfReader
+
+            self._file = open(self.pdf_path, "rb")
+            try:
+                self._reader = PdfReader(self._file)
+            except Exception:
+                self._file.close()
+                raise
+            self._raw_pages = self._reader.pages
+            self._raw_metadata = self._reader.metadata or {}
+            self._close = self._file.close
+        except ImportError:
+            # Fall back to pdfplumber if pypdf not available
+            import pdfplumber
+
+            self._reader = pdfplumber.open(self.pdf_path)
+            self._raw_pages = self._reader.pages
+            self._raw_metadata = self._reader.metadata or {}
+            self._close = self._reader.close
+
+    def __enter__(self) -> "PdfExtraction":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the document."""
+        return len(self._raw_pages)
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Document metadata (title, author, creation date, etc.) from the same reader."""
+        if self._metadata is None:
+            def field(name: str) -> Any:
+                return self._raw_metadata.get(f"/{name}") or self._raw_metadata.get(name) or ""
+
+            self._metadata = {
+                "title": field("Title"),
+                "author": field("Author"),
+                "subject": field("Subject"),
+                "creator": field("Creator"),
+                "producer": field("Producer"),
+                "creation_date": field("CreationDate"),
+                "modification_date": field("ModDate"),
+                "page_count": self.page_count,
+            }
+        return self._metadata
+
+    def pages(
+        self,
+        max_pages: int | None = None,
+        max_chars: int | None = None,
+    ) -> Iterator[PdfPage]:
+        """
+        Yield page text one page at a time.
+
+        Every page is yielded, including ones without text, so page
+        numbers stay aligned with the document. Sets truncated when a cap
+        stops extraction early.
+
+        Args:
+            max_pages: Stop after this many pages
+            max_chars: Stop once this many characters have been yielded;
+                      the last page is cut to fit
+
+        Yields:
+            PdfPage with 1-based page number and text
+        """
+        remaining = max_chars
+        for index, page in enumerate(self._raw_pages):
+            if max_pages is not None and index >= max_pages:
+                self.truncated = True
+                return
+            if remaining is not None and remaining <= 0:
+                self.truncated = True
+                return
+
+            text = page.extract_text() or ""
+            if remaining is not None:
+                if len(text) > remaining:
+                    text = text[:remaining]
+                    self.truncated = True
+                remaining -= len(text)
+
+            yield PdfPage(number=index + 1, text=text)
+
+    def close(self) -> None:
+        """Release the underlying file."""
+        self._close()
+
+
+def extract_pdf_pages(
+    pdf_path: str | Path,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+    cache: ExtractionCache | None = None,
+    sha256: str | None = None,
+) -> tuple[list[str], dict[str, Any]]:
+    """
+    Extract page texts and metadata from a PDF, consulting the extraction cache.
+
+    Results are cached by the SHA-256 of the file bytes. Caps are applied
+    to cached pages on a hit; truncated extractions are never cached.
+
+    Args:
+        pdf_path: Path to PDF file
+        max_pages: Only extract the first max_pages pages
+        max_chars: Stop after this many characters of text
+        cache: Extraction cache (default: the global cache)
+        sha256: SHA-256 of the file, if already known (saves rehashing it)
+
+    Returns:
+        Tuple of (page texts including empty pages, metadata). Metadata
+        also carries sha256, pages_extracted, truncated and cached.
+
+    Raises:
+        FileNotFoundError: If PDF file doesn't exist
+        Exception: If text extraction fails
+    """
+    pdf_path = Path(pdf_path)
+    if cache is None:
+        cache = get_extraction_cache()
+
+    if not pdf_path.exists():
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+    if not cache.enabled:
+        sha256 = None
+    elif sha256 is None:
+        sha256 = file_sha256(pdf_path)
+    entry = cache.get(sha256) if sha256 else None
+
+    if entry is not None:
+        pages, truncated = _cap_pages(entry["pages"], max_pages, max_chars)
+        metadata = dict(entry["metadata"])
+        logger.info("pdf_extraction_cache_hit", file=str(pdf_path), sha256=sha256)
+    else:
+        logger.info("extracting_pdf", file=str(pdf_path), max_pages=max_pages, max_chars=max_chars)
+        try:
+            with PdfExtraction(pdf_path) as pdf:
+                pages = [page.text for page in pdf.pages(max_pages=max_pages, max_chars=max_chars)]
+                metadata = dict(pdf.metadata)
+                truncated = pdf.truncated
+        except (FileNotFoundError, MemoryError):
+            raise
+        except Exception as e:
+            logger.error("pdf_extraction_error", file=str(pdf_path), error=str(e))
+            raise Exception(f"Failed to extract text from PDF: {str(e)}")
+
+        if sha256 and not truncated:
+            cache.put(sha256, {"pages": pages, "metadata": metadata})
+
+    metadata["sha256"] = sha256
+    metadata["pages_extracted"] = len(pages)
+    metadata["truncated"] = truncated
+    metadata["cached"] = entry is not None
+    return pages, metadata
+
+
+def extract_pdf(
+    pdf_path: str | Path,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+    cache: ExtractionCache | None = None,
+    sha256: str | None = None,
+) -> tuple[str, dict[str, Any]]:
+    """
+    Extract text and metadata from a PDF in a single parse.
+
+    Args:
+        pdf_path: Path to PDF file
+        max_pages: Only extract the first max_pages pages
+        max_chars: Stop after this many characters of text
+        cache: Extraction cache (default: the global cache)
+        sha256: SHA-256 of the file, if already known
+
+    Returns:
+        Tuple of (text, metadata). Metadata also carries sha256,
+        pages_extracted, truncated, cached and page_offsets (character
+        offset in text where each extracted page starts).
+
+    Raises:
+        FileNotFoundError: If PDF file doesn't exist
+        Exception: If text extraction fails
+    """
+    pages, metadata = extract_pdf_pages(pdf_path, max_pages, max_chars, cache, sha256)
+
+    text, page_offsets = _join_pages(pages)
+    metadata = {**metadata, "page_offsets": page_offsets}
+    logger.info(
+        "pdf_extracted",
+        char_count=len(text),
+        page_count=metadata["page_count"],
+        truncated=metadata["truncated"],
+        cached=metadata["cached"],
+    )
+    return text, metadata
+
+
+def _join_pages(pages: list[str]) -> tuple[str, list[int]]:
+    """Join non-empty pages with newlines, tracking where each page starts."""
+    parts = []
+    offsets = []
+    position = 0
+    for page in pages:
+        offsets.append(position)
+        if page:
+            parts.append(page)
+            position += len(page) + 1
+
+    joined = "\n".join(parts)
+    text = joined.strip()
+    leading = len(joined) - len(joined.lstrip())
+    return text, [min(max(offset - leading, 0), len(text)) for offset in offsets]
+
+
+def _cap_pages(
+    pages: list[str],
+    max_pages: int | None,
+    max_chars: int | None,
+) -> tuple[list[str], bool]:
+    """Apply page and character caps to already-extracted pages (see PdfExtraction.pages)."""
+    capped = pages[:max_pages] if max_pages is not None else list(pages)
+    truncated = len(capped) < len(pages)
+
+    if max_chars is not None:
+        remaining = max_chars
+        for index, text in enumerate(capped):
+            if remaining <= 0:
+                del capped[index:]
+                truncated = True
+                break
+            if len(text) > remaining:
+                capped[index] = text[:remaining]
+                truncated = True
+            remaining -= len(capped[index])
+
+    return capped, truncated
+
+
 def extract_text_from_pdf(pdf_path: str | Path) -> str:
     """
     Extract full text from a PDF file.
@@ -25,44 +314,8 @@ def extract_text_from_pdf(pdf_path: str | Path) -> str:
         FileNotFoundError: If PDF file doesn't exist
         Exception: If text extraction fails
     """
-    pdf_path = Path(pdf_path)
-    
-    if not pdf_path.exists():
-        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-    
-    logger.info("extracting_text_from_pdf", file=str(pdf_path))
-    
-    try:
-        # Use pypdf (modern replacement for PyPDF2)
-        try:
-            from pypdf import PdfReader
-            
-            text = ""
-            with open(pdf_path, "rb") as file:
-                pdf_reader = PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-            
-            logger.info("text_extracted_pypdf", char_count=len(text))
-            return text.strip()
-            
-        except ImportError:
-            # Fall back to pdfplumber if pypdf not available
-            import pdfplumber
-            
-            text = ""
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            
-            logger.info("text_extracted_pdfplumber", char_count=len(text))
-            return text.strip()
-            
-    except Exception as e:
-        logger.error("pdf_extraction_error", file=str(pdf_path), error=str(e))
-        raise Exception(f"Failed to extract text from PDF: {str(e)}")
+    text, _ = extract_pdf(pdf_path)
+    return text
 
 
 def extract_pdf_metadata(pdf_path: str | Path) -> dict[str, Any]:
@@ -83,27 +336,10 @@ def extract_pdf_metadata(pdf_path: str | Path) -> dict[str, Any]:
     logger.info("extracting_pdf_metadata", file=str(pdf_path))
     
     try:
-        from pypdf import PdfReader
-        
-        with open(pdf_path, "rb") as file:
-            pdf_reader = PdfReader(file)
-            metadata = pdf_reader.metadata or {}
-            
-            # Extract common fields
-            extracted = {
-                "title": metadata.get("/Title", ""),
-                "author": metadata.get("/Author", ""),
-                "subject": metadata.get("/Subject", ""),
-                "creator": metadata.get("/Creator", ""),
-                "producer": metadata.get("/Producer", ""),
-                "creation_date": metadata.get("/CreationDate", ""),
-                "modification_date": metadata.get("/ModDate", ""),
-                "page_count": len(pdf_reader.pages),
-            }
-            
-            logger.info("pdf_metadata_extracted", title=extracted["title"])
-            return extracted
-            
+        with PdfExtraction(pdf_path) as pdf:
+            extracted = pdf.metadata
+        logger.info("pdf_metadata_extracted", title=extracted["title"])
+        return extracted
     except ImportError:
         logger.warning("pypdf_not_available", fallback="basic_metadata")
         # Return basic metadata without PDF parsing
@@ -121,14 +357,25 @@ def parse_research_paper_metadata(text: str, pdf_metadata: dict[str, Any]) -> di
     Parse research paper metadata from extracted text.
     
     Uses heuristics to extract title, abstract, authors from paper text.
+    Reads and updates the extraction cache, so call it through
+    asyncio.to_thread from async code.
     
     Args:
         text: Extracted PDF text
-        pdf_metadata: PDF file metadata
+        pdf_metadata: PDF file metadata (from extract_pdf, whose sha256
+                     lets the result be cached)
     
     Returns:
         Dictionary with parsed metadata
     """
+    # Parsed fields are cached alongside the extraction of the same file
+    sha256 = pdf_metadata.get("sha256")
+    cacheable = sha256 and not pdf_metadata.get("truncated")
+    if cacheable:
+        entry = get_extraction_cache().get(sha256)
+        if entry is not None and "parsed" in entry:
+            return entry["parsed"]
+    
     # TODO: Implement smarter parsing
     # For now, use PDF metadata as fallback
     
@@ -154,4 +401,7 @@ def parse_research_paper_metadata(text: str, pdf_metadata: dict[str, Any]) -> di
     if abstract_match:
         metadata["abstract"] = abstract_match.group(1).strip()
     
+    if cacheable:
+        get_extraction_cache().update(sha256, parsed=metadata)
+    
     return metadata
@@ -0,0 +1,84 @@
+"""
+PDF Extraction Worker
+
+Entry point for the sandboxed extraction processes started by
+app.services.extraction_pool. Kept free of heavy imports so spawned
+workers start quickly.
+"""
+
+from multiprocessing.connection import Connection
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Error codes carried by ExtractionError
+ERROR_TIMEOUT = "timeout"
+ERROR_MEMORY = "memory_limit"
+ERROR_CRASHED = "worker_crashed"
+ERROR_NOT_FOUND = "not_found"
+ERROR_INVALID = "invalid_pdf"
+
+
+def _limit_memory(max_memory_mb: int) -> None:
+    """Cap the worker's address space (POSIX only)."""
+    if max_memory_mb <= 0:
+        return
+    try:
+        import resource
+    except ImportError:
+        return
+    limit = max_memory_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError) as e:
+        logger.warning("extraction_memory_limit_unavailable", error=str(e))
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (0 if unknown)."""
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def worker_main(conn: Connection, max_memory_mb: int) -> None:
+    """Worker process loop: extract PDFs sent over the pipe until told to stop."""
+    _limit_memory(max_memory_mb)
+
+    from app.utils.pdf_processing import extract_pdf
+
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+
+        pdf_path, max_pages, max_chars, sha256 = task
+        try:
+            text, metadata = extract_pdf(
+                pdf_path, max_pages=max_pages, max_chars=max_chars, sha256=sha256
+            )
+            reply: dict[str, Any] = {"ok": True, "text": text, "metadata": metadata}
+        except MemoryError:
+            reply = {
+                "ok": False,
+                "code": ERROR_MEMORY,
+                "message": f"Extraction exceeded the {max_memory_mb} MB memory limit",
+            }
+        except FileNotFoundError as e:
+            reply = {"ok": False, "code": ERROR_NOT_FOUND, "message": str(e)}
+        except Exception as e:
+            reply = {"ok": False, "code": ERROR_INVALID, "message": str(e)}
+
+        reply["rss_mb"] = _peak_rss_mb()
+        try:
+            conn.send(reply)
+        except (OSError, ValueError):
+            return
@@ -0,0 +1,117 @@
+"""
+Text Chunking Utilities
+
+Functions for splitting paper text into sections and overlapping passages
+for passage-level embedding.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Any
+
+# Common research paper section headings, matched at the start of a line.
+# Optional numbering ("1.", "2.1", "IV.") is allowed before the heading.
+SECTION_PATTERN = re.compile(
+    r"^[ \t]*(?:(?:\d+(?:\.\d+)*|[IVX]+)\.?[ \t]+)?"
+    r"(abstract|introduction|background|related work|"
+    r"materials and methods|methods|methodology|experimental|"
+    r"results and discussion|results|discussion|"
+    r"conclusions?|acknowledge?ments|references|bibliography)"
+    r"[ \t]*:?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def find_sections(text: str) -> list[dict[str, Any]]:
+    """
+    Locate section headings in paper text.
+
+    Args:
+        text: Full paper text
+
+    Returns:
+        List of sections in document order, each with keys:
+        - name: Normalized section name (e.g., 'introduction')
+        - start: Character offset where the section begins
+        - end: Character offset where the section ends
+        Text before the first heading is reported as 'front_matter'.
+    """
+    matches = list(SECTION_PATTERN.finditer(text))
+    sections: list[dict[str, Any]] = []
+
+    first_start = matches[0].start() if matches else len(text)
+    if text[:first_start].strip():
+        sections.append({"name": "front_matter", "start": 0, "end": first_start})
+
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        name = re.sub(r"\s+", "_", match.group(1).lower())
+        sections.append({"name": name, "start": match.start(), "end": end})
+
+    return sections
+
+
+def chunk_text(
+    text: str,
+    chunk_size: int = 1000,
+    overlap: int = 200,
+    page_offsets: list[int] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Split text into overlapping passages.
+
+    Passages never cross a section heading, and their boundaries are
+    moved back to the nearest whitespace so words are not cut in half.
+    Each passage is tagged with its section and the page its first
+    character falls in.
+
+    Args:
+        text: Full paper text
+        chunk_size: Target passage length in characters
+        overlap: Characters shared between consecutive passages
+        page_offsets: Optional character offsets where each page starts
+                     (page 1 first). Pages are omitted when not given.
+
+    Returns:
+        List of passages with keys: index, text, start, end, section, page
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if not 0 <= overlap < chunk_size:
+        raise ValueError("overlap must be between 0 and chunk_size")
+
+    chunks: list[dict[str, Any]] = []
+
+    for section in find_sections(text):
+        start = section["start"]
+        section_end = section["end"]
+
+        while start < section_end:
+            end = min(start + chunk_size, section_end)
+            if end < section_end:
+                # Break on whitespace within the last quarter of the window
+                floor = start + chunk_size * 3 // 4
+                split = max(text.rfind(" ", floor, end), text.rfind("\n", floor, end))
+                if split > start:
+                    end = split
+
+            passage = text[start:end].strip()
+            if passage:
+                page = None
+                if page_offsets:
+                    page = max(bisect_right(page_offsets, start), 1)
+
+                chunks.append({
+                    "index": len(chunks),
+                    "text": passage,
+                    "start": start,
+                    "end": end,
+                    "section": section["name"],
+                    "page": page,
+                })
+
+            if end >= section_end:
+                break
+            start = max(end - overlap, start + 1)
+
+    return chunks
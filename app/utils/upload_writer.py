@@ -0,0 +1,124 @@
+"""
+Upload Writer
+
+Streams uploaded files to document storage while validating and hashing
+them. The first chunk is checked for the PDF header and against the size
+cap before anything is written, so spoofed or oversized files are turned
+away after a single read. Valid files are hashed (SHA-256) as they are
+written and only appear under their final name once complete.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Files are read and written in chunks of this size
+CHUNK_SIZE = 1024 * 1024
+
+# PDF readers accept the header anywhere in the first 1024 bytes
+PDF_MAGIC = b"%PDF-"
+PDF_HEADER_WINDOW = 1024
+
+# Rejection codes
+UPLOAD_EMPTY = "empty_file"
+UPLOAD_NOT_PDF = "not_pdf"
+UPLOAD_TOO_LARGE = "too_large"
+
+
+class UploadRejected(Exception):
+    """An upload that failed validation, with the HTTP status to report."""
+
+    def __init__(self, code: str, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+
+    def to_dict(self) -> dict[str, str]:
+        """Error as a JSON-serializable dictionary."""
+        return {"code": self.code, "message": self.message}
+
+
+@dataclass
+class StoredUpload:
+    """A validated upload written to disk."""
+
+    path: Path
+    size: int
+    sha256: str
+
+
+def check_upload_size(size: int | None, max_bytes: int) -> None:
+    """
+    Reject a file whose declared size exceeds max_bytes (0 = no limit).
+
+    Raises:
+        UploadRejected: If the size is known and too large
+    """
+    if max_bytes and size is not None and size > max_bytes:
+        raise UploadRejected(
+            UPLOAD_TOO_LARGE,
+            f"File exceeds the upload limit of {max_bytes} bytes",
+            status_code=413,
+        )
+
+
+def write_upload(
+    source: BinaryIO,
+    dest: str | Path,
+    max_bytes: int = 0,
+    chunk_size: int = CHUNK_SIZE,
+) -> StoredUpload:
+    """
+    Validate a PDF stream and write it to dest, hashing it on the way.
+
+    Blocking; call it through asyncio.to_thread from async code. Nothing
+    is left at dest (or its temporary ".part" file) if the upload is
+    rejected or the copy fails.
+
+    Args:
+        source: Readable binary stream
+        dest: Final file path
+        max_bytes: Size cap in bytes (0 = no limit)
+        chunk_size: Bytes per read
+
+    Returns:
+        StoredUpload with path, size and SHA-256 hex digest
+
+    Raises:
+        UploadRejected: If the stream is empty, does not start like a PDF
+                        or exceeds max_bytes
+    """
+    dest = Path(dest)
+
+    first = source.read(chunk_size)
+    if not first:
+        raise UploadRejected(UPLOAD_EMPTY, "File is empty")
+    if PDF_MAGIC not in first[:PDF_HEADER_WINDOW]:
+        raise UploadRejected(UPLOAD_NOT_PDF, "File is not a PDF document", status_code=415)
+    check_upload_size(len(first), max_bytes)
+
+    digest = hashlib.sha256()
+    size = 0
+    part = dest.with_name(dest.name + ".part")
+    try:
+        with open(part, "wb") as f:
+            chunk = first
+            while chunk:
+                size += len(chunk)
+                check_upload_size(size, max_bytes)
+                digest.update(chunk)
+                f.write(chunk)
+                chunk = source.read(chunk_size)
+        part.replace(dest)
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+
+    logger.info("upload_written", path=str(dest), size=size)
+    return StoredUpload(path=dest, size=size, sha256=digest.hexdigest())
@@ -5,54 +5,88 @@ Scans data/papers directory for PDFs and populates ChromaDB
 with embeddings for semantic search.
 
 Usage:
-    python scripts/init_vector_db.py [--reset]
+    python scripts/init_vector_db.py [--reset | --resume | --retry-failed]
+                                     [--workers N] [--batch-size N]
 
 Options:
-    --reset: Clear existing database before initializing
+    --reset: Clear existing database (and ingest manifest) before initializing
+    --resume: Continue the last interrupted run from its checkpoint
+    --retry-failed: Index only the files that failed in earlier runs
+    --workers: Number of PDF extraction processes (default: CPU count)
+    --batch-size: Papers per embed-and-write batch (default: 32)
+
+PDFs are parsed in a process pool while a writer thread embeds and stores
+completed papers in batches, so extraction and embedding overlap.
+
+Runs are incremental: a manifest next to the vector store records each
+indexed PDF's size, mtime and hash, so reruns only index new or changed
+files and remove papers whose PDFs are gone. Changing EMBEDDING_MODEL
+re-embeds everything.
+
+Each written batch is checkpointed in the manifest together with its
+files, and failed files are remembered until they index successfully, so
+a crash loses at most the batch in flight.
 """
 
+import multiprocessing
+import os
+import queue
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import argparse
 import structlog
-from pypdf import PdfReader
 
+from app.services.ingest_manifest import RUN_RUNNING, IngestManifest, ManifestEntry
 from app.services.vector_db import get_vector_db
+from app.utils.pdf_processing import extract_pdf_pages
 from app.config import settings
 
 logger = structlog.get_logger(__name__)
 
 
-def extract_text_from_pdf(pdf_path: Path) -> str:
+def extract_pages_from_pdf(pdf_path: Path) -> list[str]:
     """
-    Extract text content from a PDF file.
+    Extract the text of each page of a PDF file.
+    
+    Files already seen (by content hash) are served from the extraction cache.
     
     Args:
         pdf_path: Path to PDF file
     
     Returns:
-        Extracted text content
+        One string per page (empty for pages without text)
     """
     try:
-        reader = PdfReader(pdf_path)
-        text_parts = []
-        
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                text_parts.append(text)
-        
-        return "\n\n".join(text_parts)
+        pages, _ = extract_pdf_pages(pdf_path)
+        return pages
     
     except Exception as e:
         logger.error("pdf_extraction_error", file=str(pdf_path), error=str(e))
         raise
 
 
+def extract_text_from_pdf(pdf_path: Path) -> str:
+    """
+    Extract text content from a PDF file.
+    
+    Args:
+        pdf_path: Path to PDF file
+    
+    Returns:
+        Extracted text content
+    """
+    return "\n\n".join(page for page in extract_pages_from_pdf(pdf_path) if page)
+
+
 def extract_title_from_text(text: str) -> str:
     """
     Extract title from PDF text.
@@ -130,8 +164,14 @@ def parse_paper(pdf_path: Path) -> dict:
     logger.info("parsing_paper", file=pdf_path.name)
     
     try:
-        # Extract full text
-        full_text = extract_text_from_pdf(pdf_path)
+        # Extract full text, remembering where each page starts
+        pages = extract_pages_from_pdf(pdf_path)
+        page_offsets = []
+        offset = 0
+        for page in pages:
+            page_offsets.append(offset)
+            offset += len(page) + 2
+        full_text = "\n\n".join(pages)
         
         # Extract title and abstract
         title = extract_title_from_text(full_text)
@@ -145,6 +185,7 @@ def parse_paper(pdf_path: Path) -> dict:
             "full_text": full_text,
             "source": "local",
             "file_path": str(pdf_path.absolute()),
+            "page_offsets": page_offsets,
         }
         
         logger.info(
@@ -161,9 +202,294 @@ def parse_paper(pdf_path: Path) -> dict:
         raise
 
 
+@dataclass
+class IngestStats:
+    """Progress and throughput counters for one ingestion run."""
+    total_files: int
+    papers: int = 0
+    pages: int = 0
+    duplicates: int = 0
+    failed: list[tuple[str, str]] = field(default_factory=list)
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started."""
+        return time.perf_counter() - self.started_at
+
+    @property
+    def papers_per_sec(self) -> float:
+        """Papers written per second."""
+        return self.papers / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def pages_per_sec(self) -> float:
+        """Pages written per second."""
+        return self.pages / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _parse_worker(pdf_path: str) -> tuple[str, dict | None, str | None]:
+    """
+    Process-pool entry point: parse one PDF without raising.
+    
+    Returns:
+        Tuple of (path, paper or None, error message or None)
+    """
+    try:
+        return pdf_path, parse_paper(Path(pdf_path)), None
+    except Exception as e:
+        return pdf_path, None, str(e)
+
+
+def ingest_papers(
+    vector_db,
+    pdf_files: list[Path],
+    workers: int | None = None,
+    batch_size: int = 32,
+    on_batch: Callable[[list[dict]], None] | None = None,
+    on_failure: Callable[[str, str], None] | None = None,
+) -> IngestStats:
+    """
+    Parse PDFs in parallel and add them to the vector database in batches.
+    
+    A process pool extracts text, at most two jobs per worker in flight.
+    Parsed papers go through a bounded queue to a writer thread that calls
+    add_papers once per batch, so embedding overlaps with extraction and
+    only a few batches are ever held in memory.
+    
+    Args:
+        vector_db: VectorDatabase to write to
+        pdf_files: PDF files to ingest
+        workers: Extraction processes (default: CPU count)
+        batch_size: Papers per add_papers call
+        on_batch: Called with each batch after it has been written; if it
+                  raises, no further batches are written and the error is
+                  re-raised once the pool has stopped
+        on_failure: Called with (path, error) for each file that fails to
+                   parse or whose batch fails to write
+    
+    Returns:
+        IngestStats with counts, failures and throughput
+    """
+    workers = max(workers or os.cpu_count() or 1, 1)
+    batch_size = max(batch_size, 1)
+    stats = IngestStats(total_files=len(pdf_files))
+    parsed: queue.Queue[dict | None] = queue.Queue(maxsize=batch_size * 2)
+
+    def fail(pdf_path: str, error: str) -> None:
+        stats.failed.append((Path(pdf_path).name, error))
+        if on_failure is not None:
+            on_failure(pdf_path, error)
+
+    logger.info("ingest_started", files=len(pdf_files), workers=workers, batch_size=batch_size)
+
+    # Set when on_batch fails; the run stops and the error is re-raised
+    commit_errors: list[Exception] = []
+
+    def write_batches() -> None:
+        batch: list[dict] = []
+        while True:
+            paper = parsed.get()
+            if commit_errors:
+                # Drain without writing, so collect() never blocks
+                if paper is None:
+                    return
+                continue
+            if paper is not None:
+                batch.append(paper)
+            if batch and (paper is None or len(batch) >= batch_size):
+                try:
+                    written = vector_db.add_papers(batch)
+                except Exception as e:
+                    logger.error("ingest_batch_error", batch_size=len(batch), error=str(e))
+                    for p in batch:
+                        fail(p["file_path"], str(e))
+                else:
+                    _count_written(vector_db, stats, batch, written)
+                    # Outside the write's handler: a batch that was written
+                    # must not be reported as failed
+                    if on_batch is not None:
+                        try:
+                            on_batch(batch)
+                        except Exception as e:
+                            logger.error("ingest_commit_error", batch_size=len(batch), error=str(e))
+                            commit_errors.append(e)
+                _report_progress(stats)
+                batch = []
+            if paper is None:
+                return
+
+    def collect(future: Future) -> None:
+        pdf_path, paper, error = future.result()
+        if error is not None:
+            fail(pdf_path, error)
+            print(f"  ❌ Failed: {Path(pdf_path).name}: {error}")
+        else:
+            parsed.put(paper)  # blocks while the writer is behind
+
+    writer = threading.Thread(target=write_batches, name="ingest-writer")
+    writer.start()
+
+    try:
+        # spawn: the vector DB is loaded and the writer thread running, so never fork
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            in_flight: set[Future] = set()
+            for pdf_path in pdf_files:
+                if commit_errors:
+                    break
+                if len(in_flight) >= workers * 2:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future)
+                in_flight.add(pool.submit(_parse_worker, str(pdf_path)))
+
+            for future in wait(in_flight).done:
+                collect(future)
+    finally:
+        parsed.put(None)
+        writer.join()
+
+    if commit_errors:
+        raise commit_errors[0]
+
+    logger.info(
+        "ingest_completed",
+        papers=stats.papers,
+        pages=stats.pages,
+        duplicates=stats.duplicates,
+        failed=len(stats.failed),
+        elapsed_s=round(stats.elapsed, 2),
+        papers_per_sec=round(stats.papers_per_sec, 2),
+        pages_per_sec=round(stats.pages_per_sec, 2),
+    )
+    return stats
+
+
+def _count_written(vector_db, stats: IngestStats, batch: list[dict], written: int) -> None:
+    """
+    Add a written batch to the counters.
+    
+    add_papers leaves out near-duplicates under the skip and merge
+    policies; only papers it actually stored count as written.
+    """
+    if written < len(batch):
+        kept = []
+        for paper in batch:
+            duplicate = vector_db.duplicate_of(paper["id"])
+            if duplicate is None or duplicate["policy"] == "link":
+                kept.append(paper)
+    else:
+        kept = batch
+    stats.papers += written
+    stats.duplicates += len(batch) - written
+    stats.pages += sum(len(p.get("page_offsets") or []) for p in kept)
+
+
+def _report_progress(stats: IngestStats) -> None:
+    """Print one progress line after a batch is written."""
+    done = stats.papers + stats.duplicates + len(stats.failed)
+    print(
+        f"  [{done}/{stats.total_files}] {stats.papers} papers written | "
+        f"{stats.papers_per_sec:.2f} papers/s | {stats.pages_per_sec:.1f} pages/s"
+    )
+
+
+def _scan_entries(vector_db, manifest: IngestManifest, papers_dir: Path) -> list[ManifestEntry]:
+    """
+    Diff the papers directory against the manifest and clean up removals.
+    
+    Returns:
+        Manifest entries of new and changed PDFs
+    """
+    pdf_files = list(papers_dir.glob("*.pdf"))
+    
+    if not pdf_files and manifest.count() == 0:
+        logger.warning("no_pdfs_found", path=str(papers_dir))
+        print(f"⚠️  No PDF files found in {papers_dir}")
+        sys.exit(0)
+    
+    print(f"Found {len(pdf_files)} PDF files\n")
+    
+    # Compare with what is already indexed
+    diff = manifest.diff(pdf_files)
+    print(f"New: {len(diff.new)} | Changed: {len(diff.changed)} | "
+          f"Unchanged: {len(diff.unchanged)} | Removed: {len(diff.removed)}")
+    print(f"{'='*60}")
+    print()
+    logger.info(
+        "ingest_plan",
+        new=len(diff.new),
+        changed=len(diff.changed),
+        unchanged=len(diff.unchanged),
+        removed=len(diff.removed),
+    )
+    
+    # Drop papers whose PDFs are gone, and old versions of changed PDFs
+    for entry in diff.removed + diff.changed:
+        vector_db.delete_paper(entry.paper_id)
+    manifest.remove([entry.path for entry in diff.removed])
+    manifest.embedding_model = settings.embedding_model
+    
+    return diff.to_index
+
+
+def _current_entries(manifest: IngestManifest, paths: list[str]) -> list[ManifestEntry]:
+    """Describe the current state of files to re-index, skipping missing ones."""
+    entries = []
+    for path in paths:
+        try:
+            entries.append(manifest.entry_for(Path(path)))
+        except OSError as e:
+            print(f"  ⚠️  Skipping {Path(path).name}: {e}")
+    return entries
+
+
+def _resume_paths(manifest: IngestManifest) -> list[str]:
+    """
+    Files the last interrupted run had not committed yet.
+    
+    Returns:
+        Paths to index (empty if there is nothing to resume)
+    """
+    run = manifest.last_run()
+    if run is None or run["status"] != RUN_RUNNING:
+        print("No interrupted run to resume")
+        return []
+    
+    paths = manifest.pending_paths(run["id"])
+    print(f"Resuming run {run['id']}: {run['committed_batches']} batches "
+          f"({run['committed_files']}/{run['total_files']} files) already committed, "
+          f"{len(paths)} remaining")
+    print(f"{'='*60}")
+    print()
+    logger.info("ingest_resume", run_id=run["id"], remaining=len(paths))
+    return paths
+
+
+def _retry_paths(manifest: IngestManifest) -> list[str]:
+    """
+    Files that failed in earlier runs.
+    
+    Returns:
+        Paths to index (empty if nothing failed)
+    """
+    failures = manifest.failures()
+    print(f"Retrying {len(failures)} failed files")
+    print(f"{'='*60}")
+    print()
+    logger.info("ingest_retry_failed", files=len(failures))
+    return list(failures)
+
+
 def initialize_from_papers(
     papers_dir: Path | None = None,
     reset: bool = False,
+    workers: int | None = None,
+    batch_size: int = 32,
+    resume: bool = False,
+    retry_failed: bool = False,
 ) -> None:
     """
     Initialize vector database with papers from directory.
@@ -171,6 +497,10 @@ def initialize_from_papers(
     Args:
         papers_dir: Directory containing PDF files (default: data/papers)
         reset: Whether to reset database before initializing
+        workers: PDF extraction processes (default: CPU count)
+        batch_size: Papers per embed-and-write batch
+        resume: Continue the last interrupted run instead of scanning
+        retry_failed: Index only files that failed in earlier runs
     """
     # Default to data/papers relative to project root
     if papers_dir is None:
@@ -193,81 +523,103 @@ def initialize_from_papers(
     
     # Get vector database instance
     vector_db = get_vector_db()
+    manifest = IngestManifest(vector_db.storage_path / "ingest_manifest.sqlite3")
+    
+    # A different embedding model makes every stored vector incompatible
+    previous_model = manifest.embedding_model
+    if not reset and previous_model and previous_model != settings.embedding_model:
+        print(f"⚠️  Embedding model changed ({previous_model} → {settings.embedding_model}); "
+              "re-embedding everything")
+        resume = retry_failed = False
+        reset = True
     
     # Reset if requested
     if reset:
         print("⚠️  Resetting existing database...")
         vector_db.reset()
+        manifest.clear()
         print("✅ Database reset complete\n")
     
-    # Find all PDF files
-    pdf_files = list(papers_dir.glob("*.pdf"))
+    # Passages for papers indexed before the chunk index was enabled
+    backfilled = vector_db.backfill_passages()
+    if backfilled:
+        print(f"✅ Split {backfilled} existing papers into passages\n")
+    
+    if resume:
+        entries = _current_entries(manifest, _resume_paths(manifest))
+    elif retry_failed:
+        entries = _current_entries(manifest, _retry_paths(manifest))
+    else:
+        entries = _scan_entries(vector_db, manifest, papers_dir)
+    
+    if not entries:
+        print("✅ Vector database is up to date")
+        return
+    
+    pending = {entry.path: entry for entry in entries}
+    run = manifest.last_run()
+    if resume and run is not None:
+        run_id = run["id"]
+    else:
+        run_id = manifest.start_run(list(pending))
+    
+    def commit_batch(batch: list[dict]) -> None:
+        manifest.commit_batch(
+            run_id, [pending[str(Path(paper["file_path"]).absolute())] for paper in batch]
+        )
     
-    if not pdf_files:
-        logger.warning("no_pdfs_found", path=str(papers_dir))
-        print(f"⚠️  No PDF files found in {papers_dir}")
-        sys.exit(0)
+    # Parse in parallel and write in checkpointed batches
+    print(f"Extracting with {workers or os.cpu_count() or 1} workers, writing batches of {batch_size}")
+    print("(Embedding generation may take a few minutes)\n")
     
-    print(f"Found {len(pdf_files)} PDF files\n")
-    print(f"{'='*60}")
-    print()
+    try:
+        stats = ingest_papers(
+            vector_db,
+            [Path(path) for path in pending],
+            workers=workers,
+            batch_size=batch_size,
+            on_batch=commit_batch,
+            on_failure=manifest.record_failure,
+        )
+    except Exception as e:
+        logger.error("database_initialization_error", error=str(e), run_id=run_id)
+        print(f"\n❌ Error adding papers to database: {e}")
+        print("   Committed batches are kept; rerun with --resume to continue")
+        sys.exit(1)
     
-    # Parse all papers
-    papers = []
-    failed = []
+    manifest.finish_run(run_id)
     
-    for i, pdf_path in enumerate(pdf_files, 1):
-        print(f"[{i}/{len(pdf_files)}] Processing: {pdf_path.name}")
-        
-        try:
-            paper = parse_paper(pdf_path)
-            papers.append(paper)
-            print(f"  ✅ Title: {paper['title'][:70]}")
-            print(f"  📄 Text length: {len(paper['full_text']):,} characters")
-            
-        except Exception as e:
-            failed.append((pdf_path.name, str(e)))
-            print(f"  ❌ Failed: {e}")
-        
-        print()
+    failed = stats.failed
     
-    # Add papers to vector database
-    if papers:
-        print(f"{'='*60}")
-        print(f"\nAdding {len(papers)} papers to vector database...")
-        print("(This may take a few minutes for embedding generation)\n")
+    if stats.papers:
+        print(f"\n✅ Successfully added {stats.papers} papers ({stats.pages} pages) "
+              f"in {stats.elapsed:.1f}s")
+        print(f"   Throughput: {stats.papers_per_sec:.2f} papers/s, {stats.pages_per_sec:.1f} pages/s")
+        if stats.duplicates:
+            print(f"   Left out {stats.duplicates} near-duplicates (NEAR_DUPLICATE_POLICY)")
         
-        try:
-            count = vector_db.add_papers(papers)
-            
-            print(f"✅ Successfully added {count} papers!")
-            
-            # Show stats
-            stats = vector_db.get_stats()
-            print(f"\n{'='*60}")
-            print("Database Statistics:")
-            print(f"{'='*60}")
-            print(f"Total papers: {stats['total_papers']}")
-            print(f"Embedding model: {stats['embedding_model']}")
-            print(f"Embedding dimension: {stats['embedding_dimension']}")
-            print(f"Storage path: {stats['storage_path']}")
-            print(f"{'='*60}\n")
-            
-        except Exception as e:
-            logger.error("database_initialization_error", error=str(e))
-            print(f"\n❌ Error adding papers to database: {e}")
-            sys.exit(1)
+        # Show stats
+        db_stats = vector_db.get_stats()
+        print(f"\n{'='*60}")
+        print("Database Statistics:")
+        print(f"{'='*60}")
+        print(f"Total papers: {db_stats['total_papers']}")
+        print(f"Embedding model: {db_stats['embedding_model']}")
+        print(f"Embedding dimension: {db_stats['embedding_dimension']}")
+        print(f"Storage path: {db_stats['storage_path']}")
+        print(f"{'='*60}\n")
     
     # Report failures
     if failed:
         print(f"\n⚠️  Failed to process {len(failed)} files:")
         for filename, error in failed:
             print(f"  - {filename}: {error}")
+        print("   Rerun with --retry-failed to index only these files")
     
     # Success!
     print("\n✅ Vector database initialization complete!")
     
-    if papers:
+    if stats.papers:
         print("\nYou can now run semantic searches using the Research Agent.")
         print("\nExample test search:")
         print("  >>> from app.services.vector_db import get_vector_db")
@@ -281,16 +633,39 @@ def main():
     parser = argparse.ArgumentParser(
         description="Initialize vector database with local papers"
     )
-    parser.add_argument(
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
         "--reset",
         action="store_true",
         help="Reset database before initializing",
     )
+    mode.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the last interrupted run from its checkpoint",
+    )
+    mode.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Index only files that failed in earlier runs",
+    )
     parser.add_argument(
         "--papers-dir",
         type=Path,
         help="Path to papers directory (default: data/papers)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="PDF extraction processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=32,
+        help="Papers per embed-and-write batch (default: 32)",
+    )
     
     args = parser.parse_args()
     
@@ -308,6 +683,10 @@ def main():
         initialize_from_papers(
             papers_dir=args.papers_dir,
             reset=args.reset,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            resume=args.resume,
+            retry_failed=args.retry_failed,
         )
     except KeyboardInterrupt:
         print("\n\n⚠️  Initialization cancelled by user")
@@ -56,6 +56,20 @@ class TestResearchAgent:
         assert result["query"] == "bioink formulation"
         assert "results" in result
 
+    @pytest.mark.asyncio
+    async def test_process_task_searches_vector_db(self, vector_db, sample_papers):
+        """Test query processing searches through the async vector DB."""
+        from app.services.async_vector_db import AsyncVectorDatabase
+
+        vector_db.add_papers(sample_papers)
+        agent = ResearchAgent(vector_db=AsyncVectorDatabase(vector_db))
+        result = await agent.process_task(
+            "task_123", {"query": "CRISPR gene editing", "filters": {"max_results": 2}}
+        )
+
+        assert result["total_found"] <= 2
+        assert result["results"][0]["id"] == "paper1"
+
     @pytest.mark.asyncio
     async def test_extract_intent_search(self):
         """Test intent extraction for search queries."""
@@ -9,13 +9,22 @@ from fastapi.testclient import TestClient
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 from io import BytesIO
+import hashlib
 import tempfile
+import time
 import shutil
+import tarfile
+import uuid
+import zipfile
 from pathlib import Path
 
+from app.config import settings
 from app.main import app
+from app.services.async_vector_db import get_async_vector_db
+from app.services.blob_store import get_blob_store
 from app.services.vector_db import get_vector_db, VectorDatabase
 from app.services.llm_client import get_llm_client, LLMClient
+from tests.test_pdf_processing import write_pdf
 
 
 @pytest.fixture
@@ -121,6 +130,29 @@ class TestDocumentList:
         """Test validation for limit above maximum"""
         response = client.get("/api/v1/documents?limit=101")
         assert response.status_code == 422  # Validation error
+    
+    def test_list_documents_cursor_walk(self, client, vector_db, sample_papers):
+        """Test following next_cursor visits every document once"""
+        vector_db.add_papers(sample_papers)
+        
+        seen = []
+        response = client.get("/api/v1/documents?limit=2")
+        data = response.json()
+        seen.extend(doc["id"] for doc in data["documents"])
+        
+        while data["next_cursor"]:
+            response = client.get(f"/api/v1/documents?limit=2&cursor={data['next_cursor']}")
+            assert response.status_code == 200
+            data = response.json()
+            seen.extend(doc["id"] for doc in data["documents"])
+        
+        assert sorted(seen) == ["paper1", "paper2", "paper3"]
+        assert data["has_next"] is False
+    
+    def test_list_documents_invalid_cursor(self, client):
+        """Test malformed cursors are rejected"""
+        response = client.get("/api/v1/documents?cursor=not-a-cursor")
+        assert response.status_code == 400
 
 
 class TestGetDocument:
@@ -167,6 +199,102 @@ class TestGetDocumentContent:
         assert "content" in data
         assert data["metadata"]["id"] == sample_papers[0]["id"]
         assert len(data["content"]) > 0
+    
+    def test_content_from_text_store(self, client, vector_db):
+        """Test the full text is served, not the truncated indexed text"""
+        body = "Rheology of bioinks. " * 1000
+        vector_db.add_papers([{"id": "long", "title": "Long paper", "abstract": "", "full_text": body}])
+        
+        data = client.get("/api/v1/documents/long/content").json()
+        assert data["content"] == body
+        assert data["total_bytes"] == len(body)
+        assert data["page_count"] == 1
+    
+    @pytest.mark.parametrize("query,content,byte_range", [
+        ("pages=2", "Page two text\n\n", [15, 29]),
+        ("pages=2-3", "Page two text\n\nPage three", [15, 39]),
+        ("bytes=0-3", "Page", [0, 3]),
+        ("bytes=30-", "Page three", [30, 39]),
+    ])
+    def test_content_ranges(self, client, vector_db, query, content, byte_range):
+        """Test page and byte ranges of the stored text"""
+        vector_db.add_papers([{
+            "id": "paged",
+            "title": "Paged paper",
+            "abstract": "",
+            "full_text": "Page one text\n\nPage two text\n\nPage three",
+            "page_offsets": [0, 15, 30],
+        }])
+        
+        response = client.get(f"/api/v1/documents/paged/content?{query}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["content"] == content
+        assert data["byte_range"] == byte_range
+        assert data["page_count"] == 3
+    
+    def test_empty_page_has_no_byte_range(self, client, vector_db):
+        """Test an empty page is returned without a byte range"""
+        vector_db.add_papers([{
+            "id": "blank-page",
+            "title": "Paper with a blank page",
+            "abstract": "",
+            "full_text": "Page one text\n\nPage three",
+            "page_offsets": [0, 15, 15],
+        }])
+        
+        data = client.get("/api/v1/documents/blank-page/content?pages=2").json()
+        assert data["content"] == ""
+        assert data["byte_range"] is None
+        assert data["page_count"] == 3
+    
+    @pytest.mark.parametrize("query,status", [
+        ("pages=abc", 400),
+        ("bytes=-5", 400),
+        ("pages=1&bytes=0-1", 400),
+        ("pages=9", 416),
+        ("bytes=5000-", 416),
+    ])
+    def test_invalid_ranges(self, client, vector_db, sample_papers, query, status):
+        """Test malformed ranges return 400 and unsatisfiable ones 416"""
+        vector_db.add_papers([sample_papers[0]])
+        
+        response = client.get(f"/api/v1/documents/{sample_papers[0]['id']}/content?{query}")
+        assert response.status_code == status
+    
+    def test_content_sections(self, client, vector_db):
+        """Test the outline is returned and a section can be read on its own"""
+        body = "Title\nAbstract\nShort summary.\nMethods\nRheometry.\nResults\nShear thinning.\n"
+        vector_db.add_papers([{"id": "sectioned", "title": "Sectioned", "abstract": "", "full_text": body}])
+        
+        data = client.get("/api/v1/documents/sectioned/content").json()
+        assert [section["name"] for section in data["sections"]] == [
+            "front_matter", "abstract", "methods", "results",
+        ]
+        
+        data = client.get("/api/v1/documents/sectioned/content?section=methods").json()
+        assert data["content"] == "Methods\nRheometry.\n"
+        assert data["total_bytes"] == len(body)
+        
+        response = client.get("/api/v1/documents/sectioned/content?section=discussion")
+        assert response.status_code == 404
+        
+        response = client.get("/api/v1/documents/sectioned/content?section=methods&pages=1")
+        assert response.status_code == 400
+    
+    def test_content_without_stored_text(self, client, vector_db):
+        """Test papers without stored full text fall back to the indexed text"""
+        vector_db.add_papers([{"id": "abstract-only", "title": "Abstract only", "abstract": "Only an abstract."}])
+        
+        data = client.get("/api/v1/documents/abstract-only/content").json()
+        assert "Only an abstract." in data["content"]
+        assert data["total_bytes"] is None
+        
+        response = client.get("/api/v1/documents/abstract-only/content?pages=1")
+        assert response.status_code == 416
+        
+        response = client.get("/api/v1/documents/abstract-only/content?section=abstract")
+        assert response.status_code == 416
 
 
 class TestUploadDocument:
@@ -196,6 +324,24 @@ class TestUploadDocument:
         response = client.post("/api/v1/documents", files=files, data=data)
         assert response.status_code in [200, 500]
     
+    def test_upload_invalid_pdf_structured_error(self, client):
+        """Test extraction failures are reported on the processing task"""
+        pdf_content = b"%PDF-1.4\n%Mock PDF content"
+        files = {"file": ("test.pdf", BytesIO(pdf_content), "application/pdf")}
+        
+        response = client.post("/api/v1/documents", files=files)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "processing"
+        
+        # TestClient runs background tasks before returning the response
+        task = client.get(f"/api/v1/stats/processing/{data['processing_task_id']}").json()
+        assert task["type"] == "upload"
+        assert task["status"] == "failed"
+        assert task["metadata"]["error_code"] == "invalid_pdf"
+        assert task["metadata"]["document_id"] == data["id"]
+        assert task["error"]
+    
     def test_upload_non_pdf_file(self, client):
         """Test uploading non-PDF file is rejected"""
         txt_content = b"This is not a PDF"
@@ -205,6 +351,44 @@ class TestUploadDocument:
         assert response.status_code == 400
         assert "PDF" in response.json()["detail"]
     
+    def test_upload_spoofed_pdf(self, client):
+        """Test files named .pdf without a PDF header are rejected"""
+        files = {"file": ("test.pdf", BytesIO(b"<html>not a pdf</html>"), "application/pdf")}
+        
+        response = client.post("/api/v1/documents", files=files)
+        assert response.status_code == 415
+        assert response.json()["detail"]["code"] == "not_pdf"
+    
+    def test_upload_too_large(self, client, monkeypatch):
+        """Test uploads over UPLOAD_MAX_BYTES are rejected"""
+        monkeypatch.setattr(settings, "upload_max_bytes", 1024)
+        pdf_content = b"%PDF-1.4\n" + b"x" * 2048
+        files = {"file": ("test.pdf", BytesIO(pdf_content), "application/pdf")}
+        
+        response = client.post("/api/v1/documents", files=files)
+        assert response.status_code == 413
+        assert response.json()["detail"]["code"] == "too_large"
+    
+    def test_upload_too_large_declared(self, client, monkeypatch):
+        """Test oversized request bodies are refused before being parsed"""
+        monkeypatch.setattr(settings, "upload_max_bytes", 1024)
+        pdf_content = b"%PDF-1.4\n" + b"x" * 128 * 1024
+        files = {"file": ("test.pdf", BytesIO(pdf_content), "application/pdf")}
+        
+        response = client.post("/api/v1/documents", files=files)
+        assert response.status_code == 413
+        assert response.json()["detail"]["code"] == "too_large"
+    
+    def test_upload_reports_hash(self, client):
+        """Test the stored file's size and SHA-256 are returned"""
+        pdf_content = b"%PDF-1.4\n%Mock PDF content"
+        files = {"file": ("test.pdf", BytesIO(pdf_content), "application/pdf")}
+        
+        response = client.post("/api/v1/documents", files=files)
+        data = response.json()
+        assert data["size"] == len(pdf_content)
+        assert data["sha256"] == hashlib.sha256(pdf_content).hexdigest()
+    
     def test_upload_response_structure(self, client):
         """Test upload response contains expected fields"""
         pdf_content = b"%PDF-1.4\n%Mock PDF content"
@@ -218,6 +402,219 @@ class TestUploadDocument:
             assert "message" in data
 
 
+class TestBulkUpload:
+    """Tests for POST /api/v1/documents/bulk"""
+    
+    @pytest.fixture
+    def pdf_bytes(self, temp_db_path):
+        """Two valid one-page PDFs, unique to each test"""
+        tag = uuid.uuid4().hex
+        return [
+            write_pdf(temp_db_path / f"paper{i}.pdf", [f"Bulk paper {i} {tag}"], title=f"Bulk Paper {i}").read_bytes()
+            for i in range(2)
+        ]
+    
+    def _task(self, client, data):
+        return client.get(f"/api/v1/stats/processing/{data['processing_task_id']}").json()
+    
+    def test_bulk_pdfs(self, client, vector_db, pdf_bytes):
+        """Test several PDFs are indexed under one task"""
+        files = [
+            ("files", (f"paper{i}.pdf", BytesIO(content), "application/pdf"))
+            for i, content in enumerate(pdf_bytes)
+        ]
+        
+        response = client.post("/api/v1/documents/bulk", files=files)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["queued"] == 2
+        assert data["skipped"] == 0
+        
+        task = self._task(client, data)
+        assert task["type"] == "bulk_upload"
+        assert task["status"] == "completed"
+        assert task["metadata"]["indexed"] == 2
+        for result in task["metadata"]["files"]:
+            assert result["status"] == "indexed"
+            assert vector_db.get_paper(result["document_id"]) is not None
+    
+    def test_bulk_index_outlasts_request_timeout(self, client, vector_db, pdf_bytes, monkeypatch):
+        """Test slow batch writes are waited for instead of failed and discarded"""
+        add_papers = vector_db.add_papers
+        
+        def slow_add_papers(papers):
+            time.sleep(0.2)
+            return add_papers(papers)
+        
+        monkeypatch.setattr(vector_db, "add_papers", slow_add_papers)
+        monkeypatch.setattr(get_async_vector_db(vector_db), "timeout", 0.05)
+        files = [
+            ("files", (f"paper{i}.pdf", BytesIO(content), "application/pdf"))
+            for i, content in enumerate(pdf_bytes)
+        ]
+        
+        data = client.post("/api/v1/documents/bulk", files=files).json()
+        
+        results = self._task(client, data)["metadata"]["files"]
+        assert [result["status"] for result in results] == ["indexed", "indexed"]
+        for result in results:
+            assert get_blob_store().path_for(result["sha256"]).exists()
+    
+    def test_bulk_zip_archive(self, client, pdf_bytes):
+        """Test ZIP members are unpacked and non-PDF members skipped"""
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("papers/a.pdf", pdf_bytes[0])
+            archive.writestr("papers/b.pdf", pdf_bytes[1])
+            archive.writestr("papers/broken.pdf", b"%PDF-1.4\n%Mock PDF content")
+            archive.writestr("README.txt", "not a paper")
+        buffer.seek(0)
+        
+        response = client.post(
+            "/api/v1/documents/bulk",
+            files=[("files", ("papers.zip", buffer, "application/zip"))],
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["queued"] == 3
+        assert data["skipped"] == 1
+        
+        results = {result["filename"]: result for result in self._task(client, data)["metadata"]["files"]}
+        assert results["papers.zip/papers/a.pdf"]["status"] == "indexed"
+        assert results["papers.zip/papers/b.pdf"]["status"] == "indexed"
+        assert results["papers.zip/papers/broken.pdf"]["status"] == "failed"
+        assert results["papers.zip/papers/broken.pdf"]["error_code"] == "invalid_pdf"
+        assert results["papers.zip/README.txt"]["status"] == "skipped"
+    
+    def test_bulk_tar_archive(self, client, pdf_bytes):
+        """Test compressed TAR archives are read as a stream"""
+        buffer = BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+            for i, content in enumerate(pdf_bytes):
+                info = tarfile.TarInfo(f"paper{i}.pdf")
+                info.size = len(content)
+                archive.addfile(info, BytesIO(content))
+        buffer.seek(0)
+        
+        response = client.post(
+            "/api/v1/documents/bulk",
+            files=[("files", ("papers.tar.gz", buffer, "application/gzip"))],
+        )
+        assert response.status_code == 200
+        assert response.json()["queued"] == 2
+        assert self._task(client, response.json())["metadata"]["indexed"] == 2
+    
+    def test_bulk_duplicates(self, client, pdf_bytes):
+        """Test PDFs already stored are returned as the existing document"""
+        first = client.post(
+            "/api/v1/documents/bulk",
+            files=[("files", ("a.pdf", BytesIO(pdf_bytes[0]), "application/pdf"))],
+        ).json()
+        
+        response = client.post(
+            "/api/v1/documents/bulk",
+            files=[
+                ("files", ("again.pdf", BytesIO(pdf_bytes[0]), "application/pdf")),
+                ("files", ("b.pdf", BytesIO(pdf_bytes[1]), "application/pdf")),
+            ],
+        )
+        data = response.json()
+        assert data["queued"] == 1
+        assert data["files"][0]["status"] == "duplicate"
+        assert data["files"][0]["document_id"] == first["files"][0]["document_id"]
+    
+    def test_bulk_without_pdfs(self, client):
+        """Test uploads containing no PDFs are rejected"""
+        files = [("files", ("notes.txt", BytesIO(b"text"), "text/plain"))]
+        
+        response = client.post("/api/v1/documents/bulk", files=files)
+        assert response.status_code == 400
+
+
+class TestContentAddressedStorage:
+    """Tests for upload deduplication through the blob store"""
+    
+    @pytest.fixture
+    def pdf_content(self, temp_db_path):
+        """Valid PDF unique to each test"""
+        return write_pdf(temp_db_path / "paper.pdf", [f"Stored once {uuid.uuid4().hex}"]).read_bytes()
+    
+    def _upload(self, client, content):
+        files = {"file": ("paper.pdf", BytesIO(content), "application/pdf")}
+        response = client.post("/api/v1/documents", files=files)
+        assert response.status_code == 200
+        return response.json()
+    
+    def test_identical_upload_returns_existing_document(self, client, pdf_content):
+        """Test uploading the same bytes twice yields one document and one blob"""
+        first = self._upload(client, pdf_content)
+        second = self._upload(client, pdf_content)
+        
+        assert first["status"] == "processing"
+        assert second["status"] == "duplicate"
+        assert second["id"] == first["id"]
+        assert second["processing_task_id"] is None
+        assert get_blob_store().document_for(first["sha256"]) == first["id"]
+    
+    def test_blob_is_sharded(self, client, pdf_content):
+        """Test stored files live under blobs/<2>/<2>/<sha256>.pdf"""
+        data = self._upload(client, pdf_content)
+        path = get_blob_store().path_for(data["sha256"])
+        
+        assert path.exists()
+        assert path.parent.name == data["sha256"][2:4]
+        assert path.parent.parent.name == data["sha256"][:2]
+    
+    def test_delete_releases_blob(self, client, pdf_content):
+        """Test deleting the document removes its blob and allows re-upload"""
+        data = self._upload(client, pdf_content)
+        path = get_blob_store().path_for(data["sha256"])
+        
+        response = client.delete(f"/api/v1/documents/{data['id']}")
+        assert response.status_code == 200
+        assert not path.exists()
+        assert get_blob_store().document_for(data["sha256"]) is None
+        
+        assert self._upload(client, pdf_content)["status"] == "processing"
+    
+    def test_duplicate_upload_holds_a_reference(self, client, pdf_content):
+        """Test each upload of the same bytes must delete before the document goes"""
+        first = self._upload(client, pdf_content)
+        self._upload(client, pdf_content)
+        path = get_blob_store().path_for(first["sha256"])
+        
+        response = client.delete(f"/api/v1/documents/{first['id']}")
+        assert response.status_code == 200
+        assert path.exists()
+        assert get_blob_store().references(first["id"]) == 1
+        
+        assert client.delete(f"/api/v1/documents/{first['id']}").status_code == 200
+        assert not path.exists()
+        assert client.delete(f"/api/v1/documents/{first['id']}").status_code == 404
+    
+    def test_failed_delete_keeps_blob(self, client, vector_db, pdf_content, monkeypatch):
+        """Test the file is kept when the document cannot be removed from the index"""
+        data = self._upload(client, pdf_content)
+        path = get_blob_store().path_for(data["sha256"])
+        
+        def fail(document_id):
+            raise RuntimeError("index unavailable")
+        
+        monkeypatch.setattr(vector_db, "delete_paper", fail)
+        response = client.delete(f"/api/v1/documents/{data['id']}")
+        
+        assert response.status_code == 500
+        assert path.exists()
+        assert get_blob_store().references(data["id"]) == 1
+    
+    def test_failed_processing_releases_blob(self, client):
+        """Test blobs of uploads that fail extraction are not kept"""
+        data = self._upload(client, b"%PDF-1.4\n%Mock PDF content " + uuid.uuid4().bytes)
+        
+        assert not get_blob_store().path_for(data["sha256"]).exists()
+        assert get_blob_store().document_for(data["sha256"]) is None
+
+
 class TestDeleteDocument:
     """Tests for DELETE /api/v1/documents/{document_id}"""
     
@@ -245,6 +642,24 @@ class TestDeleteDocument:
 class TestSearchDocuments:
     """Tests for POST /api/v1/documents/search"""
     
+    @pytest.mark.parametrize("search_type", ["semantic", "keyword", "hybrid"])
+    def test_search_collapse_duplicates(self, client, vector_db, sample_papers, search_type, monkeypatch):
+        """Test near-duplicate clusters collapse into one result"""
+        monkeypatch.setattr(settings, "near_duplicate_policy", "link")
+        vector_db.add_papers(sample_papers + [{**sample_papers[0], "id": "paper1-copy"}])
+        
+        response = client.post("/api/v1/documents/search", json={
+            "query": "CRISPR gene editing scaffolds",
+            "search_type": search_type,
+            "collapse_duplicates": True,
+        })
+        assert response.status_code == 200
+        
+        results = response.json()["results"]
+        ids = [result["document"]["id"] for result in results]
+        assert len({"paper1", "paper1-copy"} & set(ids)) == 1
+        assert results[0]["duplicates"] in (["paper1"], ["paper1-copy"])
+    
     def test_search_semantic(self, client, vector_db, sample_papers):
         """Test semantic search"""
         # Add papers to vector DB
@@ -280,6 +695,38 @@ class TestSearchDocuments:
         assert response.status_code == 200
         assert response.json()["search_type"] == "keyword"
     
+    def test_search_hybrid(self, client, vector_db, sample_papers):
+        """Test hybrid search reports fused results and stage timings"""
+        vector_db.add_papers(sample_papers)
+        
+        search_query = {
+            "query": "hydrogel bioink printing",
+            "limit": 2,
+            "search_type": "hybrid",
+            "depth": 2
+        }
+        
+        response = client.post("/api/v1/documents/search", json=search_query)
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["search_type"] == "hybrid"
+        assert 0 < len(data["results"]) <= 2
+        assert data["results"][0]["document"]["id"] == "paper2"
+        for stage in ("semantic_ms", "keyword_ms", "fusion_ms", "total_ms"):
+            assert stage in data["timings"]
+    
+    def test_search_hybrid_invalid_fusion(self, client):
+        """Test hybrid search rejects unknown fusion methods"""
+        search_query = {
+            "query": "bioink",
+            "search_type": "hybrid",
+            "fusion": "median"
+        }
+        
+        response = client.post("/api/v1/documents/search", json=search_query)
+        assert response.status_code == 422
+    
     def test_search_with_filters(self, client):
         """Test search with metadata filters"""
         search_query = {
@@ -345,6 +792,55 @@ class TestSearchDocuments:
         assert data["execution_time_ms"] >= 0
 
 
+class TestBatchSearch:
+    """Tests for POST /api/v1/documents/search/batch"""
+    
+    def test_batch_search_per_query_results(self, client, vector_db, sample_papers):
+        """Test results are returned per query, in order"""
+        vector_db.add_papers(sample_papers)
+        
+        response = client.post("/api/v1/documents/search/batch", json={
+            "queries": ["CRISPR gene editing", "neural network manufacturing"],
+            "limit": 2
+        })
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert [r["query"] for r in data["results"]] == ["CRISPR gene editing", "neural network manufacturing"]
+        assert data["results"][0]["results"][0]["document"]["id"] == "paper1"
+        assert data["results"][1]["results"][0]["document"]["id"] == "paper3"
+        assert data["total"] == sum(r["total"] for r in data["results"])
+    
+    def test_batch_search_dedup(self, client, vector_db, sample_papers):
+        """Test dedup returns each document once across queries"""
+        vector_db.add_papers(sample_papers)
+        
+        response = client.post("/api/v1/documents/search/batch", json={
+            "queries": ["bioink", "bioprinting hydrogel"],
+            "limit": 3,
+            "dedup": True
+        })
+        assert response.status_code == 200
+        
+        ids = [
+            hit["document"]["id"]
+            for result in response.json()["results"]
+            for hit in result["results"]
+        ]
+        assert len(ids) == len(set(ids))
+    
+    def test_batch_search_validation(self, client):
+        """Test empty batches and unknown search types are rejected"""
+        response = client.post("/api/v1/documents/search/batch", json={"queries": []})
+        assert response.status_code == 422
+        
+        response = client.post("/api/v1/documents/search/batch", json={
+            "queries": ["bioink"],
+            "search_type": "fuzzy"
+        })
+        assert response.status_code == 422
+
+
 class TestDocumentSummary:
     """Tests for GET /api/v1/documents/{document_id}/summary"""
     
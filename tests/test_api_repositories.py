@@ -188,6 +188,11 @@ class TestListRepositoryDocuments:
         """Test validation for invalid limit"""
         response = client.get("/api/v1/repositories/arxiv/documents?limit=0")
         assert response.status_code == 422
+    
+    def test_list_documents_invalid_cursor(self, client):
+        """Test malformed cursors are rejected"""
+        response = client.get("/api/v1/repositories/local/documents?cursor=%%%")
+        assert response.status_code == 400
 
 
 class TestTestRepositoryConnection:
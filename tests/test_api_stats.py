@@ -9,6 +9,7 @@ from fastapi.testclient import TestClient
 from datetime import datetime
 
 from app.main import app
+from app.services.task_registry import get_task_registry
 
 
 @pytest.fixture
@@ -158,6 +159,22 @@ class TestTaskStatus:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
     
+    def test_get_created_task(self, client):
+        """Test registered tasks are served under both status paths"""
+        task_id = get_task_registry().create("upload", {"document_id": "doc-1"})
+        
+        for path in ("status", "stats"):
+            response = client.get(f"/api/v1/{path}/processing/{task_id}")
+            assert response.status_code == 200
+            data = response.json()
+            assert data["task_id"] == task_id
+            assert data["status"] == "pending"
+            assert data["metadata"]["document_id"] == "doc-1"
+        
+        listed = client.get("/api/v1/status/processing?status=pending").json()
+        assert task_id in [task["task_id"] for task in listed["tasks"]]
+        assert listed["pending_tasks"] >= 1
+    
     def test_get_task_status_structure(self, client):
         """Test task status response structure"""
         # TODO: Create task first, then query it
@@ -176,6 +193,37 @@ class TestTaskStatus:
             assert 0 <= data["progress"] <= 100
 
 
+class TestEmbeddingStats:
+    """Tests for GET /api/v1/stats/embeddings"""
+    
+    def test_get_embedding_stats(self, client):
+        """Test embedding batching metrics structure"""
+        response = client.get("/api/v1/stats/embeddings")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["total_requests"] >= 0
+        assert data["total_batches"] >= 0
+        assert "requests_per_second" in data
+        assert set(data["latency_ms"]) == {"p50", "p95", "p99"}
+        assert data["config"]["max_batch_size"] >= 1
+
+
+class TestCacheStats:
+    """Tests for GET /api/v1/stats/cache"""
+    
+    def test_get_cache_stats(self, client):
+        """Test cache statistics structure"""
+        response = client.get("/api/v1/stats/cache")
+        assert response.status_code == 200
+        
+        data = response.json()
+        for cache in ("query_embeddings", "search_results"):
+            assert data[cache]["max_bytes"] >= 0
+            assert 0.0 <= data[cache]["hit_rate"] <= 1.0
+        assert data["generation"] >= 0
+
+
 class TestAgentStats:
     """Tests for GET /api/v1/stats/agents"""
     
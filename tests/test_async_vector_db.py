@@ -0,0 +1,121 @@
+"""
+Tests for the async VectorDatabase facade.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.async_vector_db import (
+    AsyncVectorDatabase,
+    VectorDatabaseBusyError,
+    VectorDatabaseTimeoutError,
+    get_async_vector_db,
+)
+
+
+class SlowDatabase:
+    """Stand-in for VectorDatabase whose calls block their thread."""
+
+    def __init__(self, delay=0.2, gate=None):
+        self.delay = delay
+        self.gate = gate
+        self.threads = set()
+
+    def get_stats(self):
+        self.threads.add(threading.get_ident())
+        if self.gate is not None:
+            self.gate.wait()
+        time.sleep(self.delay)
+        return {"total_papers": 0}
+
+    def add_papers(self, papers):
+        time.sleep(self.delay)
+        return len(papers)
+
+    def duplicate_of(self, paper_id):
+        return None
+
+
+class TestAsyncVectorDatabase:
+    """Test executor offloading, queue limits and timeouts."""
+
+    @pytest.mark.asyncio
+    async def test_calls_run_off_event_loop(self, vector_db, sample_papers):
+        """Test methods proxy to the wrapped database."""
+        async_db = AsyncVectorDatabase(vector_db)
+
+        assert await async_db.add_papers(sample_papers) == 3
+        results = await async_db.search("CRISPR gene editing", n_results=1)
+        paper = await async_db.get_paper("paper1")
+
+        assert results[0]["id"] == "paper1"
+        assert paper["id"] == "paper1"
+        assert async_db.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self):
+        """Test concurrent slow calls overlap instead of serializing."""
+        slow = SlowDatabase(delay=0.2)
+        async_db = AsyncVectorDatabase(slow, max_workers=4)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(async_db.get_stats() for _ in range(4)))
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.6
+        assert threading.get_ident() not in slow.threads
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_limit(self):
+        """Test calls beyond max_pending fail fast."""
+        gate = threading.Event()
+        async_db = AsyncVectorDatabase(SlowDatabase(delay=0, gate=gate), max_workers=1, max_pending=2)
+
+        first = asyncio.ensure_future(async_db.get_stats())
+        second = asyncio.ensure_future(async_db.get_stats())
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(VectorDatabaseBusyError) as exc_info:
+            await async_db.get_stats()
+        assert exc_info.value.status_code == 503
+
+        gate.set()
+        await asyncio.gather(first, second)
+        assert async_db.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Test slow operations raise a timeout error."""
+        async_db = AsyncVectorDatabase(SlowDatabase(delay=0.5), timeout=0.05)
+
+        with pytest.raises(VectorDatabaseTimeoutError) as exc_info:
+            await async_db.get_stats()
+        assert exc_info.value.status_code == 504
+
+    @pytest.mark.asyncio
+    async def test_ingest_ignores_request_limits(self):
+        """Test background ingest outlasts the timeout and bypasses the queue limit."""
+        gate = threading.Event()
+        async_db = AsyncVectorDatabase(
+            SlowDatabase(delay=0.2, gate=gate), max_workers=1, max_pending=1, timeout=0.05
+        )
+        blocked = asyncio.ensure_future(async_db.get_stats())
+        await asyncio.sleep(0.05)
+
+        duplicates = await async_db.ingest_papers([{"id": "paper1"}])
+        assert duplicates == {"paper1": None}
+
+        gate.set()
+        with pytest.raises(VectorDatabaseTimeoutError):
+            await blocked
+
+    def test_dependency_shares_facade(self, vector_db):
+        """Test one facade is reused per underlying database."""
+        first = get_async_vector_db(vector_db)
+        second = get_async_vector_db(vector_db)
+
+        assert first is second
+        assert first.sync is vector_db
@@ -0,0 +1,139 @@
+"""
+Tests for the content-addressed blob store.
+"""
+
+import hashlib
+import sqlite3
+
+import pytest
+
+from app.services.blob_store import BlobStore
+from app.services.storage_ledger import StorageLedger
+
+
+@pytest.fixture
+def store(temp_db_path):
+    """Blob store with its index beside the storage root."""
+    store = BlobStore(temp_db_path / "documents", temp_db_path / "blob_store.sqlite3")
+    yield store
+    store.close()
+
+
+def write_incoming(store, name, content):
+    """Write an incoming file and return it with its hash."""
+    path = store.root / f"{name}.pdf"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path, hashlib.sha256(content).hexdigest()
+
+
+class TestBlobStore:
+    """Test adding, deduplicating and releasing blobs."""
+
+    def test_add_moves_into_shard(self, store):
+        """Test new files are moved to their sharded path."""
+        path, sha256 = write_incoming(store, "doc-1", b"%PDF-1.4 one")
+
+        ref = store.add(path, sha256, "doc-1")
+
+        assert ref.created
+        assert ref.path == store.blob_root / sha256[:2] / sha256[2:4] / f"{sha256}.pdf"
+        assert ref.path.read_bytes() == b"%PDF-1.4 one"
+        assert not path.exists()
+
+    def test_dedup_returns_existing_document(self, store):
+        """Test identical bytes resolve to the first document."""
+        path, sha256 = write_incoming(store, "doc-1", b"%PDF-1.4 same")
+        store.add(path, sha256, "doc-1")
+        path, _ = write_incoming(store, "doc-2", b"%PDF-1.4 same")
+
+        ref = store.add(path, sha256, "doc-2")
+
+        assert not ref.created
+        assert ref.document_id == "doc-1"
+        assert not path.exists()
+        assert store.document_for(sha256) == "doc-1"
+
+    def test_release_deletes_blob(self, store):
+        """Test releasing the only reference deletes the blob."""
+        path, sha256 = write_incoming(store, "doc-1", b"%PDF-1.4 owned")
+        store.add(path, sha256, "doc-1")
+        blob = store.path_for(sha256)
+
+        assert store.get_stats() == {"blobs": 1, "references": 1}
+        assert store.release("doc-1") == 0
+        assert not blob.exists()
+        assert store.document_for(sha256) is None
+        assert store.get_stats() == {"blobs": 0, "references": 0}
+
+    def test_duplicate_uploads_are_counted(self, store):
+        """Test a blob lives until every upload's reference is released."""
+        for reference in ("doc-1", "upload-2", "upload-3"):
+            path, sha256 = write_incoming(store, reference, b"%PDF-1.4 shared")
+            assert store.add(path, sha256, reference).document_id == "doc-1"
+        blob = store.path_for(sha256)
+
+        assert store.references("doc-1") == 3
+        assert store.get_stats() == {"blobs": 1, "references": 3}
+        assert store.release("doc-1") == 2
+        assert store.release("doc-1") == 1
+        assert blob.exists()
+        assert store.release("doc-1") == 0
+        assert not blob.exists()
+
+    def test_release_specific_reference(self, store):
+        """Test releasing the first upload's reference keeps a duplicate's."""
+        for reference in ("doc-1", "upload-2"):
+            path, sha256 = write_incoming(store, reference, b"%PDF-1.4 failed first")
+            store.add(path, sha256, reference)
+
+        assert store.release("doc-1", reference="doc-1") == 1
+        assert store.release("doc-1", reference="doc-1") is None
+        assert store.path_for(sha256).exists()
+        assert store.document_for(sha256) == "doc-1"
+
+    def test_migrates_single_owner_index(self, temp_db_path):
+        """Test an index from before per-upload references keeps its blobs."""
+        db_path = temp_db_path / "legacy.sqlite3"
+        conn = sqlite3.connect(str(db_path))
+        conn.executescript(
+            "CREATE TABLE refs (document_id TEXT PRIMARY KEY, sha256 TEXT NOT NULL, "
+            "created_at REAL NOT NULL) WITHOUT ROWID;"
+            "CREATE INDEX idx_refs_sha256 ON refs (sha256);"
+            "INSERT INTO refs VALUES ('doc-1', 'abc', 1.0);"
+        )
+        conn.commit()
+        conn.close()
+
+        store = BlobStore(temp_db_path / "documents", db_path)
+
+        assert store.document_for("abc") == "doc-1"
+        assert store.references("doc-1") == 1
+        store.close()
+
+    def test_readd_after_release(self, store):
+        """Test bytes uploaded again after a release get a new blob."""
+        path, sha256 = write_incoming(store, "doc-1", b"%PDF-1.4 again")
+        store.add(path, sha256, "doc-1")
+        store.release("doc-1")
+        path, _ = write_incoming(store, "doc-2", b"%PDF-1.4 again")
+
+        ref = store.add(path, sha256, "doc-2")
+
+        assert ref.created
+        assert ref.path.exists()
+        assert store.document_for(sha256) == "doc-2"
+
+    def test_release_unknown(self, store):
+        """Test releasing a document without a blob is a no-op."""
+        assert store.release("missing") is None
+
+    def test_ledger_attributes_blobs_to_documents(self, store):
+        """Test reconciliation attributes hash-named blobs to their owners."""
+        path, sha256 = write_incoming(store, "doc-1", b"%PDF-1.4 owned")
+        store.add(path, sha256, "doc-1")
+        ledger = StorageLedger(store.root, owners=store.owners)
+
+        ledger.reconcile()
+
+        assert ledger.usage("doc-1") == {"bytes": len(b"%PDF-1.4 owned"), "files": 1}
@@ -0,0 +1,151 @@
+"""
+Tests for the SQLite document catalog.
+"""
+
+import pytest
+
+from app.services.catalog import DocumentCatalog, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def catalog(temp_db_path):
+    """Create a fresh DocumentCatalog in a temporary directory."""
+    catalog = DocumentCatalog(temp_db_path / "catalog.sqlite3")
+    yield catalog
+    catalog.close()
+
+
+@pytest.fixture
+def populated_catalog(catalog):
+    """Catalog a few papers with distinct creation times."""
+    catalog.upsert([
+        ("a", {"title": "Hydrogel bioinks", "year": 2022, "source": "arxiv", "created_at": "2024-01-01T00:00:00"}),
+        ("b", {"title": "Cell viability", "year": 2023, "source": "arxiv", "created_at": "2024-01-02T00:00:00"}),
+        ("c", {"title": "Neural networks", "year": 2023, "source": "local", "created_at": "2024-01-03T00:00:00"}),
+    ])
+    return catalog
+
+
+class TestDocumentCatalog:
+    """Test catalog writes, paging and filtered counts."""
+
+    def test_upsert_and_get(self, populated_catalog):
+        """Test metadata round-trips through the catalog."""
+        assert populated_catalog.get("a")["title"] == "Hydrogel bioinks"
+        assert populated_catalog.get("missing") is None
+
+    def test_upsert_replaces_existing(self, populated_catalog):
+        """Test re-adding a paper updates its row instead of duplicating it."""
+        populated_catalog.upsert([("a", {"title": "Renamed", "year": 2022, "source": "arxiv"})])
+
+        assert populated_catalog.count() == 3
+        assert populated_catalog.get("a")["title"] == "Renamed"
+
+    def test_page_ordered_by_created_at(self, populated_catalog):
+        """Test pages follow creation order and respect limit/offset."""
+        first = populated_catalog.page(limit=2)
+        second = populated_catalog.page(limit=2, offset=2)
+
+        assert [paper_id for paper_id, _ in first] == ["a", "b"]
+        assert [paper_id for paper_id, _ in second] == ["c"]
+
+    def test_page_after_position(self, populated_catalog):
+        """Test keyset paging resumes strictly after the given position."""
+        page = populated_catalog.page(limit=10, after=("2024-01-01T00:00:00", "a"))
+        assert [paper_id for paper_id, _ in page] == ["b", "c"]
+
+        filtered = populated_catalog.page(
+            limit=10, after=("2024-01-01T00:00:00", "a"), filters={"source": "arxiv"}
+        )
+        assert [paper_id for paper_id, _ in filtered] == ["b"]
+
+    def test_page_after_is_stable_under_inserts(self, populated_catalog):
+        """Test papers added mid-walk do not shift the following page."""
+        first = populated_catalog.page(limit=2)
+        populated_catalog.upsert([("0", {"title": "Early", "created_at": "2023-12-31T00:00:00"})])
+
+        last_created, last_id = "2024-01-02T00:00:00", first[-1][0]
+        second = populated_catalog.page(limit=2, after=(last_created, last_id))
+
+        assert [paper_id for paper_id, _ in second] == ["c"]
+
+    def test_filtered_count_and_page(self, populated_catalog):
+        """Test filters apply to both the page and the total."""
+        filters = {"source": "arxiv", "year": 2023}
+
+        assert populated_catalog.count(filters) == 1
+        assert [paper_id for paper_id, _ in populated_catalog.page(filters=filters)] == ["b"]
+        assert populated_catalog.count({"year_min": 2023}) == 2
+
+    def test_delete_and_clear(self, populated_catalog):
+        """Test rows are removed on delete and clear."""
+        assert populated_catalog.delete("a") is True
+        assert populated_catalog.delete("a") is False
+        assert populated_catalog.count() == 2
+
+        populated_catalog.clear()
+        assert populated_catalog.count() == 0
+
+
+class TestFacets:
+    """Test incrementally maintained facet counts."""
+
+    def test_counts_after_upsert(self, catalog):
+        """Test year, source and author counts track added papers."""
+        catalog.upsert([
+            ("a", {"year": 2023, "source": "arxiv", "authors": "Smith, Lee"}),
+            ("b", {"year": 2023, "source": "local", "authors": "Smith"}),
+            ("c", {"source": "arxiv"}),
+        ])
+
+        assert catalog.facet_counts("year") == {"2023": 2}
+        assert catalog.facet_counts("source") == {"arxiv": 2, "local": 1}
+        assert catalog.facet_counts("author", limit=1) == {"Smith": 2}
+
+    def test_replace_and_delete_adjust_counts(self, catalog):
+        """Test replaced and deleted papers give back their counts."""
+        catalog.upsert([
+            ("a", {"year": 2022, "source": "arxiv"}),
+            ("b", {"year": 2023, "source": "arxiv"}),
+        ])
+
+        catalog.upsert([("a", {"year": 2024, "source": "arxiv"})])
+        catalog.delete("b")
+
+        assert catalog.facet_counts("year") == {"2024": 1}
+        assert catalog.facet_counts("source") == {"arxiv": 1}
+
+    def test_clear_and_rebuild(self, populated_catalog, temp_db_path):
+        """Test clear empties facets and older catalogs get them rebuilt."""
+        expected = populated_catalog.facet_counts("source")
+        with populated_catalog._conn:
+            populated_catalog._conn.execute("DELETE FROM facets")
+
+        reopened = DocumentCatalog(temp_db_path / "catalog.sqlite3")
+        assert reopened.facet_counts("source") == expected
+
+        reopened.clear()
+        assert reopened.facet_counts("source") == {}
+        reopened.close()
+
+    def test_unknown_facet(self, catalog):
+        """Test unknown facets are rejected."""
+        with pytest.raises(ValueError):
+            catalog.facet_counts("journal")
+
+
+class TestCursor:
+    """Test cursor token encoding."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the position it encodes."""
+        cursor = encode_cursor("2024-01-01T00:00:00", "paper/1")
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == ("2024-01-01T00:00:00", "paper/1")
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor("a", "b")[:-2] + "!!"])
+    def test_invalid_cursor(self, cursor):
+        """Test malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
@@ -0,0 +1,98 @@
+"""
+Tests for MinHash signatures and the near-duplicate LSH index.
+"""
+
+import pytest
+
+from app.services.dedup_index import NearDuplicateIndex, jaccard, minhash
+
+BASE = (
+    "Hydrogel bioinks with tunable stiffness were printed into lattice scaffolds "
+    "and seeded with mesenchymal stem cells. Viability remained above ninety "
+    "percent after seven days and osteogenic markers increased with stiffness. "
+    "Rheological measurements showed shear thinning behaviour suitable for "
+    "extrusion printing at physiological temperature."
+)
+
+
+@pytest.fixture
+def index(temp_db_path):
+    """Empty near-duplicate index."""
+    index = NearDuplicateIndex(temp_db_path / "dedup_index.sqlite3")
+    yield index
+    index.close()
+
+
+class TestMinHash:
+    """Test signatures estimate shingle similarity."""
+
+    def test_identical_texts(self):
+        """Test identical texts have identical signatures."""
+        assert jaccard(minhash(BASE), minhash(BASE)) == 1.0
+
+    def test_small_edit_stays_similar(self):
+        """Test a light revision is still highly similar."""
+        revised = BASE.replace("seven days", "one week") + " Preprint version."
+
+        assert jaccard(minhash(BASE), minhash(revised)) > 0.6
+
+    def test_unrelated_texts(self):
+        """Test unrelated texts have low similarity."""
+        other = "Neural network controllers optimise injection moulding cycle times in factories."
+
+        assert jaccard(minhash(BASE), minhash(other)) < 0.2
+
+    def test_empty_text(self):
+        """Test texts without words have no signature."""
+        assert minhash("  ...  ") is None
+
+
+class TestNearDuplicateIndex:
+    """Test LSH lookup, clusters and removal."""
+
+    def test_find_match(self, index):
+        """Test a near-duplicate resolves to the canonical paper."""
+        index.add("paper1", minhash(BASE))
+
+        match = index.find(minhash(BASE + " Accepted manuscript."), threshold=0.8)
+
+        assert match is not None
+        assert match[0] == "paper1"
+        assert match[1] >= 0.8
+
+    def test_no_match_below_threshold(self, index):
+        """Test dissimilar papers are not matched."""
+        index.add("paper1", minhash(BASE))
+
+        assert index.find(minhash("Entirely different robotics paper text here."), 0.8) is None
+
+    def test_exclude_self(self, index):
+        """Test re-indexing a paper does not match itself."""
+        index.add("paper1", minhash(BASE))
+
+        assert index.find(minhash(BASE), 0.8, exclude_id="paper1") is None
+
+    def test_links_and_aliases(self, index):
+        """Test linked members and aliases report their canonical paper."""
+        index.add("paper1", minhash(BASE))
+        index.add("paper2", minhash(BASE), canonical_id="paper1", similarity=1.0)
+        index.add_alias("paper3", "paper1", 0.9, "skip")
+
+        assert index.duplicate_of("paper1") is None
+        assert index.duplicate_of("paper2") == {"canonical_id": "paper1", "similarity": 1.0, "policy": "link"}
+        assert index.duplicate_of("paper3")["policy"] == "skip"
+        assert index.cluster("paper1") == ["paper1", "paper2"]
+        assert index.canonical_ids(["paper1", "paper2"]) == {"paper1": "paper1", "paper2": "paper1"}
+        assert index.get_stats() == {"papers": 2, "clusters": 1, "linked": 1, "aliases": 1}
+
+    def test_remove_canonical_promotes_member(self, index):
+        """Test removing a canonical paper promotes the next member."""
+        index.add("paper1", minhash(BASE))
+        index.add("paper2", minhash(BASE), canonical_id="paper1", similarity=1.0)
+        index.add("paper3", minhash(BASE), canonical_id="paper1", similarity=1.0)
+
+        index.remove("paper1")
+
+        assert index.cluster("paper2") == ["paper2", "paper3"]
+        assert index.duplicate_of("paper2") is None
+        assert index.find(minhash(BASE), 0.8)[0] == "paper2"
@@ -0,0 +1,92 @@
+"""
+Tests for the micro-batching embedding service.
+"""
+
+import threading
+
+import pytest
+
+from app.services.embedding_service import BatchingEmbeddingService
+
+
+class RecordingEmbedder:
+    """Embedding function that records the batches it receives."""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+class TestBatchingEmbeddingService:
+    """Test dynamic batching of concurrent embedding requests."""
+
+    def test_embed_returns_embeddings_in_order(self):
+        """Test a single request gets one embedding per text."""
+        service = BatchingEmbeddingService(RecordingEmbedder(), max_wait_ms=0)
+
+        assert service.embed(["a", "bbb"]) == [[1.0], [3.0]]
+        assert service.embed([]) == []
+
+    def test_concurrent_requests_share_batches(self):
+        """Test concurrent callers are embedded in fewer calls."""
+        embedder = RecordingEmbedder()
+        service = BatchingEmbeddingService(embedder, max_batch_size=64, max_wait_ms=50)
+        results = {}
+        start = threading.Barrier(16)
+
+        def worker(i):
+            start.wait()
+            results[i] = service.embed(["x" * (i + 1)])
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(results[i] == [[float(i + 1)]] for i in range(16))
+        assert len(embedder.batches) < 16
+        assert sum(len(batch) for batch in embedder.batches) == 16
+
+    def test_batches_respect_max_size(self):
+        """Test no batch exceeds max_batch_size texts (single large requests aside)."""
+        embedder = RecordingEmbedder()
+        service = BatchingEmbeddingService(embedder, max_batch_size=4, max_wait_ms=20)
+
+        threads = [
+            threading.Thread(target=service.embed, args=(["a"],)) for _ in range(12)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(len(batch) <= 4 for batch in embedder.batches)
+
+    def test_errors_propagate_to_callers(self):
+        """Test embedding failures are raised in the calling thread."""
+        def failing(texts):
+            raise RuntimeError("model unavailable")
+
+        service = BatchingEmbeddingService(failing, max_wait_ms=0)
+
+        with pytest.raises(RuntimeError, match="model unavailable"):
+            service.embed(["a"])
+
+    def test_metrics(self):
+        """Test throughput and latency metrics are reported."""
+        service = BatchingEmbeddingService(RecordingEmbedder(), max_wait_ms=0)
+        for _ in range(5):
+            service.embed(["a", "b"])
+
+        metrics = service.get_metrics()
+
+        assert metrics["total_requests"] == 5
+        assert metrics["total_texts"] == 10
+        assert metrics["total_batches"] == 5
+        assert metrics["avg_batch_size"] == 2.0
+        assert set(metrics["latency_ms"]) == {"p50", "p95", "p99"}
+        assert metrics["latency_ms"]["p99"] >= metrics["latency_ms"]["p50"] >= 0
@@ -0,0 +1,129 @@
+"""
+Tests for the content-hash extraction cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.extraction_cache import ExtractionCache, file_sha256
+from app.utils.pdf_processing import extract_pdf, extract_pdf_pages
+from tests.test_pdf_processing import write_pdf
+
+
+@pytest.fixture
+def cache(temp_db_path):
+    """Create a fresh ExtractionCache in a temporary directory."""
+    cache = ExtractionCache(temp_db_path / "extraction_cache.sqlite3", max_bytes=1024 * 1024)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def pdf_path(temp_db_path):
+    """Three-page PDF."""
+    return write_pdf(temp_db_path / "paper.pdf", ["First page", "Second page", "Third page"])
+
+
+class TestExtractionCache:
+    """Test storage, lookup and eviction."""
+
+    def test_put_and_get(self, cache):
+        """Test entries round-trip through compression."""
+        value = {"pages": ["a" * 1000, ""], "metadata": {"title": "T", "page_count": 2}}
+
+        assert cache.put("abc", value)
+
+        assert cache.get("abc") == value
+        stats = cache.get_stats()
+        assert stats["entries"] == 1
+        assert stats["bytes"] < 1000
+        assert stats["hits"] == 1
+
+    def test_miss(self, cache):
+        """Test unknown hashes miss."""
+        assert cache.get("missing") is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_update_merges_fields(self, cache):
+        """Test update adds fields to an existing entry only."""
+        cache.put("abc", {"pages": ["x"]})
+
+        assert cache.update("abc", parsed={"year": 2024})
+        assert not cache.update("missing", parsed={})
+        assert cache.get("abc") == {"pages": ["x"], "parsed": {"year": 2024}}
+
+    def test_evicts_least_recently_used(self, temp_db_path):
+        """Test entries are evicted oldest-use first past the byte budget."""
+        import os
+
+        cache = ExtractionCache(temp_db_path / "small.sqlite3", max_bytes=1200)
+        blob = lambda: {"pages": [os.urandom(500).hex()]}  # ~520 bytes compressed
+        try:
+            cache.put("a", blob())
+            cache.put("b", blob())
+            cache.get("a")
+            cache.put("c", blob())
+
+            assert cache.get("b") is None
+            assert cache.get("a") is not None
+            assert cache.get("c") is not None
+            assert cache.get_stats()["evictions"] == 1
+        finally:
+            cache.close()
+
+    def test_disabled(self, temp_db_path):
+        """Test a zero budget disables the cache without creating a file."""
+        cache = ExtractionCache(temp_db_path / "off.sqlite3", max_bytes=0)
+
+        assert not cache.put("abc", {"pages": []})
+        assert cache.get("abc") is None
+        assert not (temp_db_path / "off.sqlite3").exists()
+
+
+class TestCachedExtraction:
+    """Test extraction consults the cache."""
+
+    def test_second_extraction_hits_cache(self, cache, pdf_path):
+        """Test the same bytes are only parsed once."""
+        pages, metadata = extract_pdf_pages(pdf_path, cache=cache)
+        assert metadata["cached"] is False
+        assert metadata["sha256"] == file_sha256(pdf_path)
+
+        copy = pdf_path.with_name("copy.pdf")
+        copy.write_bytes(pdf_path.read_bytes())
+        cached_pages, cached_metadata = extract_pdf_pages(copy, cache=cache)
+
+        assert cached_metadata["cached"] is True
+        assert cached_pages == pages
+        assert cached_metadata["title"] == metadata["title"]
+
+    def test_known_sha256_is_not_recomputed(self, cache, pdf_path):
+        """Test a hash computed at upload time is used instead of rehashing."""
+        sha256 = file_sha256(pdf_path)
+
+        with patch("app.utils.pdf_processing.file_sha256") as rehash:
+            _, metadata = extract_pdf(pdf_path, cache=cache, sha256=sha256)
+
+        rehash.assert_not_called()
+        assert metadata["sha256"] == sha256
+        assert cache.get(sha256) is not None
+
+    def test_caps_applied_to_cached_pages(self, cache, pdf_path):
+        """Test caps on a hit match caps on a fresh extraction."""
+        extract_pdf(pdf_path, cache=cache)
+
+        text, metadata = extract_pdf(pdf_path, max_pages=2, max_chars=15, cache=cache)
+
+        assert metadata["cached"] is True
+        assert metadata["truncated"] is True
+        assert text == "First page\nSecon"
+
+    def test_truncated_extraction_not_cached(self, cache, pdf_path):
+        """Test partial extractions never populate the cache."""
+        extract_pdf(pdf_path, max_pages=1, cache=cache)
+
+        _, metadata = extract_pdf(pdf_path, cache=cache)
+
+        assert metadata["cached"] is False
+        assert metadata["pages_extracted"] == 3
@@ -0,0 +1,101 @@
+"""
+Tests for the sandboxed PDF extraction pool.
+"""
+
+import pytest
+
+from app.services.extraction_pool import ExtractionError, ExtractionPool
+from app.utils.pdf_worker import ERROR_INVALID, ERROR_NOT_FOUND, ERROR_TIMEOUT
+from tests.test_pdf_processing import write_pdf
+
+
+@pytest.fixture
+def pool():
+    """Single-worker pool."""
+    pool = ExtractionPool(max_workers=1, timeout=30, max_memory_mb=0, max_tasks_per_worker=10)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def pdf_path(temp_db_path):
+    """Two-page PDF."""
+    return write_pdf(temp_db_path / "paper.pdf", ["First page", "Second page"])
+
+
+class TestExtractionPool:
+    """Test extraction in worker processes."""
+
+    def test_extract(self, pool, pdf_path):
+        """Test text and metadata come back from the worker."""
+        text, metadata = pool.extract(pdf_path)
+
+        assert text == "First page\nSecond page"
+        assert metadata["page_count"] == 2
+        assert pool.get_stats()["completed"] == 1
+        assert pool.get_stats()["idle_workers"] == 1
+
+    def test_worker_reused(self, pool, pdf_path):
+        """Test healthy workers serve several documents."""
+        pool.extract(pdf_path)
+        pool.extract(pdf_path, max_pages=1)
+
+        stats = pool.get_stats()
+        assert stats["completed"] == 2
+        assert stats["recycled"] == 0
+
+    def test_invalid_pdf(self, pool, temp_db_path):
+        """Test unreadable PDFs fail with a structured error."""
+        path = temp_db_path / "broken.pdf"
+        path.write_bytes(b"%PDF-1.4\n%Mock PDF content")
+
+        with pytest.raises(ExtractionError) as exc_info:
+            pool.extract(path)
+
+        assert exc_info.value.code == ERROR_INVALID
+        assert exc_info.value.to_dict()["code"] == ERROR_INVALID
+        assert pool.get_stats()["failed"] == 1
+        assert pool.get_stats()["idle_workers"] == 1
+
+    def test_missing_file(self, pool, temp_db_path):
+        """Test missing files are reported as not_found."""
+        with pytest.raises(ExtractionError) as exc_info:
+            pool.extract(temp_db_path / "missing.pdf")
+
+        assert exc_info.value.code == ERROR_NOT_FOUND
+
+    def test_timeout_replaces_worker(self, pdf_path):
+        """Test a document over the time limit fails and its worker is killed."""
+        pool = ExtractionPool(max_workers=1, timeout=0.001, max_memory_mb=0)
+        try:
+            with pytest.raises(ExtractionError) as exc_info:
+                pool.extract(pdf_path)
+
+            stats = pool.get_stats()
+            assert exc_info.value.code == ERROR_TIMEOUT
+            assert stats["timeouts"] == 1
+            assert stats["recycled"] == 1
+            assert stats["idle_workers"] == 0
+        finally:
+            pool.close()
+
+    def test_recycle_after_max_tasks(self, pdf_path):
+        """Test workers are retired after max_tasks_per_worker documents."""
+        pool = ExtractionPool(max_workers=1, timeout=30, max_memory_mb=0, max_tasks_per_worker=1)
+        try:
+            pool.extract(pdf_path)
+            pool.extract(pdf_path)
+
+            stats = pool.get_stats()
+            assert stats["completed"] == 2
+            assert stats["recycled"] == 2
+            assert stats["idle_workers"] == 0
+        finally:
+            pool.close()
+
+    @pytest.mark.asyncio
+    async def test_extract_async(self, pool, pdf_path):
+        """Test extraction can be awaited from async code."""
+        text, _ = await pool.extract_async(pdf_path)
+
+        assert text.startswith("First page")
@@ -0,0 +1,152 @@
+"""
+Tests for the incremental ingest manifest.
+"""
+
+import os
+
+import pytest
+
+from app.services.ingest_manifest import (
+    RUN_COMPLETED,
+    RUN_RUNNING,
+    IngestManifest,
+    file_sha256,
+)
+
+
+@pytest.fixture
+def manifest(temp_db_path):
+    """Create a fresh IngestManifest in a temporary directory."""
+    manifest = IngestManifest(temp_db_path / "ingest_manifest.sqlite3")
+    yield manifest
+    manifest.close()
+
+
+@pytest.fixture
+def papers_dir(temp_db_path):
+    """Directory with two small 'PDFs'."""
+    directory = temp_db_path / "papers"
+    directory.mkdir()
+    (directory / "a.pdf").write_bytes(b"paper a")
+    (directory / "b.pdf").write_bytes(b"paper b")
+    return directory
+
+
+class TestIngestManifest:
+    """Test change detection between runs."""
+
+    def test_first_run_everything_new(self, manifest, papers_dir):
+        """Test files not in the manifest are new."""
+        diff = manifest.diff(sorted(papers_dir.glob("*.pdf")))
+
+        assert [e.paper_id for e in diff.new] == ["a", "b"]
+        assert diff.new[0].sha256 == file_sha256(papers_dir / "a.pdf")
+        assert not diff.changed and not diff.unchanged and not diff.removed
+
+    def test_recorded_files_unchanged(self, manifest, papers_dir):
+        """Test recorded files are skipped on the next run."""
+        files = sorted(papers_dir.glob("*.pdf"))
+        manifest.record(manifest.diff(files).new)
+
+        diff = manifest.diff(files)
+
+        assert diff.to_index == []
+        assert len(diff.unchanged) == 2
+        assert manifest.count() == 2
+
+    def test_modified_and_removed_files(self, manifest, papers_dir):
+        """Test content changes and deletions are detected."""
+        manifest.record(manifest.diff(sorted(papers_dir.glob("*.pdf"))).new)
+        (papers_dir / "a.pdf").write_bytes(b"paper a, revised")
+        (papers_dir / "b.pdf").unlink()
+        (papers_dir / "c.pdf").write_bytes(b"paper c")
+
+        diff = manifest.diff(sorted(papers_dir.glob("*.pdf")))
+
+        assert [e.paper_id for e in diff.changed] == ["a"]
+        assert [e.paper_id for e in diff.new] == ["c"]
+        assert [e.paper_id for e in diff.removed] == ["b"]
+
+    def test_touched_identical_file_unchanged(self, manifest, papers_dir):
+        """Test an mtime-only change is resolved by the content hash."""
+        files = sorted(papers_dir.glob("*.pdf"))
+        manifest.record(manifest.diff(files).new)
+        stat = (papers_dir / "a.pdf").stat()
+        os.utime(papers_dir / "a.pdf", (stat.st_atime, stat.st_mtime + 10))
+
+        diff = manifest.diff(files)
+
+        assert diff.to_index == []
+        assert manifest.get(papers_dir / "a.pdf").mtime == stat.st_mtime + 10
+
+    def test_embedding_model_and_clear(self, manifest, papers_dir):
+        """Test the embedding model is stored and cleared with the files."""
+        assert manifest.embedding_model is None
+        manifest.embedding_model = "all-MiniLM-L6-v2"
+        manifest.record(manifest.diff(sorted(papers_dir.glob("*.pdf"))).new)
+
+        assert manifest.embedding_model == "all-MiniLM-L6-v2"
+
+        manifest.clear()
+        assert manifest.embedding_model is None
+        assert manifest.count() == 0
+
+
+class TestCheckpoints:
+    """Test checkpointed runs and failure tracking."""
+
+    def test_committed_batches_survive_reopen(self, manifest, papers_dir):
+        """Test an interrupted run can be resumed from its last committed batch."""
+        entries = manifest.diff(sorted(papers_dir.glob("*.pdf"))).new
+        run_id = manifest.start_run([e.path for e in entries])
+        manifest.commit_batch(run_id, entries[:1])
+        manifest.close()
+
+        reopened = IngestManifest(manifest.db_path)
+        run = reopened.last_run()
+
+        assert run["id"] == run_id
+        assert run["status"] == RUN_RUNNING
+        assert run["committed_batches"] == 1
+        assert run["committed_files"] == 1
+        assert reopened.pending_paths(run_id) == [entries[1].path]
+        assert reopened.count() == 1
+        reopened.close()
+
+    def test_finish_run(self, manifest, papers_dir):
+        """Test a finished run has nothing left to resume."""
+        entries = manifest.diff(sorted(papers_dir.glob("*.pdf"))).new
+        run_id = manifest.start_run([e.path for e in entries])
+        manifest.commit_batch(run_id, entries)
+        manifest.finish_run(run_id)
+
+        assert manifest.last_run()["status"] == RUN_COMPLETED
+        assert manifest.pending_paths(run_id) == []
+
+    def test_new_run_abandons_unfinished(self, manifest, papers_dir):
+        """Test only the latest run stays resumable."""
+        first = manifest.start_run([str(papers_dir / "a.pdf")])
+        second = manifest.start_run([str(papers_dir / "b.pdf")])
+
+        assert manifest.last_run()["id"] == second
+        assert manifest.pending_paths(first) == []
+        assert manifest.pending_paths(second) == [str(papers_dir / "b.pdf")]
+
+    def test_failures_cleared_on_success(self, manifest, papers_dir):
+        """Test failed files are remembered until they are committed."""
+        entries = manifest.diff(sorted(papers_dir.glob("*.pdf"))).new
+        run_id = manifest.start_run([e.path for e in entries])
+        manifest.record_failure(papers_dir / "a.pdf", "EOF marker not found")
+        manifest.record_failure(papers_dir / "b.pdf", "timeout")
+
+        assert manifest.failures() == {
+            entries[0].path: "EOF marker not found",
+            entries[1].path: "timeout",
+        }
+
+        manifest.commit_batch(run_id, entries[:1])
+        assert list(manifest.failures()) == [entries[1].path]
+
+        manifest.clear()
+        assert manifest.failures() == {}
+        assert manifest.last_run() is None
@@ -0,0 +1,167 @@
+"""
+Tests for the parallel ingest pipeline in scripts/init_vector_db.py.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from scripts import init_vector_db
+from scripts.init_vector_db import ingest_papers
+
+
+class FakeVectorDatabase:
+    """
+    Records add_papers batches; fails batches containing a given file and
+    leaves out the named near-duplicates.
+    """
+
+    def __init__(self, fail_on=None, skip=()):
+        self.fail_on = fail_on
+        self.skip = set(skip)
+        self.batches = []
+        self.threads = set()
+
+    def add_papers(self, papers):
+        self.threads.add(threading.get_ident())
+        if any(Path(p["file_path"]).name == self.fail_on for p in papers):
+            raise RuntimeError("embedding failed")
+        self.batches.append([Path(p["file_path"]).name for p in papers])
+        return sum(p["id"] not in self.skip for p in papers)
+
+    def duplicate_of(self, paper_id):
+        if paper_id in self.skip:
+            return {"canonical_id": "p1.pdf", "similarity": 0.9, "policy": "skip"}
+        return None
+
+
+def fake_parse_worker(pdf_path):
+    """Stand-in for _parse_worker: names starting with 'bad' fail to parse."""
+    name = Path(pdf_path).name
+    if name.startswith("bad"):
+        return pdf_path, None, "invalid PDF"
+    return pdf_path, {"id": name, "file_path": pdf_path, "page_offsets": [0, 10]}, None
+
+
+@pytest.fixture(autouse=True)
+def in_process_pool(monkeypatch):
+    """Run the pipeline on threads with the stubbed parser."""
+    monkeypatch.setattr(init_vector_db, "_parse_worker", fake_parse_worker)
+    monkeypatch.setattr(
+        init_vector_db,
+        "ProcessPoolExecutor",
+        lambda max_workers, mp_context=None: ThreadPoolExecutor(max_workers=max_workers),
+    )
+
+
+def pdf_files(*names):
+    return [Path(f"/papers/{name}") for name in names]
+
+
+class TestIngestPapers:
+    """Test batching, failure accounting and callbacks."""
+
+    def test_batches_flush_at_size_and_end(self):
+        """Test full batches are written as they fill and the remainder at the end."""
+        vector_db = FakeVectorDatabase()
+        files = pdf_files(*(f"p{i}.pdf" for i in range(5)))
+
+        stats = ingest_papers(vector_db, files, workers=2, batch_size=2)
+
+        assert [len(batch) for batch in vector_db.batches] == [2, 2, 1]
+        assert sorted(name for batch in vector_db.batches for name in batch) == [
+            f"p{i}.pdf" for i in range(5)
+        ]
+        assert stats.papers == 5
+        assert stats.pages == 10
+        assert stats.failed == []
+
+    def test_parse_failures(self):
+        """Test unparseable files are reported and the rest still indexed."""
+        vector_db = FakeVectorDatabase()
+        failures = []
+
+        stats = ingest_papers(
+            vector_db,
+            pdf_files("p1.pdf", "bad.pdf", "p2.pdf"),
+            workers=1,
+            batch_size=10,
+            on_failure=lambda path, error: failures.append((Path(path).name, error)),
+        )
+
+        assert stats.papers == 2
+        assert stats.failed == [("bad.pdf", "invalid PDF")]
+        assert failures == [("bad.pdf", "invalid PDF")]
+
+    def test_batch_write_failure(self):
+        """Test every file of a failed batch is reported and not counted."""
+        vector_db = FakeVectorDatabase(fail_on="p2.pdf")
+        written = []
+        failures = []
+
+        stats = ingest_papers(
+            vector_db,
+            pdf_files("p1.pdf", "p2.pdf", "p3.pdf"),
+            workers=1,
+            batch_size=1,
+            on_batch=lambda batch: written.extend(p["id"] for p in batch),
+            on_failure=lambda path, error: failures.append(Path(path).name),
+        )
+
+        assert sorted(written) == ["p1.pdf", "p3.pdf"]
+        assert failures == ["p2.pdf"]
+        assert stats.papers == 2
+        assert stats.failed == [("p2.pdf", "embedding failed")]
+
+    def test_commit_failure_is_not_a_write_failure(self):
+        """Test a failing on_batch stops the run without marking written papers failed."""
+        vector_db = FakeVectorDatabase()
+        failures = []
+
+        def commit(batch):
+            raise OSError("manifest is read-only")
+
+        with pytest.raises(OSError):
+            ingest_papers(
+                vector_db,
+                pdf_files("p1.pdf", "p2.pdf", "p3.pdf"),
+                workers=1,
+                batch_size=1,
+                on_batch=commit,
+                on_failure=lambda path, error: failures.append(Path(path).name),
+            )
+
+        assert len(vector_db.batches) == 1
+        assert failures == []
+
+    def test_skipped_duplicates_not_counted(self):
+        """Test near-duplicates add_papers leaves out are not counted as written."""
+        vector_db = FakeVectorDatabase(skip={"copy.pdf"})
+
+        stats = ingest_papers(
+            vector_db, pdf_files("p1.pdf", "copy.pdf", "p2.pdf"), workers=1, batch_size=10
+        )
+
+        assert stats.papers == 2
+        assert stats.duplicates == 1
+        assert stats.pages == 4
+        assert stats.failed == []
+
+    def test_writes_on_writer_thread(self):
+        """Test add_papers runs on the writer thread, not the caller."""
+        vector_db = FakeVectorDatabase()
+
+        ingest_papers(vector_db, pdf_files("p1.pdf"), workers=1)
+
+        assert vector_db.threads and threading.get_ident() not in vector_db.threads
+
+    def test_no_files(self):
+        """Test an empty run writes nothing."""
+        vector_db = FakeVectorDatabase()
+
+        stats = ingest_papers(vector_db, [], workers=1)
+
+        assert vector_db.batches == []
+        assert stats.papers == 0
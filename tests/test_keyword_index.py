@@ -0,0 +1,93 @@
+"""
+Tests for the BM25 keyword index.
+"""
+
+import pytest
+
+from app.services.keyword_index import KeywordIndex, tokenize
+
+
+@pytest.fixture
+def keyword_index(temp_db_path):
+    """Create a fresh KeywordIndex in a temporary directory."""
+    index = KeywordIndex(temp_db_path / "keyword_index.sqlite3")
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def indexed_docs(keyword_index):
+    """Index a few small documents."""
+    keyword_index.add_documents([
+        {"id": "a", "title": "Hydrogel bioinks", "text": "alginate hydrogel printing", "year": 2022, "source": "test"},
+        {"id": "b", "title": "Cell viability", "text": "hydrogel cell viability after printing", "year": 2023, "source": "test"},
+        {"id": "c", "title": "Neural networks", "text": "manufacturing quality control", "year": 2024, "source": "other"},
+    ])
+    return keyword_index
+
+
+class TestTokenize:
+    """Test query and document tokenization."""
+
+    def test_lowercases_and_drops_stopwords(self):
+        """Test tokens are lowercase and stopwords removed."""
+        assert tokenize("The Hydrogel, and CRISPR-Cas9!") == ["hydrogel", "crispr", "cas9"]
+
+
+class TestKeywordIndex:
+    """Test BM25 indexing and scoring."""
+
+    def test_search_ranks_title_matches_first(self, indexed_docs):
+        """Test title terms are weighted above body terms."""
+        hits = indexed_docs.search("hydrogel", n_results=10)
+
+        assert [doc_id for doc_id, _ in hits] == ["a", "b"]
+        assert hits[0][1] > hits[1][1] > 0
+
+    def test_search_limits_results(self, indexed_docs):
+        """Test top-k selection."""
+        assert len(indexed_docs.search("hydrogel printing", n_results=1)) == 1
+
+    def test_search_unknown_terms(self, indexed_docs):
+        """Test queries with no indexed terms return nothing."""
+        assert indexed_docs.search("zebrafish") == []
+        assert indexed_docs.search("the and of") == []
+
+    def test_search_with_filters(self, indexed_docs):
+        """Test year and source filters."""
+        hits = indexed_docs.search("hydrogel", filters={"year_min": 2023})
+        assert [doc_id for doc_id, _ in hits] == ["b"]
+
+        hits = indexed_docs.search("hydrogel", filters={"source": "other"})
+        assert hits == []
+
+    def test_remove_document_updates_index(self, indexed_docs):
+        """Test removed documents no longer match and stats are updated."""
+        assert indexed_docs.remove_document("a") is True
+        assert indexed_docs.remove_document("a") is False
+
+        assert [doc_id for doc_id, _ in indexed_docs.search("hydrogel")] == ["b"]
+        assert indexed_docs.count() == 2
+
+    def test_readd_replaces_document(self, indexed_docs):
+        """Test re-indexing an ID replaces its postings."""
+        indexed_docs.add_documents([{"id": "a", "title": "Other", "text": "zebrafish"}])
+
+        assert indexed_docs.count() == 3
+        assert [doc_id for doc_id, _ in indexed_docs.search("alginate")] == []
+        assert [doc_id for doc_id, _ in indexed_docs.search("zebrafish")] == ["a"]
+
+    def test_index_persists(self, indexed_docs, temp_db_path):
+        """Test the index survives reopening."""
+        reopened = KeywordIndex(temp_db_path / "keyword_index.sqlite3")
+
+        assert reopened.count() == 3
+        assert reopened.search("alginate")[0][0] == "a"
+        reopened.close()
+
+    def test_clear(self, indexed_docs):
+        """Test clearing the index."""
+        indexed_docs.clear()
+
+        assert indexed_docs.count() == 0
+        assert indexed_docs.search("hydrogel") == []
@@ -0,0 +1,128 @@
+"""
+Tests for PDF extraction utilities.
+"""
+
+import pytest
+
+from app.utils.pdf_processing import PdfExtraction, extract_pdf, extract_pdf_metadata
+
+
+def write_pdf(path, pages, title="Bioink Rheology"):
+    """Write a minimal PDF with one line of text per page."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            b" ".join(b"%d 0 R" % (5 + 2 * i) for i in range(len(pages))),
+            len(pages),
+        ),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Title (%s) /Author (Dr. Test) >>" % title.encode(),
+    ]
+    for i, text in enumerate(pages):
+        stream = b"BT /F1 12 Tf 72 720 Td (%s) Tj ET" % text.encode() if text else b""
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (6 + 2 * i)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R /Info 4 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref,
+    )
+    path.write_bytes(bytes(out))
+    return path
+
+
+@pytest.fixture
+def pdf_path(temp_db_path):
+    """Three-page PDF whose second page has no text."""
+    return write_pdf(temp_db_path / "paper.pdf", ["First page", "", "Third page"])
+
+
+class TestPdfExtraction:
+    """Test single-pass page and metadata extraction."""
+
+    def test_pages_are_numbered(self, pdf_path):
+        """Test every page is yielded with its 1-based number."""
+        with PdfExtraction(pdf_path) as pdf:
+            pages = list(pdf.pages())
+
+        assert [page.number for page in pages] == [1, 2, 3]
+        assert pages[0].text == "First page"
+        assert pages[1].text == ""
+        assert pages[2].text == "Third page"
+
+    def test_metadata_from_same_reader(self, pdf_path):
+        """Test metadata is available alongside pages."""
+        with PdfExtraction(pdf_path) as pdf:
+            assert pdf.metadata["title"] == "Bioink Rheology"
+            assert pdf.metadata["author"] == "Dr. Test"
+            assert pdf.metadata["page_count"] == 3
+
+    def test_max_pages(self, pdf_path):
+        """Test extraction stops after max_pages."""
+        with PdfExtraction(pdf_path) as pdf:
+            pages = list(pdf.pages(max_pages=1))
+            assert pdf.truncated
+
+        assert [page.number for page in pages] == [1]
+
+    def test_max_chars(self, pdf_path):
+        """Test the last page is cut to the character budget."""
+        with PdfExtraction(pdf_path) as pdf:
+            pages = list(pdf.pages(max_chars=5))
+            assert pdf.truncated
+
+        assert [page.text for page in pages] == ["First"]
+
+    def test_missing_file(self, temp_db_path):
+        """Test a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            PdfExtraction(temp_db_path / "missing.pdf")
+
+
+class TestExtractPdf:
+    """Test the one-call text and metadata helper."""
+
+    def test_text_and_metadata(self, pdf_path):
+        """Test text skips empty pages and metadata reports extraction."""
+        text, metadata = extract_pdf(pdf_path)
+
+        assert text == "First page\nThird page"
+        assert metadata["title"] == "Bioink Rheology"
+        assert metadata["pages_extracted"] == 3
+        assert metadata["truncated"] is False
+
+    def test_page_offsets(self, pdf_path):
+        """Test page offsets point at each page's text, empty pages included."""
+        text, metadata = extract_pdf(pdf_path)
+
+        assert metadata["page_offsets"] == [0, 11, 11]
+        assert text[metadata["page_offsets"][2]:] == "Third page"
+
+    def test_caps(self, pdf_path):
+        """Test caps are passed through and reported."""
+        text, metadata = extract_pdf(pdf_path, max_pages=1)
+
+        assert text == "First page"
+        assert metadata["truncated"] is True
+
+    def test_invalid_pdf(self, temp_db_path):
+        """Test unreadable files raise."""
+        path = temp_db_path / "broken.pdf"
+        path.write_bytes(b"%PDF-1.4\n%Mock PDF content")
+
+        with pytest.raises(Exception):
+            extract_pdf(path)
+
+    def test_metadata_only(self, pdf_path):
+        """Test extract_pdf_metadata still returns document fields."""
+        assert extract_pdf_metadata(pdf_path)["page_count"] == 3
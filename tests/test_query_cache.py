@@ -0,0 +1,81 @@
+"""
+Tests for the byte-bounded LRU query cache.
+"""
+
+from app.services.query_cache import LRUCache, estimate_size
+
+
+class TestLRUCache:
+    """Test LRU eviction, byte limits and statistics."""
+
+    def test_get_and_put(self):
+        """Test stored values are returned and counted as hits."""
+        cache = LRUCache(max_bytes=1024)
+        cache.put("a", [1, 2, 3])
+
+        assert cache.get("a") == [1, 2, 3]
+        assert cache.get("b") is None
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+        assert cache.get_stats()["hit_rate"] == 0.5
+
+    def test_evicts_least_recently_used(self):
+        """Test the byte budget evicts the least recently used entry."""
+        cache = LRUCache(max_bytes=30, sizeof=lambda value: 10)
+        for key in "abc":
+            cache.put(key, key)
+        cache.get("a")
+
+        cache.put("d", "d")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "a"
+        stats = cache.get_stats()
+        assert stats["entries"] == 3
+        assert stats["bytes"] == 30
+        assert stats["evictions"] == 1
+
+    def test_oversized_values_not_stored(self):
+        """Test values larger than the whole budget are skipped."""
+        cache = LRUCache(max_bytes=10)
+
+        assert cache.put("a", "x" * 100) is False
+        assert cache.get_stats()["entries"] == 0
+
+    def test_disabled_cache(self):
+        """Test a zero budget disables caching."""
+        cache = LRUCache(max_bytes=0)
+
+        assert cache.enabled is False
+        assert cache.put("a", 1) is False
+        assert cache.get("a") is None
+
+    def test_values_are_copied(self):
+        """Test mutating a returned value does not change the cache."""
+        cache = LRUCache(max_bytes=1024)
+        cache.put("a", [{"id": "p1"}])
+
+        cache.get("a")[0]["id"] = "changed"
+
+        assert cache.get("a") == [{"id": "p1"}]
+
+    def test_clear_keeps_statistics(self):
+        """Test clear empties the cache but keeps counters."""
+        cache = LRUCache(max_bytes=1024)
+        cache.put("a", 1)
+        cache.get("a")
+
+        cache.clear()
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 0
+        assert stats["bytes"] == 0
+        assert stats["hits"] == 1
+
+
+class TestEstimateSize:
+    """Test value size estimation."""
+
+    def test_json_size(self):
+        """Test plain values are measured by their JSON encoding."""
+        assert estimate_size({"a": "bc"}) == len('{"a": "bc"}')
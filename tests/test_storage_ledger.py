@@ -0,0 +1,85 @@
+"""
+Tests for in-memory storage accounting.
+"""
+
+import pytest
+
+from app.services.storage_ledger import StorageLedger
+
+
+@pytest.fixture
+def ledger(temp_db_path):
+    """Create a ledger over an empty temporary directory."""
+    ledger = StorageLedger(temp_db_path)
+    ledger.reconcile()
+    yield ledger
+    ledger.stop()
+
+
+def write(path, size):
+    """Write a file of the given size."""
+    path.write_bytes(b"x" * size)
+    return path
+
+
+class TestStorageLedger:
+    """Test recording, releasing and reconciling storage usage."""
+
+    def test_record_and_release(self, ledger, temp_db_path):
+        """Test totals follow recorded and released documents."""
+        ledger.record("doc1", write(temp_db_path / "doc1.pdf", 100))
+        ledger.record("doc2", write(temp_db_path / "doc2.pdf", 50))
+
+        assert ledger.get_stats()["bytes"] == 150
+        assert ledger.get_stats()["files"] == 2
+        assert ledger.usage("doc1") == {"bytes": 100, "files": 1}
+
+        ledger.release("doc1")
+
+        stats = ledger.get_stats()
+        assert stats["bytes"] == 50
+        assert stats["documents"] == 1
+
+    def test_stats_do_not_touch_filesystem(self, ledger, temp_db_path):
+        """Test stats are served from memory between reconciliations."""
+        write(temp_db_path / "untracked.pdf", 10)
+
+        assert ledger.get_stats()["bytes"] == 0
+
+    def test_reconcile_corrects_drift(self, ledger, temp_db_path):
+        """Test a rescan picks up untracked files and drops missing ones."""
+        ledger.record("gone", write(temp_db_path / "gone.pdf", 10))
+        (temp_db_path / "gone.pdf").unlink()
+        write(temp_db_path / "doc1.pdf", 30)
+        write(temp_db_path / "doc1.txt.gz", 5)
+
+        ledger.reconcile()
+
+        assert ledger.usage("doc1") == {"bytes": 35, "files": 2}
+        assert ledger.usage("gone") == {"bytes": 0, "files": 0}
+        assert ledger.get_stats()["bytes"] == 35
+
+    def test_stats_never_scan(self, temp_db_path):
+        """Test a fresh ledger answers from memory until it has reconciled."""
+        write(temp_db_path / "doc1.pdf", 20)
+        ledger = StorageLedger(temp_db_path)
+
+        stats = ledger.get_stats()
+        assert stats["bytes"] == 0
+        assert stats["last_reconciled"] is None
+
+        ledger.reconcile()
+        stats = ledger.get_stats()
+        assert stats["bytes"] == 20
+        assert stats["last_reconciled"] is not None
+
+    def test_background_reconciliation(self, temp_db_path):
+        """Test start() runs a reconciliation in the background."""
+        write(temp_db_path / "doc1.pdf", 20)
+        ledger = StorageLedger(temp_db_path, reconcile_interval=60)
+
+        ledger.start()
+        ledger.stop()
+
+        assert ledger._last_reconciled is not None
+        assert ledger.usage("doc1")["bytes"] == 20
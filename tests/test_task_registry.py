@@ -0,0 +1,84 @@
+"""
+Tests for the background processing task registry.
+"""
+
+import pytest
+
+from app.services.task_registry import TaskRegistry
+
+
+class TestTaskRegistry:
+    """Test task lifecycle, listing and retention."""
+
+    @pytest.mark.asyncio
+    async def test_lifecycle(self):
+        """Test a task moves from pending to completed with merged metadata."""
+        registry = TaskRegistry()
+        task_id = registry.create("upload", {"document_id": "doc-1"})
+        assert registry.get(task_id)["status"] == "pending"
+
+        await registry.start(task_id)
+        assert registry.get(task_id)["started_at"] is not None
+
+        await registry.progress(task_id, 50.0, "Text extracted", pages=3)
+        task = registry.get(task_id)
+        assert task["status"] == "running"
+        assert task["progress"] == 50.0
+        assert task["metadata"] == {"document_id": "doc-1", "pages": 3}
+
+        await registry.complete(task_id, "Indexed")
+        task = registry.get(task_id)
+        assert task["status"] == "completed"
+        assert task["progress"] == 100.0
+        assert task["completed_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_fail(self):
+        """Test failures keep the error and its metadata."""
+        registry = TaskRegistry()
+        task_id = registry.create("upload")
+        await registry.start(task_id)
+        await registry.fail(task_id, "Bad PDF", error_code="invalid_pdf")
+
+        task = registry.get(task_id)
+        assert task["status"] == "failed"
+        assert task["error"] == "Bad PDF"
+        assert task["metadata"]["error_code"] == "invalid_pdf"
+
+    def test_get_unknown(self):
+        """Test unknown task IDs return None."""
+        assert TaskRegistry().get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_list_and_counts(self):
+        """Test listing is newest first and filterable by status."""
+        registry = TaskRegistry()
+        first = registry.create("upload")
+        second = registry.create("upload")
+        await registry.start(second)
+
+        assert [task["task_id"] for task in registry.list()] == [second, first]
+        assert [task["task_id"] for task in registry.list(status="pending")] == [first]
+        assert len(registry.list(limit=1)) == 1
+        assert registry.counts() == {"pending": 1, "running": 1, "completed": 0, "failed": 0}
+
+    @pytest.mark.asyncio
+    async def test_retention_keeps_active_tasks(self):
+        """Test only finished tasks are forgotten beyond max_tasks."""
+        registry = TaskRegistry(max_tasks=2)
+        done = registry.create("upload")
+        await registry.complete(done)
+        active = registry.create("upload")
+        newest = registry.create("upload")
+
+        assert registry.get(done) is None
+        assert registry.get(active) is not None
+        assert registry.get(newest) is not None
+
+    def test_snapshots_are_copies(self):
+        """Test callers cannot mutate stored tasks."""
+        registry = TaskRegistry()
+        task_id = registry.create("upload", {"document_id": "doc-1"})
+        registry.get(task_id)["metadata"]["document_id"] = "changed"
+
+        assert registry.get(task_id)["metadata"]["document_id"] == "doc-1"
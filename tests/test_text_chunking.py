@@ -0,0 +1,87 @@
+"""
+Tests for text chunking utilities.
+"""
+
+import pytest
+
+from app.utils.text_chunking import chunk_text, find_sections
+
+
+SAMPLE_TEXT = (
+    "A Study of Bioinks\n"
+    "Abstract\n"
+    + "We study bioinks. " * 3 + "\n"
+    "1. Introduction\n"
+    + "Bioprinting is growing quickly. " * 20 + "\n"
+    "Methods\n"
+    + "Samples were printed and imaged. " * 20
+)
+
+
+class TestFindSections:
+    """Test section heading detection."""
+
+    def test_detects_headings_in_order(self):
+        """Test that common headings are found with offsets."""
+        sections = find_sections(SAMPLE_TEXT)
+        names = [s["name"] for s in sections]
+
+        assert names == ["front_matter", "abstract", "introduction", "methods"]
+        assert sections[0]["start"] == 0
+        assert sections[-1]["end"] == len(SAMPLE_TEXT)
+        for prev, curr in zip(sections, sections[1:]):
+            assert prev["end"] == curr["start"]
+
+    def test_no_headings(self):
+        """Test text without headings is a single front-matter section."""
+        sections = find_sections("Just some text.")
+
+        assert sections == [{"name": "front_matter", "start": 0, "end": 15}]
+
+
+class TestChunkText:
+    """Test overlapping passage splitting."""
+
+    def test_chunks_cover_text_with_overlap(self):
+        """Test passages overlap and span the whole text."""
+        chunks = chunk_text(SAMPLE_TEXT, chunk_size=200, overlap=50)
+
+        assert len(chunks) > 3
+        assert chunks[0]["start"] == 0
+        assert chunks[-1]["end"] == len(SAMPLE_TEXT)
+        assert all(len(c["text"]) <= 200 for c in chunks)
+        for prev, curr in zip(chunks, chunks[1:]):
+            if prev["section"] == curr["section"]:
+                assert curr["start"] < prev["end"]
+
+    def test_chunks_do_not_cross_sections(self):
+        """Test that a heading always starts a new passage."""
+        chunks = chunk_text(SAMPLE_TEXT, chunk_size=5000, overlap=0)
+
+        assert [c["section"] for c in chunks] == [
+            "front_matter", "abstract", "introduction", "methods"
+        ]
+
+    def test_chunks_tagged_with_section_and_page(self):
+        """Test passages carry section names and page numbers."""
+        methods_start = SAMPLE_TEXT.index("Methods")
+        chunks = chunk_text(
+            SAMPLE_TEXT,
+            chunk_size=200,
+            overlap=0,
+            page_offsets=[0, methods_start],
+        )
+
+        assert chunks[0]["section"] == "front_matter"
+        assert chunks[0]["page"] == 1
+        assert chunks[-1]["section"] == "methods"
+        assert chunks[-1]["page"] == 2
+
+    def test_empty_text(self):
+        """Test empty text produces no passages."""
+        assert chunk_text("") == []
+
+    def test_invalid_overlap(self):
+        """Test overlap must be smaller than chunk size."""
+        with pytest.raises(ValueError):
+            chunk_text("text", chunk_size=100, overlap=100)
@@ -0,0 +1,172 @@
+"""
+Tests for the compressed document text store.
+"""
+
+import os
+
+import pytest
+
+from app.services.text_store import READ_CHUNK, TextStore, find_section
+
+PAGES = ["First page about bioinks.", "Second page: rheology — viscosity.", "Third page."]
+TEXT = "\n\n".join(PAGES)
+OFFSETS = [0, len(PAGES[0]) + 2, len(PAGES[0]) + len(PAGES[1]) + 4]
+
+PAPER = (
+    "Bioink Rheology\n"
+    "Abstract\n"
+    "Viscosity of bioinks — measured.\n"
+    "1. Introduction\n"
+    "Bioprinting needs printable inks.\n"
+    "2. Materials and Methods\n"
+    "Rheometry at 25 °C.\n"
+    "3. Results\n"
+    "Shear thinning observed.\n"
+)
+
+
+@pytest.fixture(params=["zstd", "zlib"])
+def store(request, tmp_path):
+    """Text store using each codec"""
+    return TextStore(tmp_path / "text", codec=request.param)
+
+
+class TestTextStore:
+    """Test storing and reading document text"""
+
+    def test_round_trip(self, store):
+        """Test the full text is returned unchanged"""
+        store.put("doc-1", TEXT, OFFSETS)
+        stored = store.read("doc-1")
+
+        assert stored.text == TEXT
+        assert stored.page_count == 3
+        assert stored.total_bytes == len(TEXT.encode("utf-8"))
+        assert store.get("doc-1") == TEXT
+
+    def test_missing_document(self, store):
+        """Test unknown documents read as None"""
+        assert store.read("missing") is None
+        assert store.get("missing") is None
+        assert not store.contains("missing")
+
+    def test_page_ranges(self, store):
+        """Test single pages and page spans, including non-ASCII text"""
+        store.put("doc-1", TEXT, OFFSETS)
+
+        assert store.read("doc-1", pages=(2, 2)).text == PAGES[1] + "\n\n"
+        assert store.read("doc-1", pages=(3, 3)).text == PAGES[2]
+        assert store.read("doc-1", pages=(2, None)).text == "\n\n".join(PAGES[1:])
+
+    def test_byte_ranges(self, store):
+        """Test inclusive byte ranges and open-ended ranges"""
+        store.put("doc-1", TEXT, OFFSETS)
+
+        stored = store.read("doc-1", byte_range=(0, 4))
+        assert stored.text == "First"
+        assert (stored.start, stored.end) == (0, 5)
+        assert store.read("doc-1", byte_range=(6, None)).text == TEXT[6:]
+        assert store.read("doc-1", byte_range=(0, 10**9)).text == TEXT
+
+    def test_out_of_range(self, store):
+        """Test ranges outside the document are rejected"""
+        store.put("doc-1", TEXT, OFFSETS)
+
+        with pytest.raises(ValueError):
+            store.read("doc-1", pages=(4, 4))
+        with pytest.raises(ValueError):
+            store.read("doc-1", pages=(3, 2))
+        with pytest.raises(ValueError):
+            store.read("doc-1", byte_range=(10**6, None))
+
+    def test_without_page_offsets(self, store):
+        """Test text stored without offsets is a single page"""
+        store.put("doc-1", TEXT)
+        assert store.read("doc-1", pages=(1, 1)).text == TEXT
+
+    def test_replace_and_delete(self, store):
+        """Test put replaces and delete removes a document"""
+        store.put("doc-1", TEXT, OFFSETS)
+        store.put("doc-1", "Updated")
+        assert store.get("doc-1") == "Updated"
+
+        assert store.delete("doc-1")
+        assert not store.delete("doc-1")
+        assert store.get("doc-1") is None
+
+    def test_reads_other_codec(self, tmp_path):
+        """Test files stay readable after switching codecs"""
+        TextStore(tmp_path, codec="zlib").put("doc-1", TEXT, OFFSETS)
+        assert TextStore(tmp_path, codec="zstd").get("doc-1") == TEXT
+
+    def test_compresses(self, store):
+        """Test repetitive text is stored compressed"""
+        text = "bioink viscosity " * 10_000
+        assert store.put("doc-1", text) < len(text) // 10
+
+    def test_ranges_past_first_chunk(self, store):
+        """Test ranges deep inside a document larger than one read chunk"""
+        text = "".join(f"{i:08d}" for i in range(READ_CHUNK // 2))
+        store.put("doc-1", text)
+
+        start = READ_CHUNK * 2 + 3
+        assert store.read("doc-1", byte_range=(start, start + 99)).text == text[start:start + 100]
+
+    def test_ranges_of_incompressible_text(self, store):
+        """Test streaming across many compressed chunks of the file"""
+        text = os.urandom(READ_CHUNK * 2).hex()
+        store.put("doc-1", text)
+
+        start = READ_CHUNK * 3 - 7
+        assert store.read("doc-1", byte_range=(start, start + 999)).text == text[start:start + 1000]
+        assert store.read("doc-1", byte_range=(len(text) - 10, None)).text == text[-10:]
+
+    def test_clear(self, store):
+        """Test clear removes all documents"""
+        store.put_many([("doc-1", TEXT, OFFSETS), ("doc-2", TEXT, None)])
+        store.clear()
+        assert store.get("doc-1") is None
+        assert store.get("doc-2") is None
+
+
+class TestSections:
+    """Test section parsing at ingest and section reads"""
+
+    def test_outline(self, store):
+        """Test sections are recorded with character and byte offsets"""
+        store.put("paper", PAPER)
+        sections = store.read("paper").sections
+
+        assert [section["name"] for section in sections] == [
+            "front_matter", "abstract", "introduction", "materials_and_methods", "results",
+        ]
+        encoded = PAPER.encode("utf-8")
+        for section in sections:
+            assert (
+                encoded[section["byte_start"]:section["byte_end"]].decode("utf-8")
+                == PAPER[section["start"]:section["end"]]
+            )
+
+    @pytest.mark.parametrize("name,expected", [
+        ("abstract", "Abstract\nViscosity of bioinks — measured.\n"),
+        ("Materials and Methods", "2. Materials and Methods\nRheometry at 25 °C.\n"),
+        ("methods", "2. Materials and Methods\nRheometry at 25 °C.\n"),
+        ("results", "3. Results\nShear thinning observed.\n"),
+    ])
+    def test_read_section(self, store, name, expected):
+        """Test a section is returned by exact or partial name"""
+        store.put("paper", PAPER)
+        assert store.read("paper", section=name).text == expected
+
+    def test_unknown_section(self, store):
+        """Test missing sections raise KeyError"""
+        store.put("paper", PAPER)
+        with pytest.raises(KeyError):
+            store.read("paper", section="discussion")
+
+    def test_find_section_prefers_exact_match(self):
+        """Test an exact name wins over a partial match"""
+        sections = [{"name": "results_and_discussion"}, {"name": "results"}]
+        assert find_section(sections, "results") is sections[1]
+        assert find_section(sections, "discussion") is sections[0]
+        assert find_section(sections, "sults") is None
@@ -0,0 +1,93 @@
+"""
+Tests for the validating, hashing upload writer.
+"""
+
+import hashlib
+from io import BytesIO
+
+import pytest
+
+from app.utils.upload_writer import (
+    UPLOAD_EMPTY,
+    UPLOAD_NOT_PDF,
+    UPLOAD_TOO_LARGE,
+    UploadRejected,
+    check_upload_size,
+    write_upload,
+)
+
+
+class CountingStream(BytesIO):
+    """BytesIO that counts read calls."""
+
+    reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return super().read(size)
+
+
+class TestWriteUpload:
+    """Test streaming writes with early validation."""
+
+    def test_writes_and_hashes(self, temp_db_path):
+        """Test valid PDFs are written whole with their SHA-256."""
+        content = b"%PDF-1.4\n" + b"x" * 100
+        dest = temp_db_path / "doc.pdf"
+
+        stored = write_upload(BytesIO(content), dest, chunk_size=16)
+
+        assert dest.read_bytes() == content
+        assert stored.size == len(content)
+        assert stored.sha256 == hashlib.sha256(content).hexdigest()
+        assert not (temp_db_path / "doc.pdf.part").exists()
+
+    def test_spoofed_pdf_rejected_after_one_read(self, temp_db_path):
+        """Test files without a PDF header are rejected before anything is written."""
+        source = CountingStream(b"MZ\x90\x00" + b"x" * 1000)
+
+        with pytest.raises(UploadRejected) as exc_info:
+            write_upload(source, temp_db_path / "doc.pdf", chunk_size=64)
+
+        assert exc_info.value.code == UPLOAD_NOT_PDF
+        assert exc_info.value.status_code == 415
+        assert source.reads == 1
+        assert list(temp_db_path.iterdir()) == []
+
+    def test_empty_rejected(self, temp_db_path):
+        """Test empty files are rejected."""
+        with pytest.raises(UploadRejected) as exc_info:
+            write_upload(BytesIO(b""), temp_db_path / "doc.pdf")
+
+        assert exc_info.value.code == UPLOAD_EMPTY
+
+    def test_size_cap_in_first_chunk(self, temp_db_path):
+        """Test a first chunk over the cap is rejected without writing."""
+        source = CountingStream(b"%PDF-1.4\n" + b"x" * 1000)
+
+        with pytest.raises(UploadRejected) as exc_info:
+            write_upload(source, temp_db_path / "doc.pdf", max_bytes=100, chunk_size=512)
+
+        assert exc_info.value.code == UPLOAD_TOO_LARGE
+        assert exc_info.value.status_code == 413
+        assert source.reads == 1
+        assert list(temp_db_path.iterdir()) == []
+
+    def test_size_cap_while_streaming(self, temp_db_path):
+        """Test exceeding the cap mid-stream removes the partial file."""
+        with pytest.raises(UploadRejected):
+            write_upload(
+                BytesIO(b"%PDF-1.4\n" + b"x" * 1000),
+                temp_db_path / "doc.pdf",
+                max_bytes=100,
+                chunk_size=32,
+            )
+
+        assert list(temp_db_path.iterdir()) == []
+
+    def test_declared_size(self):
+        """Test declared sizes are checked only when known and capped."""
+        check_upload_size(None, 10)
+        check_upload_size(1000, 0)
+        with pytest.raises(UploadRejected):
+            check_upload_size(11, 10)
@@ -2,7 +2,12 @@
 Tests for Vector Database Service (ChromaDB wrapper).
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from app.config import settings
+from app.services.dedup_index import minhash
 from app.services.vector_db import VectorDatabase
 
 
@@ -141,6 +146,242 @@ class TestSearch:
         assert "id" in results[0]
 
 
+class TestSearchMany:
+    """Test batched multi-query search."""
+
+    def test_results_per_query(self, vector_db, sample_papers):
+        """Test each query gets its own ranked results, in order."""
+        vector_db.add_papers(sample_papers)
+
+        batches = vector_db.search_many(
+            ["CRISPR gene editing", "neural network manufacturing"], n_results=2
+        )
+
+        assert len(batches) == 2
+        assert batches[0][0]["id"] == "paper1"
+        assert batches[1][0]["id"] == "paper3"
+        assert all(len(batch) <= 2 for batch in batches)
+
+    def test_matches_single_search(self, vector_db, sample_papers):
+        """Test batched semantic results equal individual searches."""
+        vector_db.add_papers(sample_papers)
+        queries = ["hydrogel bioinks", "quality control"]
+
+        batches = vector_db.search_many(queries, n_results=3)
+
+        for query, batch in zip(queries, batches):
+            single = vector_db.search(query, n_results=3)
+            assert [r["id"] for r in batch] == [r["id"] for r in single]
+
+    def test_embeds_queries_once(self, vector_db, sample_papers):
+        """Test all queries share a single embedding call."""
+        vector_db.add_papers(sample_papers)
+        before = vector_db.embedding_service.get_metrics()["total_requests"]
+
+        vector_db.search_many(["a", "b", "c"], n_results=1)
+
+        assert vector_db.embedding_service.get_metrics()["total_requests"] == before + 1
+
+    def test_dedup_across_queries(self, vector_db, sample_papers):
+        """Test dedup keeps each paper under a single query."""
+        vector_db.add_papers(sample_papers)
+
+        batches = vector_db.search_many(
+            ["CRISPR gene editing", "bioprinted scaffolds"], n_results=3, dedup=True
+        )
+
+        ids = [r["id"] for batch in batches for r in batch]
+        assert len(ids) == len(set(ids)) == 3
+        assert "paper1" in [r["id"] for r in batches[0]]
+
+    def test_shared_filters_and_keyword(self, vector_db, sample_papers):
+        """Test filters apply to every query and keyword search is supported."""
+        vector_db.add_papers(sample_papers)
+
+        batches = vector_db.search_many(
+            ["hydrogel", "neural"], filters={"year_min": 2023}, search_type="keyword"
+        )
+
+        assert batches[0] == []
+        assert [r["id"] for r in batches[1]] == ["paper3"]
+
+    def test_empty_queries(self, vector_db):
+        """Test an empty batch returns no result lists."""
+        assert vector_db.search_many([]) == []
+
+
+class TestQueryCache:
+    """Test query embedding and search result caching."""
+
+    def test_repeated_search_hits_result_cache(self, vector_db, sample_papers):
+        """Test a repeated search is served from the result cache."""
+        vector_db.add_papers(sample_papers)
+
+        first = vector_db.search("CRISPR gene editing", n_results=2)
+        second = vector_db.search("CRISPR gene editing", n_results=2)
+
+        assert first == second
+        assert vector_db.get_cache_stats()["search_results"]["hits"] == 1
+
+    def test_embedding_cache_reused_across_result_keys(self, vector_db, sample_papers):
+        """Test a query's embedding is computed once for different limits."""
+        vector_db.add_papers(sample_papers)
+        before = vector_db.embedding_service.get_metrics()["total_requests"]
+
+        vector_db.search("hydrogel", n_results=1)
+        vector_db.search("hydrogel", n_results=3)
+
+        assert vector_db.embedding_service.get_metrics()["total_requests"] == before + 1
+        assert vector_db.get_cache_stats()["query_embeddings"]["hits"] >= 1
+
+    def test_writes_invalidate_results(self, vector_db, sample_papers):
+        """Test add and delete bump the generation and drop cached results."""
+        vector_db.add_papers(sample_papers[:2])
+        assert "paper3" not in [r["id"] for r in vector_db.search("neural network", n_results=3)]
+
+        vector_db.add_papers(sample_papers[2:])
+        assert vector_db.search("neural network", n_results=3)[0]["id"] == "paper3"
+
+        generation = vector_db.get_cache_stats()["generation"]
+        vector_db.delete_paper("paper3")
+        assert vector_db.get_cache_stats()["generation"] == generation + 1
+        assert "paper3" not in [r["id"] for r in vector_db.search("neural network", n_results=3)]
+
+    def test_cached_results_are_isolated(self, vector_db, sample_papers):
+        """Test callers mutating results do not corrupt the cache."""
+        vector_db.add_papers(sample_papers)
+
+        vector_db.search("hydrogel", n_results=1)[0]["similarity"] = -1.0
+
+        assert vector_db.search("hydrogel", n_results=1)[0]["similarity"] > 0
+
+
+class TestKeywordSearch:
+    """Test BM25 keyword search."""
+
+    def test_keyword_search_ranks_matches(self, vector_db, sample_papers):
+        """Test keyword search returns matching papers, best first."""
+        vector_db.add_papers(sample_papers)
+
+        results = vector_db.search("hydrogel crosslinking", search_type="keyword")
+
+        assert results[0]["id"] == "paper2"
+        assert results[0]["similarity"] == 1.0
+        assert "metadata" in results[0]
+
+    def test_keyword_search_full_text(self, vector_db, sample_papers):
+        """Test terms that only appear in the body are found."""
+        vector_db.add_papers(sample_papers)
+
+        results = vector_db.search("differentiation", search_type="keyword")
+
+        assert [r["id"] for r in results] == ["paper1"]
+
+    def test_keyword_search_after_delete(self, vector_db, sample_papers):
+        """Test deleted papers are removed from the keyword index."""
+        vector_db.add_papers(sample_papers)
+        vector_db.delete_paper("paper2")
+
+        results = vector_db.search("hydrogel", search_type="keyword")
+
+        assert "paper2" not in [r["id"] for r in results]
+
+    def test_keyword_index_rebuilt_for_existing_store(self, temp_db_path, sample_papers):
+        """Test a missing keyword index is rebuilt from the collection."""
+        db = VectorDatabase(storage_path=str(temp_db_path))
+        db.add_papers(sample_papers)
+        db.keyword_index.clear()
+
+        reopened = VectorDatabase(storage_path=str(temp_db_path))
+
+        assert reopened.keyword_index.count() == 3
+        assert reopened.search("crispr", search_type="keyword")[0]["id"] == "paper1"
+
+    def test_keyword_index_rebuilt_from_full_text(self, temp_db_path, sample_papers):
+        """Test the rebuild pages through papers and indexes their stored full text."""
+        late = {
+            **sample_papers[1],
+            "full_text": "Bioprinting methods in detail. " * 100 + "Axolotl limb regeneration.",
+        }
+        db = VectorDatabase(storage_path=str(temp_db_path))
+        db.add_papers([sample_papers[0], late, sample_papers[2]])
+        db.keyword_index.clear()
+
+        db._rebuild_keyword_index(batch_size=2)
+
+        assert db.keyword_index.count() == 3
+        assert [r["id"] for r in db.search("axolotl", search_type="keyword")] == ["paper2"]
+
+
+class TestHybridSearch:
+    """Test hybrid semantic + keyword search."""
+
+    def test_hybrid_search_fuses_rankings(self, vector_db, sample_papers):
+        """Test RRF fusion puts papers ranked well by both retrievers first."""
+        vector_db.add_papers(sample_papers)
+
+        results, timings = vector_db.hybrid_search("CRISPR gene editing", n_results=3)
+
+        assert results[0]["id"] == "paper1"
+        assert results[0]["similarity"] == pytest.approx(1.0)
+        assert "semantic_similarity" in results[0]
+        assert "keyword_similarity" in results[0]
+        assert set(timings) == {"semantic_ms", "keyword_ms", "retrieval_ms", "fusion_ms"}
+
+    def test_hybrid_search_weighted(self, vector_db, sample_papers):
+        """Test weighted fusion keeps similarities in [0, 1]."""
+        vector_db.add_papers(sample_papers)
+
+        results, _ = vector_db.hybrid_search("hydrogel", n_results=2, fusion="weighted")
+
+        assert len(results) <= 2
+        assert all(0 <= r["similarity"] <= 1 for r in results)
+
+    def test_hybrid_search_type(self, vector_db, sample_papers):
+        """Test search() dispatches to hybrid search."""
+        vector_db.add_papers(sample_papers)
+
+        results = vector_db.search("neural network", n_results=1, search_type="hybrid")
+
+        assert [r["id"] for r in results] == ["paper3"]
+
+    def test_concurrent_hybrid_searches_overlap(self, vector_db, monkeypatch):
+        """Test hybrid searches from several threads do not run one at a time."""
+        def slow_search(query, n_results, filters, search_type, fields):
+            time.sleep(0.2)
+            return []
+
+        monkeypatch.setattr(vector_db, "search", slow_search)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=4) as callers:
+            list(callers.map(lambda _: vector_db.hybrid_search("bioink"), range(4)))
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.6
+
+    def test_repeated_hybrid_search_hits_result_cache(self, vector_db, sample_papers):
+        """Test fused results are cached per fusion method."""
+        vector_db.add_papers(sample_papers)
+
+        first, _ = vector_db.hybrid_search("CRISPR gene editing", n_results=3)
+        second, timings = vector_db.hybrid_search("CRISPR gene editing", n_results=3)
+
+        assert second == first
+        assert set(timings) == {"cache_ms"}
+        assert vector_db.get_cache_stats()["search_results"]["hits"] == 1
+        assert vector_db.search("CRISPR gene editing", n_results=3, search_type="hybrid") == first
+        assert vector_db.get_cache_stats()["search_results"]["hits"] == 2
+
+        _, timings = vector_db.hybrid_search("CRISPR gene editing", n_results=3, fusion="weighted")
+        assert "fusion_ms" in timings
+
+    def test_hybrid_search_invalid_fusion(self, vector_db):
+        """Test unknown fusion methods are rejected."""
+        with pytest.raises(ValueError):
+            vector_db.hybrid_search("bioink", fusion="median")
+
+
 class TestFindSimilar:
     """Test finding similar papers functionality."""
 
@@ -203,6 +444,257 @@ class TestGetPaper:
         
         assert paper is None
 
+    def test_get_text(self, vector_db, sample_papers):
+        """Test full text is stored at ingest and removed on delete and reset."""
+        vector_db.add_papers(sample_papers)
+        
+        assert vector_db.get_text("paper1").text == sample_papers[0]["full_text"]
+        
+        vector_db.delete_paper("paper1")
+        assert vector_db.get_text("paper1") is None
+        
+        vector_db.reset()
+        assert vector_db.get_text("paper2") is None
+
+
+class TestListPapers:
+    """Test catalog-backed listing and pagination."""
+
+    def test_list_papers_paginates(self, vector_db, sample_papers):
+        """Test pages cover every paper exactly once."""
+        vector_db.add_papers(sample_papers)
+
+        first, total = vector_db.list_papers(limit=2)
+        second, _ = vector_db.list_papers(limit=2, offset=2)
+
+        assert total == 3
+        assert len(first) == 2 and len(second) == 1
+        assert {p["id"] for p in first + second} == {"paper1", "paper2", "paper3"}
+        assert "document" not in first[0]
+
+    def test_filtered_total(self, vector_db, sample_papers):
+        """Test totals reflect the filters, not the whole collection."""
+        vector_db.add_papers(sample_papers)
+
+        papers, total = vector_db.get_all_papers(limit=10, filters={"year": 2023})
+
+        assert total == 1
+        assert papers[0]["id"] == "paper1"
+        assert papers[0]["document"]
+
+    def test_catalog_follows_delete(self, vector_db, sample_papers):
+        """Test deleted papers leave the catalog."""
+        vector_db.add_papers(sample_papers)
+        vector_db.delete_paper("paper1")
+
+        _, total = vector_db.list_papers()
+        assert total == 2
+
+    def test_catalog_rebuilt_for_existing_store(self, temp_db_path, vector_db, sample_papers):
+        """Test a store without a catalog is backfilled on open."""
+        vector_db.add_papers(sample_papers)
+        vector_db.catalog.clear()
+
+        reopened = VectorDatabase(storage_path=str(temp_db_path))
+
+        assert reopened.catalog.count() == 3
+
+
+class TestFacets:
+    """Test corpus facets served from the catalog."""
+
+    def test_facets_follow_writes(self, vector_db, sample_papers):
+        """Test facets are exact after adds and deletes."""
+        vector_db.add_papers(sample_papers)
+        vector_db.delete_paper("paper3")
+
+        facets = vector_db.get_facets()
+
+        assert facets["by_year"] == {"2022": 1, "2023": 1}
+        assert facets["by_source"] == {"test": 2}
+        assert {"name": "Lee", "count": 1} in facets["top_authors"]
+        assert all(a["name"] != "Brown" for a in facets["top_authors"])
+
+
+class TestFieldProjection:
+    """Test loading only the requested paper fields."""
+
+    def test_get_paper_metadata_only(self, vector_db, sample_papers):
+        """Test get_paper skips the document body when not requested."""
+        vector_db.add_papers(sample_papers)
+
+        paper = vector_db.get_paper("paper1", fields=["metadata"])
+
+        assert paper["metadata"]["title"] == sample_papers[0]["title"]
+        assert "document" not in paper
+
+    def test_get_all_papers_metadata_only(self, vector_db, sample_papers):
+        """Test get_all_papers does not read bodies for metadata views."""
+        vector_db.add_papers(sample_papers)
+
+        papers, total = vector_db.get_all_papers(fields=["metadata"])
+
+        assert total == 3
+        assert all("document" not in paper and paper["metadata"] for paper in papers)
+
+    @pytest.mark.parametrize("search_type", ["semantic", "keyword", "hybrid"])
+    def test_search_metadata_only(self, vector_db, sample_papers, search_type):
+        """Test every search type honours the projection."""
+        vector_db.add_papers(sample_papers)
+
+        results = vector_db.search(
+            "hydrogel bioinks", n_results=3, search_type=search_type, fields=["metadata"]
+        )
+
+        assert results
+        assert all("document" not in r and "metadata" in r for r in results)
+
+    def test_find_similar_document_only(self, vector_db, sample_papers):
+        """Test find_similar can drop metadata."""
+        vector_db.add_papers(sample_papers)
+
+        similar = vector_db.find_similar("paper1", n_results=2, fields=["document"])
+
+        assert similar
+        assert all("metadata" not in r and r["document"] for r in similar)
+
+    def test_unknown_field(self, vector_db):
+        """Test unknown fields are rejected."""
+        with pytest.raises(ValueError):
+            vector_db.get_paper("paper1", fields=["embedding"])
+
+
+class TestNearDuplicates:
+    """Test near-duplicate detection policies in add_papers."""
+
+    @pytest.fixture
+    def preprint(self, sample_papers):
+        """Preprint copy of the first sample paper, without its DOI."""
+        paper = {**sample_papers[0], "id": "paper1-preprint", "source": "biorxiv"}
+        del paper["doi"]
+        return paper
+
+    def test_link_policy(self, vector_db, sample_papers, preprint, monkeypatch):
+        """Test linked duplicates are indexed and report their canonical paper."""
+        monkeypatch.setattr(settings, "near_duplicate_policy", "link")
+        vector_db.add_papers(sample_papers)
+
+        assert vector_db.add_papers([preprint]) == 1
+        assert vector_db.get_paper("paper1-preprint") is not None
+        duplicate = vector_db.duplicate_of("paper1-preprint")
+        assert duplicate["canonical_id"] == "paper1"
+        assert duplicate["policy"] == "link"
+        assert vector_db.duplicate_of("paper2") is None
+
+    def test_skip_policy(self, vector_db, sample_papers, preprint, monkeypatch):
+        """Test skipped duplicates are not indexed."""
+        monkeypatch.setattr(settings, "near_duplicate_policy", "skip")
+        vector_db.add_papers(sample_papers)
+
+        assert vector_db.add_papers([preprint]) == 0
+        assert vector_db.get_paper("paper1-preprint") is None
+        assert vector_db.duplicate_of("paper1-preprint")["policy"] == "skip"
+
+    def test_merge_policy(self, vector_db, sample_papers, monkeypatch):
+        """Test merged duplicates fill missing metadata on the canonical paper."""
+        monkeypatch.setattr(settings, "near_duplicate_policy", "merge")
+        canonical = {**sample_papers[0]}
+        del canonical["doi"]
+        vector_db.add_papers([canonical])
+
+        assert vector_db.add_papers([{**sample_papers[0], "id": "journal-version"}]) == 0
+        assert vector_db.get_paper("journal-version") is None
+        assert vector_db.get_paper("paper1")["metadata"]["doi"] == sample_papers[0]["doi"]
+
+    def test_duplicates_within_batch(self, vector_db, sample_papers, preprint, monkeypatch):
+        """Test duplicates inside one batch are detected."""
+        monkeypatch.setattr(settings, "near_duplicate_policy", "skip")
+
+        assert vector_db.add_papers([sample_papers[0], preprint]) == 1
+
+    def test_reindex_same_id(self, vector_db, sample_papers, monkeypatch):
+        """Test re-adding a paper under its own ID is not a duplicate."""
+        monkeypatch.setattr(settings, "near_duplicate_policy", "skip")
+        vector_db.add_papers(sample_papers)
+
+        assert vector_db.add_papers([sample_papers[0]]) == 1
+        assert vector_db.duplicate_of("paper1") is None
+
+    def test_search_collapse(self, vector_db, sample_papers, preprint, monkeypatch):
+        """Test collapsed search returns one result per cluster."""
+        monkeypatch.setattr(settings, "near_duplicate_policy", "link")
+        vector_db.add_papers(sample_papers + [preprint])
+
+        results = vector_db.search("CRISPR gene editing bioink scaffolds", n_results=3)
+        collapsed = vector_db.search("CRISPR gene editing bioink scaffolds", n_results=3, collapse=True)
+
+        ids = [result["id"] for result in results]
+        assert "paper1" in ids and "paper1-preprint" in ids
+        collapsed_ids = [result["id"] for result in collapsed]
+        assert len([i for i in collapsed_ids if i.startswith("paper1")]) == 1
+        top = next(result for result in collapsed if result["id"].startswith("paper1"))
+        assert top["duplicates"] == [
+            "paper1-preprint" if top["id"] == "paper1" else "paper1"
+        ]
+
+    def test_delete_unlinks(self, vector_db, sample_papers, preprint, monkeypatch):
+        """Test deleting the canonical paper promotes its duplicate."""
+        monkeypatch.setattr(settings, "near_duplicate_policy", "link")
+        vector_db.add_papers(sample_papers + [preprint])
+
+        vector_db.delete_paper("paper1")
+
+        assert vector_db.duplicate_of("paper1-preprint") is None
+
+    def test_failed_write_records_no_alias(self, vector_db, sample_papers, preprint, monkeypatch):
+        """Test aliases are not recorded when the batch fails to store."""
+        monkeypatch.setattr(settings, "near_duplicate_policy", "skip")
+
+        def fail(entries):
+            raise RuntimeError("catalog unavailable")
+
+        monkeypatch.setattr(vector_db.catalog, "upsert", fail)
+        with pytest.raises(RuntimeError):
+            vector_db.add_papers([sample_papers[0], preprint])
+
+        assert vector_db.duplicate_of("paper1-preprint") is None
+
+    def test_indexing_clears_alias(self, vector_db, sample_papers, preprint, monkeypatch):
+        """Test a skipped paper indexed later is no longer reported as skipped."""
+        monkeypatch.setattr(settings, "near_duplicate_policy", "skip")
+        vector_db.add_papers(sample_papers + [preprint])
+        monkeypatch.setattr(settings, "near_duplicate_policy", "link")
+
+        vector_db.add_papers([preprint])
+
+        assert vector_db.duplicate_of("paper1-preprint")["policy"] == "link"
+
+    def test_shared_opening_is_not_duplicate(self, vector_db, sample_papers, monkeypatch):
+        """Test papers that differ past the embedded prefix are not duplicates."""
+        monkeypatch.setattr(settings, "near_duplicate_policy", "skip")
+        opening = " ".join(f"shared{i}" for i in range(400))
+        first = {**sample_papers[0], "full_text": opening + " ".join(f"first{i}" for i in range(2000))}
+        second = {
+            **sample_papers[0],
+            "id": "companion",
+            "full_text": opening + " ".join(f"second{i}" for i in range(2000)),
+        }
+
+        assert vector_db.add_papers([first, second]) == 2
+        assert vector_db.duplicate_of("companion") is None
+
+    def test_rebuild_signs_full_text(self, temp_db_path, sample_papers, monkeypatch):
+        """Test rebuilt signatures match the ones add_papers computes."""
+        monkeypatch.setattr(settings, "near_duplicate_policy", "link")
+        db = VectorDatabase(storage_path=str(temp_db_path), chunk_index=False)
+        db.add_papers(sample_papers)
+        db.dedup_index.clear()
+
+        db = VectorDatabase(storage_path=str(temp_db_path), chunk_index=False)
+
+        match = db.dedup_index.find(minhash(sample_papers[0]["full_text"]), threshold=0.99)
+        assert match == ("paper1", 1.0)
+
 
 class TestDeletePaper:
     """Test deleting papers."""
@@ -252,6 +744,101 @@ class TestReset:
         assert vector_db.collection.count() == 1
 
 
+class TestPassageIndex:
+    """Test passage-level chunk index over full text."""
+
+    @pytest.fixture
+    def long_paper(self):
+        """Paper whose distinctive content sits far past the first page."""
+        filler = "Bioprinting scaffolds were characterized in detail. " * 80
+        return {
+            "id": "long1",
+            "title": "A Long Study of Printed Tissue",
+            "abstract": "We study printed tissue constructs over many pages.",
+            "full_text": (
+                "Introduction\n" + filler
+                + "\nResults\nZebrafish cardiomyocyte regeneration improved markedly "
+                "after photocrosslinked gelatin implantation."
+            ),
+            "year": 2021,
+            "source": "test",
+        }
+
+    def test_add_papers_creates_passages(self, vector_db, long_paper):
+        """Test that long papers are split into several passages."""
+        vector_db.add_papers([long_paper])
+
+        stats = vector_db.get_stats()
+        assert stats["total_papers"] == 1
+        assert stats["total_passages"] > 1
+
+    def test_search_finds_text_past_first_page(self, vector_db, sample_papers, long_paper):
+        """Test that passage hits roll up to paper-level results."""
+        vector_db.add_papers(sample_papers + [long_paper])
+
+        results = vector_db.search("zebrafish cardiomyocyte regeneration", n_results=2)
+
+        assert results[0]["id"] == "long1"
+        passage = results[0]["passage"]
+        assert "Zebrafish" in passage["text"]
+        assert passage["section"] == "results"
+        # One entry per paper even when several passages match
+        assert len({r["id"] for r in results}) == len(results)
+
+    def test_passage_only_hits_respect_projection(self, vector_db, long_paper):
+        """Test papers loaded for passage hits get only the requested fields."""
+        vector_db.add_papers([long_paper])
+        passages = {"long1": {"text": "Zebrafish", "similarity": 0.9}}
+
+        ids_only = vector_db._merge_passage_hits([], passages, n_results=1, include=[])
+        full = vector_db._merge_passage_hits([], passages, n_results=1)
+
+        assert ids_only[0]["id"] == "long1"
+        assert "metadata" not in ids_only[0] and "document" not in ids_only[0]
+        assert "metadata" in full[0] and "document" in full[0]
+
+    def test_delete_removes_passages(self, vector_db, long_paper):
+        """Test that deleting a paper removes its passages."""
+        vector_db.add_papers([long_paper])
+        vector_db.delete_paper("long1")
+
+        assert vector_db.get_stats()["total_passages"] == 0
+
+    def test_chunk_index_disabled(self, temp_db_path, long_paper):
+        """Test that the chunk index can be turned off."""
+        db = VectorDatabase(storage_path=str(temp_db_path), chunk_index=False)
+        db.add_papers([long_paper])
+
+        assert db.chunk_collection is None
+        assert db.get_stats()["total_passages"] == 0
+        assert "passage" not in db.search("zebrafish", n_results=1)[0]
+
+
+    def test_passages_backfilled_for_existing_store(self, temp_db_path, long_paper):
+        """Test backfilling an existing store chunks stored papers, once."""
+        db = VectorDatabase(storage_path=str(temp_db_path), chunk_index=False)
+        db.add_papers([long_paper])
+
+        db = VectorDatabase(storage_path=str(temp_db_path), chunk_index=True)
+        assert db.get_stats()["total_passages"] == 0
+
+        assert db.backfill_passages() == 1
+        assert db.backfill_passages() == 0
+        assert db.get_stats()["total_passages"] > 1
+        passage = db.search("zebrafish cardiomyocyte regeneration", n_results=1)[0]["passage"]
+        assert "Zebrafish" in passage["text"]
+
+    def test_passages_backfilled_without_stored_text(self, temp_db_path, long_paper):
+        """Test papers without stored full text are chunked from their indexed text."""
+        db = VectorDatabase(storage_path=str(temp_db_path), chunk_index=False)
+        db.add_papers([long_paper])
+        db.text_store.clear()
+
+        db = VectorDatabase(storage_path=str(temp_db_path), chunk_index=True)
+        db.backfill_passages()
+
+        assert db.get_stats()["total_passages"] >= 1
+
 class TestPrivateHelpers:
     """Test private helper methods."""
 